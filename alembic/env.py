@@ -6,7 +6,12 @@ from alembic import context
 from app.db.database import DATABASE_URL
 from app.db.models.base import Base
 from app.db.models.base_stats import BaseStats
+from app.db.models.bouts import Bouts
+from app.db.models.derived_stats import DerivedStats
 from app.db.models.extended_stats import ExtendedStats
+from app.db.models.fighter_bout_spans import FighterBoutSpans
+from app.db.models.fighter_group_stats import FighterGroupStats
+from app.db.models.fighter_ratings import FighterRatings
 from app.db.models.fighters import Fighters
 from app.db.models.fights_results import FightsResults
 from app.db.models.users import Users
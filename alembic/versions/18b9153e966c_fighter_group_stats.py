@@ -0,0 +1,80 @@
+"""fighter group stats
+
+Revision ID: 18b9153e966c
+Revises: 5a96bc625615
+Create Date: 2026-10-18 09:14:05.627310
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "18b9153e966c"
+down_revision: Union[str, Sequence[str], None] = "5a96bc625615"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "fighter_group_stats",
+        sa.Column("dimension", sa.String(length=20), nullable=False),
+        sa.Column("group_key", sa.String(length=50), nullable=False),
+        sa.Column("fighters_count", sa.Integer(), nullable=False),
+        sa.Column("wins_sum", sa.Float(), nullable=False),
+        sa.Column("wins_count", sa.Integer(), nullable=False),
+        sa.Column("loss_sum", sa.Float(), nullable=False),
+        sa.Column("loss_count", sa.Integer(), nullable=False),
+        sa.Column("age_sum", sa.Float(), nullable=False),
+        sa.Column("age_count", sa.Integer(), nullable=False),
+        sa.Column("slpm_sum", sa.Float(), nullable=False),
+        sa.Column("slpm_count", sa.Integer(), nullable=False),
+        sa.Column("str_acc_sum", sa.Float(), nullable=False),
+        sa.Column("str_acc_count", sa.Integer(), nullable=False),
+        sa.Column("sapm_sum", sa.Float(), nullable=False),
+        sa.Column("sapm_count", sa.Integer(), nullable=False),
+        sa.Column("str_def_sum", sa.Float(), nullable=False),
+        sa.Column("str_def_count", sa.Integer(), nullable=False),
+        sa.Column("td_avg_sum", sa.Float(), nullable=False),
+        sa.Column("td_avg_count", sa.Integer(), nullable=False),
+        sa.Column("td_acc_sum", sa.Float(), nullable=False),
+        sa.Column("td_acc_count", sa.Integer(), nullable=False),
+        sa.Column("td_def_sum", sa.Float(), nullable=False),
+        sa.Column("td_def_count", sa.Integer(), nullable=False),
+        sa.Column("sub_avg_sum", sa.Float(), nullable=False),
+        sa.Column("sub_avg_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("dimension", "group_key"),
+    )
+    # fill the summary from fighters already in the database
+    op.execute(
+        "INSERT INTO fighter_group_stats "
+        "SELECT dimension, group_key, count(*),"
+        " coalesce(sum(f.wins), 0), count(f.wins),"
+        " coalesce(sum(f.loss), 0), count(f.loss),"
+        " coalesce(sum(b.age), 0), count(b.age),"
+        " coalesce(sum(e.slpm), 0), count(e.slpm),"
+        " coalesce(sum(e.str_acc), 0), count(e.str_acc),"
+        " coalesce(sum(e.sapm), 0), count(e.sapm),"
+        " coalesce(sum(e.str_def), 0), count(e.str_def),"
+        " coalesce(sum(e.td_avg), 0), count(e.td_avg),"
+        " coalesce(sum(e.td_acc), 0), count(e.td_acc),"
+        " coalesce(sum(e.td_def), 0), count(e.td_def),"
+        " coalesce(sum(e.sub_avg), 0), count(e.sub_avg) "
+        "FROM fighters f "
+        "LEFT JOIN base_stats b ON b.fighter_id = f.fighter_id "
+        "LEFT JOIN extended_stats e ON e.fighter_id = f.fighter_id "
+        "CROSS JOIN LATERAL (VALUES"
+        " ('weight_class', coalesce(f.weight_class, '')),"
+        " ('country', coalesce(f.country, ''))"
+        ") AS g(dimension, group_key) "
+        "GROUP BY dimension, group_key"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("fighter_group_stats")
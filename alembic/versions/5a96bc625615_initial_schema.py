@@ -0,0 +1,110 @@
+"""initial schema
+
+Revision ID: 5a96bc625615
+Revises:
+Create Date: 2026-10-18 09:12:41.183204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5a96bc625615"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "fighters",
+        sa.Column("fighter_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=True),
+        sa.Column("nickname", sa.String(length=50), nullable=True),
+        sa.Column("surname", sa.String(length=50), nullable=True),
+        sa.Column("country", sa.String(length=50), nullable=True),
+        sa.Column("weight_class", sa.String(length=50), nullable=True),
+        sa.Column("wins", sa.Integer(), nullable=True),
+        sa.Column("loss", sa.Integer(), nullable=True),
+        sa.Column("draw", sa.Integer(), nullable=True),
+        sa.Column("current_streak", sa.Integer(), nullable=True),
+        sa.Column("last_fight_date", sa.Date(), nullable=True),
+        sa.Column("last_updated", sa.Date(), nullable=False),
+        sa.PrimaryKeyConstraint("fighter_id"),
+        sa.UniqueConstraint("fighter_id"),
+        sa.UniqueConstraint(
+            "name", "nickname", "surname", name="uq_name_nickname_surname"
+        ),
+    )
+    op.create_table(
+        "users",
+        sa.Column("user_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("email", sa.String(length=50), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id"),
+        sa.UniqueConstraint("email"),
+        sa.UniqueConstraint("user_id"),
+    )
+    op.create_table(
+        "base_stats",
+        sa.Column("fighter_id", sa.Integer(), nullable=False),
+        sa.Column("weight", sa.Float(), nullable=True),
+        sa.Column("height", sa.Float(), nullable=True),
+        sa.Column("reach", sa.Float(), nullable=True),
+        sa.Column("age", sa.Integer(), nullable=True),
+        sa.Column("last_updated", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["fighter_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("fighter_id"),
+        sa.UniqueConstraint("fighter_id"),
+    )
+    op.create_table(
+        "extended_stats",
+        sa.Column("fighter_id", sa.Integer(), nullable=False),
+        sa.Column("stance", sa.String(length=50), nullable=True),
+        sa.Column("slpm", sa.Float(), nullable=True),
+        sa.Column("str_acc", sa.Float(), nullable=True),
+        sa.Column("sapm", sa.Float(), nullable=True),
+        sa.Column("str_def", sa.Float(), nullable=True),
+        sa.Column("td_avg", sa.Float(), nullable=True),
+        sa.Column("td_acc", sa.Float(), nullable=True),
+        sa.Column("td_def", sa.Float(), nullable=True),
+        sa.Column("sub_avg", sa.Float(), nullable=True),
+        sa.Column("last_updated", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["fighter_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("fighter_id"),
+        sa.UniqueConstraint("fighter_id"),
+    )
+    op.create_table(
+        "fights_results",
+        sa.Column("fighter_id", sa.Integer(), nullable=False),
+        sa.Column("win_by_ko_tko", sa.Integer(), nullable=True),
+        sa.Column("loss_by_ko_tko", sa.Integer(), nullable=True),
+        sa.Column("win_by_sub", sa.Integer(), nullable=True),
+        sa.Column("loss_by_sub", sa.Integer(), nullable=True),
+        sa.Column("win_by_dec", sa.Integer(), nullable=True),
+        sa.Column("loss_by_dec", sa.Integer(), nullable=True),
+        sa.Column("non_contest", sa.Integer(), nullable=True),
+        sa.Column("last_updated", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["fighter_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("fighter_id"),
+        sa.UniqueConstraint("fighter_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("fights_results")
+    op.drop_table("extended_stats")
+    op.drop_table("base_stats")
+    op.drop_table("users")
+    op.drop_table("fighters")
@@ -0,0 +1,97 @@
+"""fighter indexes
+
+Revision ID: 61200f81901a
+Revises: 18b9153e966c
+Create Date: 2026-10-18 09:31:52.904117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "61200f81901a"
+down_revision: Union[str, Sequence[str], None] = "18b9153e966c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # built concurrently so writes to large tables are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_fighters_wins",
+            "fighters",
+            ["wins"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_fighters_loss",
+            "fighters",
+            ["loss"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_fighters_weight_class_wins_loss",
+            "fighters",
+            ["weight_class", "wins", "loss"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_fighters_country_wins_loss",
+            "fighters",
+            ["country", "wins", "loss"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_fights_results_win_by_ko_tko",
+            "fights_results",
+            ["win_by_ko_tko"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_fights_results_loss_by_ko_tko",
+            "fights_results",
+            ["loss_by_ko_tko"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_fights_results_loss_by_ko_tko",
+            table_name="fights_results",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_fights_results_win_by_ko_tko",
+            table_name="fights_results",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_fighters_country_wins_loss",
+            table_name="fighters",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_fighters_weight_class_wins_loss",
+            table_name="fighters",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_fighters_loss", table_name="fighters", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_fighters_wins", table_name="fighters", postgresql_concurrently=True
+        )
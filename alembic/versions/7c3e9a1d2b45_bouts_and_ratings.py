@@ -0,0 +1,68 @@
+"""bouts and ratings
+
+Revision ID: 7c3e9a1d2b45
+Revises: 61200f81901a
+Create Date: 2026-10-18 11:02:17.418263
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e9a1d2b45"
+down_revision: Union[str, Sequence[str], None] = "61200f81901a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "bouts",
+        sa.Column("bout_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("event_date", sa.Date(), nullable=False),
+        sa.Column("fighter_id", sa.Integer(), nullable=False),
+        sa.Column("opponent_id", sa.Integer(), nullable=False),
+        sa.Column("result", sa.String(length=4), nullable=False),
+        sa.CheckConstraint(
+            "result IN ('win', 'loss', 'draw', 'nc')", name="ck_bouts_result"
+        ),
+        sa.CheckConstraint("fighter_id <> opponent_id", name="ck_bouts_opponent"),
+        sa.ForeignKeyConstraint(
+            ["fighter_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["opponent_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("bout_id"),
+    )
+    op.create_index(
+        "ix_bouts_event_date_bout_id", "bouts", ["event_date", "bout_id"], unique=False
+    )
+    op.create_table(
+        "fighter_ratings",
+        sa.Column("fighter_id", sa.Integer(), nullable=False),
+        sa.Column("rating", sa.Float(), nullable=False),
+        sa.Column("rating_deviation", sa.Float(), nullable=False),
+        sa.Column("volatility", sa.Float(), nullable=False),
+        sa.Column("bouts", sa.Integer(), nullable=False),
+        sa.Column("last_bout_date", sa.Date(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["fighter_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("fighter_id"),
+    )
+    op.create_index(
+        "ix_fighter_ratings_rating", "fighter_ratings", ["rating"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_fighter_ratings_rating", table_name="fighter_ratings")
+    op.drop_table("fighter_ratings")
+    op.drop_index("ix_bouts_event_date_bout_id", table_name="bouts")
+    op.drop_table("bouts")
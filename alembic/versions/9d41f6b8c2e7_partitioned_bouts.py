@@ -0,0 +1,146 @@
+"""partitioned bouts
+
+Revision ID: 9d41f6b8c2e7
+Revises: 7c3e9a1d2b45
+Create Date: 2026-10-18 13:26:40.552918
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9d41f6b8c2e7"
+down_revision: Union[str, Sequence[str], None] = "7c3e9a1d2b45"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # move the unpartitioned table aside, freeing the names the new one uses
+    op.drop_index("ix_bouts_event_date_bout_id", table_name="bouts")
+    op.rename_table("bouts", "bouts_unpartitioned")
+    op.execute("ALTER INDEX bouts_pkey RENAME TO bouts_unpartitioned_pkey")
+    op.execute(
+        "ALTER SEQUENCE bouts_bout_id_seq RENAME TO bouts_unpartitioned_bout_id_seq"
+    )
+
+    op.create_table(
+        "bouts",
+        sa.Column("bout_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("event_date", sa.Date(), nullable=False),
+        sa.Column("fighter_id", sa.Integer(), nullable=False),
+        sa.Column("opponent_id", sa.Integer(), nullable=False),
+        sa.Column("result", sa.String(length=4), nullable=False),
+        sa.Column("method", sa.String(length=30), nullable=True),
+        sa.Column("round", sa.Integer(), nullable=True),
+        sa.Column("time_seconds", sa.Integer(), nullable=True),
+        sa.CheckConstraint(
+            "result IN ('win', 'loss', 'draw', 'nc')", name="ck_bouts_result"
+        ),
+        sa.CheckConstraint("fighter_id <> opponent_id", name="ck_bouts_opponent"),
+        sa.ForeignKeyConstraint(
+            ["fighter_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["opponent_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("bout_id", "event_date"),
+        postgresql_partition_by="RANGE (event_date)",
+    )
+    # one partition per year already holding bouts; later ones are created on write
+    op.execute(
+        "DO $$ DECLARE year int; BEGIN "
+        "FOR year IN SELECT DISTINCT extract(year FROM event_date)::int FROM bouts_unpartitioned LOOP "
+        "EXECUTE format('CREATE TABLE bouts_%s PARTITION OF bouts FOR VALUES FROM (%L) TO (%L)', "
+        "year, make_date(year, 1, 1), make_date(year + 1, 1, 1)); "
+        "END LOOP; END $$"
+    )
+    op.execute(
+        "INSERT INTO bouts (bout_id, event_date, fighter_id, opponent_id, result) "
+        "SELECT bout_id, event_date, fighter_id, opponent_id, result FROM bouts_unpartitioned"
+    )
+    op.execute(
+        "SELECT setval('bouts_bout_id_seq', max(bout_id)) FROM bouts HAVING max(bout_id) IS NOT NULL"
+    )
+    op.drop_table("bouts_unpartitioned")
+    op.create_index(
+        "ix_bouts_event_date_bout_id", "bouts", ["event_date", "bout_id"], unique=False
+    )
+    op.create_index(
+        "ix_bouts_fighter_id_event_date",
+        "bouts",
+        ["fighter_id", "event_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_bouts_opponent_id_event_date",
+        "bouts",
+        ["opponent_id", "event_date"],
+        unique=False,
+    )
+
+    op.create_table(
+        "fighter_bout_spans",
+        sa.Column("fighter_id", sa.Integer(), nullable=False),
+        sa.Column("first_bout_date", sa.Date(), nullable=False),
+        sa.Column("last_bout_date", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["fighter_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("fighter_id"),
+    )
+    op.execute(
+        "INSERT INTO fighter_bout_spans "
+        "SELECT fighter_id, min(event_date), max(event_date) FROM ("
+        " SELECT fighter_id, event_date FROM bouts"
+        " UNION ALL SELECT opponent_id, event_date FROM bouts"
+        ") sides GROUP BY fighter_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("fighter_bout_spans")
+    op.rename_table("bouts", "bouts_partitioned")
+    op.execute(
+        "ALTER SEQUENCE bouts_bout_id_seq RENAME TO bouts_partitioned_bout_id_seq"
+    )
+    op.execute("ALTER INDEX bouts_pkey RENAME TO bouts_partitioned_pkey")
+    op.drop_index("ix_bouts_event_date_bout_id", table_name="bouts_partitioned")
+    op.drop_index("ix_bouts_fighter_id_event_date", table_name="bouts_partitioned")
+    op.drop_index("ix_bouts_opponent_id_event_date", table_name="bouts_partitioned")
+    op.create_table(
+        "bouts",
+        sa.Column("bout_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("event_date", sa.Date(), nullable=False),
+        sa.Column("fighter_id", sa.Integer(), nullable=False),
+        sa.Column("opponent_id", sa.Integer(), nullable=False),
+        sa.Column("result", sa.String(length=4), nullable=False),
+        sa.CheckConstraint(
+            "result IN ('win', 'loss', 'draw', 'nc')", name="ck_bouts_result"
+        ),
+        sa.CheckConstraint("fighter_id <> opponent_id", name="ck_bouts_opponent"),
+        sa.ForeignKeyConstraint(
+            ["fighter_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["opponent_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("bout_id"),
+    )
+    op.execute(
+        "INSERT INTO bouts (bout_id, event_date, fighter_id, opponent_id, result) "
+        "SELECT bout_id, event_date, fighter_id, opponent_id, result FROM bouts_partitioned"
+    )
+    op.execute(
+        "SELECT setval('bouts_bout_id_seq', max(bout_id)) FROM bouts HAVING max(bout_id) IS NOT NULL"
+    )
+    # dropping the parent drops every partition
+    op.drop_table("bouts_partitioned")
+    op.create_index(
+        "ix_bouts_event_date_bout_id", "bouts", ["event_date", "bout_id"], unique=False
+    )
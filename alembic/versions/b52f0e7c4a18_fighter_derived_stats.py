@@ -0,0 +1,119 @@
+"""fighter derived stats
+
+Revision ID: b52f0e7c4a18
+Revises: 9d41f6b8c2e7
+Create Date: 2026-10-18 15:02:11.384206
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b52f0e7c4a18"
+down_revision: Union[str, Sequence[str], None] = "9d41f6b8c2e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DERIVED_METRICS = ("win_percentage", "finish_rate", "striking_differential")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "fighter_derived_stats",
+        sa.Column("fighter_id", sa.Integer(), nullable=False),
+        sa.Column("win_percentage", sa.Float(), nullable=True),
+        sa.Column("finish_rate", sa.Float(), nullable=True),
+        sa.Column("striking_differential", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["fighter_id"], ["fighters.fighter_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("fighter_id"),
+    )
+    # fill from fighters already in the database, as DerivedStatsStore.rebuild does
+    op.execute(
+        "INSERT INTO fighter_derived_stats "
+        "SELECT f.fighter_id,"
+        " 100.0 * f.wins / nullif(f.wins + f.loss + coalesce(f.draw, 0), 0),"
+        " CAST(r.win_by_ko_tko + r.win_by_sub AS FLOAT) / nullif(f.wins, 0),"
+        " e.slpm - e.sapm "
+        "FROM fighters f "
+        "LEFT JOIN extended_stats e ON e.fighter_id = f.fighter_id "
+        "LEFT JOIN fights_results r ON r.fighter_id = f.fighter_id"
+    )
+    op.create_index(
+        "ix_fighter_derived_stats_win_percentage",
+        "fighter_derived_stats",
+        ["win_percentage"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_fighter_derived_stats_finish_rate",
+        "fighter_derived_stats",
+        ["finish_rate"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_fighter_derived_stats_striking_differential",
+        "fighter_derived_stats",
+        ["striking_differential"],
+        unique=False,
+    )
+
+    for metric in DERIVED_METRICS:
+        op.add_column(
+            "fighter_group_stats",
+            sa.Column(f"{metric}_sum", sa.Float(), nullable=False, server_default="0"),
+        )
+        op.add_column(
+            "fighter_group_stats",
+            sa.Column(
+                f"{metric}_count", sa.Integer(), nullable=False, server_default="0"
+            ),
+        )
+    # add the derived metrics of existing fighters to their groups
+    op.execute(
+        "UPDATE fighter_group_stats s SET "
+        + ", ".join(
+            f"{metric}_sum = g.{metric}_sum, {metric}_count = g.{metric}_count"
+            for metric in DERIVED_METRICS
+        )
+        + " FROM (SELECT dimension, group_key, "
+        + ", ".join(
+            f"coalesce(sum(d.{metric}), 0) AS {metric}_sum,"
+            f" count(d.{metric}) AS {metric}_count"
+            for metric in DERIVED_METRICS
+        )
+        + " FROM fighters f "
+        "JOIN fighter_derived_stats d ON d.fighter_id = f.fighter_id "
+        "CROSS JOIN LATERAL (VALUES"
+        " ('weight_class', coalesce(f.weight_class, '')),"
+        " ('country', coalesce(f.country, ''))"
+        ") AS v(dimension, group_key) "
+        "GROUP BY dimension, group_key) g "
+        "WHERE s.dimension = g.dimension AND s.group_key = g.group_key"
+    )
+    for metric in DERIVED_METRICS:
+        op.alter_column("fighter_group_stats", f"{metric}_sum", server_default=None)
+        op.alter_column("fighter_group_stats", f"{metric}_count", server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for metric in reversed(DERIVED_METRICS):
+        op.drop_column("fighter_group_stats", f"{metric}_count")
+        op.drop_column("fighter_group_stats", f"{metric}_sum")
+    op.drop_index(
+        "ix_fighter_derived_stats_striking_differential",
+        table_name="fighter_derived_stats",
+    )
+    op.drop_index(
+        "ix_fighter_derived_stats_finish_rate", table_name="fighter_derived_stats"
+    )
+    op.drop_index(
+        "ix_fighter_derived_stats_win_percentage", table_name="fighter_derived_stats"
+    )
+    op.drop_table("fighter_derived_stats")
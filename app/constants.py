@@ -1,4 +1,5 @@
 from app.db.models.base_stats import BaseStats
+from app.db.models.derived_stats import DerivedStats
 from app.db.models.extended_stats import ExtendedStats
 from app.db.models.fighters import Fighters
 from app.db.models.fights_results import FightsResults
@@ -14,4 +15,15 @@ version = "v1"
 
 PREFIX = f"/api/{version}"
 
-MODELS_LIST = [Fighters, BaseStats, ExtendedStats, FightsResults]
+MODELS_LIST = [Fighters, BaseStats, ExtendedStats, FightsResults, DerivedStats]
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+STREAM_CHUNK_SIZE = 500
+MAX_PREDICTION_PAIRS = 10_000
+DEFAULT_SIMULATION_TRIALS = 100_000
+MAX_SIMULATION_TRIALS = 10_000_000
+MAX_BRACKET_SIZE = 64
+MAX_CARD_BOUTS = 30
+DEFAULT_SIMILAR_FIGHTERS = 10
+MAX_SIMILAR_FIGHTERS = 100
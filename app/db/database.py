@@ -1,14 +1,207 @@
+import bisect
 import os
+import time
+import typing
 from typing import AsyncGenerator
 
 from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 load_dotenv()
 
 DATABASE_URL: str = os.getenv("DATABASE_URL")
 
-engine = create_async_engine(DATABASE_URL)
+# Connections kept open per worker process, and extra ones opened under load.
+DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# Connection budget shared by all workers of the app (e.g. PostgreSQL
+# max_connections minus what other clients need); 0 leaves the pool as set above.
+DB_MAX_CONNECTIONS: int = int(os.getenv("DB_MAX_CONNECTIONS", "0"))
+# Worker processes per app instance; also read by uvicorn as its --workers default.
+WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+# Seconds a checkout waits for a free connection before failing.
+DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Connections older than this many seconds are replaced; -1 disables recycling.
+DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# Prepared statements cached per connection by asyncpg; 0 is required behind
+# PgBouncer in transaction pooling mode.
+DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
+# Upper bounds of the checkout wait histogram buckets, in milliseconds.
+WAIT_BUCKETS_MS = (1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0)
+
+
+def pool_limits(
+    pool_size: int = DB_POOL_SIZE,
+    max_overflow: int = DB_MAX_OVERFLOW,
+    max_connections: int = DB_MAX_CONNECTIONS,
+    workers: int = WEB_CONCURRENCY,
+) -> typing.Tuple[int, int]:
+    """
+    Size one worker's pool so all workers together stay within the budget.
+
+    Args:
+        pool_size (int): Requested persistent connections per worker.
+        max_overflow (int): Requested extra connections per worker.
+        max_connections (int): Connections allowed for all workers, 0 for no limit.
+        workers (int): Number of worker processes.
+
+    Returns:
+        tuple: (pool size, max overflow) for this worker.
+    """
+    if max_connections <= 0:
+        return pool_size, max_overflow
+    budget = max(1, max_connections // max(1, workers))
+    size = min(pool_size, budget)
+    return size, min(max_overflow, budget - size)
+
+
+class PoolStats:
+    """
+    Counters describing connection pool usage.
+
+    Attributes:
+        checkouts (int): Connections handed out.
+        timeouts (int): Checkouts that failed after DB_POOL_TIMEOUT.
+        connects (int): Connections opened.
+        invalidations (int): Connections discarded, e.g. failing the pre-ping.
+        peak_in_use (int): Most connections checked out at once.
+        wait_total_ms (float): Sum of the checkout waits.
+        max_wait_ms (float): Longest checkout wait.
+        waits (list[int]): Number of checkouts per WAIT_BUCKETS_MS bucket, plus
+            one for longer waits.
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.peak_in_use = 0
+        self.wait_total_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.waits = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_wait(self, wait_ms: float) -> None:
+        """
+        Record the time one checkout took.
+
+        Args:
+            wait_ms (float): Time spent acquiring the connection, in milliseconds.
+        """
+        self.wait_total_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.waits[bisect.bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool timing every checkout into `pool_stats`."""
+
+    def _do_get(self):
+        """Acquire a connection, recording the wait (opening one included)."""
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        finally:
+            pool_stats.record_wait((time.perf_counter() - start) * 1000)
+
+
+def _connect_args(url: str) -> typing.Dict[str, typing.Any]:
+    """Return driver options for the database URL."""
+    if make_url(url).get_driver_name() != "asyncpg":
+        return {}
+    return {
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+    }
+
+
+POOL_SIZE, MAX_OVERFLOW = pool_limits()
+
+engine = create_async_engine(
+    DATABASE_URL,
+    poolclass=InstrumentedPool,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    connect_args=_connect_args(DATABASE_URL),
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record) -> None:
+    """Count opened connections."""
+    pool_stats.connects += 1
+
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    """Count checkouts and track the peak number of connections in use."""
+    pool_stats.checkouts += 1
+    pool_stats.peak_in_use = max(pool_stats.peak_in_use, engine.pool.checkedout())
+
+
+@event.listens_for(engine.sync_engine, "invalidate")
+def _on_invalidate(dbapi_connection, connection_record, exception) -> None:
+    """Count discarded connections."""
+    pool_stats.invalidations += 1
+
+
+def get_pool_stats() -> typing.Dict[str, typing.Any]:
+    """
+    Return this worker's pool settings, current usage and checkout counters.
+
+    Returns:
+        Dict[str, Any]: Pool configuration, connections in use, idle and in
+        overflow, and checkout wait statistics.
+    """
+    pool = engine.pool
+    stats = pool_stats
+    return {
+        "pool_size": POOL_SIZE,
+        "max_overflow": MAX_OVERFLOW,
+        "timeout_seconds": DB_POOL_TIMEOUT,
+        "recycle_seconds": DB_POOL_RECYCLE,
+        "pre_ping": DB_POOL_PRE_PING,
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "in_use": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # negative while fewer than pool_size connections have been opened
+        "overflow": pool.overflow(),
+        "peak_in_use": stats.peak_in_use,
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "connects": stats.connects,
+        "invalidations": stats.invalidations,
+        "mean_wait_ms": (
+            round(stats.wait_total_ms / sum(stats.waits), 3)
+            if any(stats.waits)
+            else None
+        ),
+        "max_wait_ms": round(stats.max_wait_ms, 3),
+        "wait_buckets_ms": {
+            **{
+                f"<={bound:g}": count
+                for bound, count in zip(WAIT_BUCKETS_MS, stats.waits)
+            },
+            f">{WAIT_BUCKETS_MS[-1]:g}": stats.waits[-1],
+        },
+    }
+
 
 SessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -16,11 +209,13 @@ SessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=engine
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Provide a database session for dependency injection.
 
+    Sessions are cheap: a pooled connection is only checked out at the
+    session's first query and returned when it closes. FastAPI resolves the
+    dependency once per request, so all endpoints and services of a request
+    share the session.
+
     Yields:
         AsyncSession: An active SQLAlchemy async session.
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        await db.close()
@@ -1,7 +1,23 @@
 from .base import Base
 from .base_stats import BaseStats
+from .bouts import Bouts
+from .derived_stats import DerivedStats
 from .extended_stats import ExtendedStats
+from .fighter_bout_spans import FighterBoutSpans
+from .fighter_group_stats import FighterGroupStats
+from .fighter_ratings import FighterRatings
 from .fighters import Fighters
 from .fights_results import FightsResults
 
-__all__ = ["BaseStats", "Fighters", "ExtendedStats", "FightsResults", "Base"]
+__all__ = [
+    "BaseStats",
+    "Fighters",
+    "ExtendedStats",
+    "FightsResults",
+    "FighterGroupStats",
+    "Bouts",
+    "FighterRatings",
+    "FighterBoutSpans",
+    "DerivedStats",
+    "Base",
+]
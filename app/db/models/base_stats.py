@@ -36,7 +36,9 @@ class BaseStats(Base):
     height: Mapped[float] = mapped_column(Float, nullable=True)
     reach: Mapped[float] = mapped_column(Float, nullable=True)
     age: Mapped[int] = mapped_column(Integer, nullable=True)
-    last_updated: Mapped[Date] = mapped_column(Date, default=func.now())
+    last_updated: Mapped[Date] = mapped_column(
+        Date, default=func.now(), onupdate=func.now()
+    )
 
     # relationships
     fighter: Mapped["Fighters"] = relationship(
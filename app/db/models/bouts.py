@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from sqlalchemy import CheckConstraint, Date, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+BOUT_RESULTS = ("win", "loss", "draw", "nc")
+
+
+class Bouts(Base):
+    """A single fight between two fighters, stored once.
+    The table is range-partitioned by event_date with one partition per year
+    (`bouts_<year>`), created on demand when bouts are written.
+    Attributes:
+        bout_id (int): Auto-incremented ID of the bout; primary key with event_date.
+        event_date (date): Date of the event the bout took place at; partition key.
+        fighter_id (int): Foreign key to Fighters.fighter_id.
+        opponent_id (int): Foreign key to Fighters.fighter_id.
+        result (str): Outcome for `fighter_id`: "win", "loss", "draw" or "nc" (no contest).
+        method (str): How the bout ended, e.g. "KO/TKO", "SUB" or "DEC".
+        round (int): Round the bout ended in.
+        time_seconds (int): Time elapsed in the final round, in seconds.
+    """
+
+    __tablename__ = "bouts"
+    bout_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, nullable=False, autoincrement=True
+    )
+    event_date: Mapped[Date] = mapped_column(Date, primary_key=True, nullable=False)
+    fighter_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("fighters.fighter_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    opponent_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("fighters.fighter_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    result: Mapped[str] = mapped_column(String(4), nullable=False)
+    method: Mapped[str] = mapped_column(String(30), nullable=True)
+    round: Mapped[int] = mapped_column(Integer, nullable=True)
+    time_seconds: Mapped[int] = mapped_column(Integer, nullable=True)
+
+    __table_args__ = (
+        CheckConstraint(
+            "result IN ('win', 'loss', 'draw', 'nc')", name="ck_bouts_result"
+        ),
+        CheckConstraint("fighter_id <> opponent_id", name="ck_bouts_opponent"),
+        # date range queries and rating replay order
+        Index("ix_bouts_event_date_bout_id", "event_date", "bout_id"),
+        # fights of a fighter, on either side of the bout
+        Index("ix_bouts_fighter_id_event_date", "fighter_id", "event_date"),
+        Index("ix_bouts_opponent_id_event_date", "opponent_id", "event_date"),
+        {"postgresql_partition_by": "RANGE (event_date)"},
+    )
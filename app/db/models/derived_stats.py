@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from sqlalchemy import Float, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class DerivedStats(Base):
+    """Statistics derived from a fighter's record and stats.
+    Written by `DerivedStatsStore` in the same transaction as every fighter
+    write, so rankings and aggregates on these metrics read an indexed
+    column instead of computing the ratio per row.
+    Attributes:
+        fighter_id (int): Primary key and foreign key to Fighters.fighter_id.
+        win_percentage (float): Wins over wins, losses and draws, in percent.
+        finish_rate (float): Share of wins by KO/TKO or submission (0 to 1).
+        striking_differential (float): Significant strikes landed minus absorbed per minute.
+    """
+
+    __tablename__ = "fighter_derived_stats"
+    fighter_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("fighters.fighter_id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    win_percentage: Mapped[float] = mapped_column(Float, nullable=True)
+    finish_rate: Mapped[float] = mapped_column(Float, nullable=True)
+    striking_differential: Mapped[float] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (
+        # /top rankings on derived metrics
+        Index("ix_fighter_derived_stats_win_percentage", "win_percentage"),
+        Index("ix_fighter_derived_stats_finish_rate", "finish_rate"),
+        Index(
+            "ix_fighter_derived_stats_striking_differential", "striking_differential"
+        ),
+    )
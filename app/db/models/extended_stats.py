@@ -48,7 +48,9 @@ class ExtendedStats(Base):
     td_acc: Mapped[float] = mapped_column(Float, nullable=True)
     td_def: Mapped[float] = mapped_column(Float, nullable=True)
     sub_avg: Mapped[float] = mapped_column(Float, nullable=True)
-    last_updated: Mapped[Date] = mapped_column(Date, default=func.now())
+    last_updated: Mapped[Date] = mapped_column(
+        Date, default=func.now(), onupdate=func.now()
+    )
 
     # relationships
     fighter: Mapped["Fighters"] = relationship(
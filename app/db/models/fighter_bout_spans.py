@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class FighterBoutSpans(Base):
+    """First and last bout date of every fighter with bouts.
+    Bounds a fighter's history query by date, so only the bouts partitions
+    covering the fighter's career are scanned.
+    Attributes:
+        fighter_id (int): Primary key and foreign key to Fighters.fighter_id.
+        first_bout_date (date): Date of the fighter's earliest bout.
+        last_bout_date (date): Date of the fighter's latest bout.
+    """
+
+    __tablename__ = "fighter_bout_spans"
+    fighter_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("fighters.fighter_id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    first_bout_date: Mapped[Date] = mapped_column(Date, nullable=False)
+    last_bout_date: Mapped[Date] = mapped_column(Date, nullable=False)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from sqlalchemy import Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class FighterGroupStats(Base):
+    """Running aggregates of fighter statistics per weight class and per country.
+    Maintained incrementally on every fighter write, so grouped statistics are
+    read from one row per group instead of scanning all fighters.
+    Attributes:
+        dimension (str): Grouping column, either "weight_class" or "country".
+        group_key (str): Value of the grouping column ("" for fighters without one).
+        fighters_count (int): Number of fighters in the group.
+        <metric>_sum (float): Sum of the metric over fighters where it is set.
+        <metric>_count (int): Number of fighters in the group where the metric is set.
+    """
+
+    __tablename__ = "fighter_group_stats"
+    dimension: Mapped[str] = mapped_column(String(20), primary_key=True)
+    group_key: Mapped[str] = mapped_column(String(50), primary_key=True)
+    fighters_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Fighters
+    wins_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    wins_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    loss_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    loss_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # BaseStats
+    age_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    age_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # ExtendedStats
+    slpm_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    slpm_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    str_acc_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    str_acc_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sapm_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    sapm_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    str_def_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    str_def_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    td_avg_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    td_avg_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    td_acc_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    td_acc_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    td_def_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    td_def_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sub_avg_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    sub_avg_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # DerivedStats
+    win_percentage_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    win_percentage_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    finish_rate_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    finish_rate_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    striking_differential_sum: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0
+    )
+    striking_differential_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
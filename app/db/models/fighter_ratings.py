@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class FighterRatings(Base):
+    """Glicko-2 rating of a fighter, updated after each rated bout.
+    Fighters without a row have not had a rated bout yet and hold the
+    default rating.
+    Attributes:
+        fighter_id (int): Primary key and foreign key to Fighters.fighter_id.
+        rating (float): Rating on the Glicko scale (1500 for a new fighter).
+        rating_deviation (float): Uncertainty of the rating.
+        volatility (float): Expected fluctuation of the rating.
+        bouts (int): Number of rated bouts.
+        last_bout_date (date): Date of the last rated bout.
+    """
+
+    __tablename__ = "fighter_ratings"
+    fighter_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("fighters.fighter_id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    rating: Mapped[float] = mapped_column(Float, nullable=False)
+    rating_deviation: Mapped[float] = mapped_column(Float, nullable=False)
+    volatility: Mapped[float] = mapped_column(Float, nullable=False)
+    bouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_bout_date: Mapped[Date] = mapped_column(Date, nullable=True)
+
+    __table_args__ = (
+        # rating leaderboards walk this index instead of sorting
+        Index("ix_fighter_ratings_rating", "rating"),
+    )
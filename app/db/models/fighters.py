@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import typing
 
-from sqlalchemy import Date, Integer, String, UniqueConstraint
+from sqlalchemy import Date, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -45,7 +45,9 @@ class Fighters(Base):
     draw: Mapped[int] = mapped_column(Integer, nullable=True)
     current_streak: Mapped[int] = mapped_column(Integer, nullable=True)
     last_fight_date: Mapped[Date] = mapped_column(Date, nullable=True)
-    last_updated: Mapped[Date] = mapped_column(Date, default=func.now())
+    last_updated: Mapped[Date] = mapped_column(
+        Date, default=func.now(), onupdate=func.now()
+    )
 
     # relationships
     base_stats: Mapped["BaseStats"] = relationship(
@@ -62,4 +64,10 @@ class Fighters(Base):
         UniqueConstraint(
             "name", "nickname", "surname", name="uq_name_nickname_surname"
         ),
+        # /top rankings
+        Index("ix_fighters_wins", "wins"),
+        Index("ix_fighters_loss", "loss"),
+        # weight class / country filters, grouped stats and per-class rankings
+        Index("ix_fighters_weight_class_wins_loss", "weight_class", "wins", "loss"),
+        Index("ix_fighters_country_wins_loss", "country", "wins", "loss"),
     )
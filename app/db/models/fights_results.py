@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import typing
 
-from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy import Date, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -42,9 +42,16 @@ class FightsResults(Base):
     win_by_dec: Mapped[int] = mapped_column(Integer, nullable=True)
     loss_by_dec: Mapped[int] = mapped_column(Integer, nullable=True)
     non_contest: Mapped[int] = mapped_column(Integer, nullable=True)
-    last_updated: Mapped[Date] = mapped_column(Date, default=func.now())
+    last_updated: Mapped[Date] = mapped_column(
+        Date, default=func.now(), onupdate=func.now()
+    )
 
     # relationships
     fighter: Mapped["Fighters"] = relationship(
         back_populates="fights_results", uselist=False
     )
+
+    __table_args__ = (
+        Index("ix_fights_results_win_by_ko_tko", "win_by_ko_tko"),
+        Index("ix_fights_results_loss_by_ko_tko", "loss_by_ko_tko"),
+    )
@@ -0,0 +1,264 @@
+import os
+import time
+import typing
+from collections import OrderedDict
+
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+
+load_dotenv()
+
+REDIS_URL: str | None = os.getenv("REDIS_URL")
+REDIS_MAX_MEMORY_KEYS: int = int(os.getenv("REDIS_MAX_MEMORY_KEYS", "10000"))
+
+
+class InMemoryRedis:
+    """
+    In-process stand-in for the subset of the `redis.asyncio` API used by the app.
+
+    Used when REDIS_URL is not configured (local runs, tests). Keys are kept in
+    LRU order and once `max_keys` is reached the least recently used key with a
+    TTL is evicted, mirroring a `volatile-lru` Redis policy, so persistent keys
+    such as leaderboards are only evicted when nothing else is left.
+
+    Attributes:
+        max_keys (int): Maximum number of keys held before evicting.
+        evictions (int): Number of keys evicted so far.
+    """
+
+    def __init__(self, max_keys: int = REDIS_MAX_MEMORY_KEYS) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            max_keys (int): Maximum number of keys held before evicting.
+        """
+        self.max_keys = max_keys
+        self.evictions = 0
+        self._data: "OrderedDict[str, typing.Any]" = OrderedDict()
+        self._expires: typing.Dict[str, float] = {}
+
+    def _alive(self, key: str) -> bool:
+        """
+        Check whether a key exists, dropping it first if its TTL has passed.
+
+        Args:
+            key (str): Key name.
+
+        Returns:
+            bool: True if the key exists and has not expired.
+        """
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        if key in self._data:
+            self._data.move_to_end(key)
+            return True
+        return False
+
+    def _store(self, key: str, value: typing.Any) -> None:
+        """
+        Store a value, evicting least recently used keys when full.
+
+        Args:
+            key (str): Key name.
+            value (Any): Value to store.
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_keys:
+            evicted = next(
+                (name for name in self._data if name in self._expires),
+                next(iter(self._data)),
+            )
+            self._data.pop(evicted)
+            self._expires.pop(evicted, None)
+            self.evictions += 1
+
+    async def get(self, key: str) -> str | None:
+        """Return the string stored at `key`, or None."""
+        return self._data[key] if self._alive(key) else None
+
+    async def set(
+        self, key: str, value: str, ex: int | None = None, nx: bool = False
+    ) -> bool | None:
+        """Store a string at `key` with an optional TTL in seconds; with `nx`,
+        only if `key` does not exist (None is returned otherwise)."""
+        if nx and self._alive(key):
+            return None
+        self._store(key, value)
+        if ex is not None:
+            self._expires[key] = time.monotonic() + ex
+        else:
+            self._expires.pop(key, None)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        """Delete keys and return how many existed."""
+        removed = 0
+        for key in keys:
+            if self._alive(key):
+                removed += 1
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return removed
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        """Set a TTL on an existing key."""
+        if not self._alive(key):
+            return False
+        self._expires[key] = time.monotonic() + seconds
+        return True
+
+    async def sadd(self, key: str, *members: str) -> int:
+        """Add members to the set at `key` and return how many were new."""
+        current = self._data[key] if self._alive(key) else set()
+        added = len(set(members) - current)
+        self._store(key, current | set(members))
+        return added
+
+    async def smembers(self, key: str) -> typing.Set[str]:
+        """Return all members of the set at `key`."""
+        return set(self._data[key]) if self._alive(key) else set()
+
+    async def exists(self, *keys: str) -> int:
+        """Return how many of the given keys exist."""
+        return sum(self._alive(key) for key in keys)
+
+    async def rename(self, src: str, dst: str) -> bool:
+        """Rename `src` to `dst`, replacing `dst` if it exists."""
+        if not self._alive(src):
+            raise KeyError(src)
+        value = self._data.pop(src)
+        expires_at = self._expires.pop(src, None)
+        self._expires.pop(dst, None)
+        self._store(dst, value)
+        if expires_at is not None:
+            self._expires[dst] = expires_at
+        return True
+
+    async def zadd(self, key: str, mapping: typing.Mapping[str, float]) -> int:
+        """Add members with scores to the sorted set at `key`, returning how many were new."""
+        current = self._data[key] if self._alive(key) else {}
+        added = len(set(mapping) - set(current))
+        self._store(key, {**current, **{m: float(s) for m, s in mapping.items()}})
+        return added
+
+    async def zrem(self, key: str, *members: str) -> int:
+        """Remove members from the sorted set at `key` and return how many existed."""
+        if not self._alive(key):
+            return 0
+        current = self._data[key]
+        removed = sum(current.pop(member, None) is not None for member in members)
+        if not current:
+            await self.delete(key)
+        return removed
+
+    async def zcard(self, key: str) -> int:
+        """Return the number of members of the sorted set at `key`."""
+        return len(self._data[key]) if self._alive(key) else 0
+
+    async def zrange(
+        self,
+        key: str,
+        start: int,
+        end: int,
+        desc: bool = False,
+        withscores: bool = False,
+    ) -> typing.List[typing.Any]:
+        """Return members of the sorted set at `key` by rank, ties ordered by member."""
+        if not self._alive(key):
+            return []
+        ordered = sorted(
+            self._data[key].items(), key=lambda item: (item[1], item[0]), reverse=desc
+        )
+        stop = None if end == -1 else end + 1
+        selected = ordered[start:stop]
+        return selected if withscores else [member for member, _ in selected]
+
+    def pipeline(self, transaction: bool = True) -> "InMemoryPipeline":
+        """Return a pipeline buffering commands until `execute`."""
+        return InMemoryPipeline(self)
+
+    async def info(self, section: str | None = None) -> typing.Dict[str, typing.Any]:
+        """Return a minimal INFO-like mapping with eviction and key counters."""
+        return {"evicted_keys": self.evictions, "keys": len(self._data)}
+
+    async def flushdb(self) -> bool:
+        """Remove every key."""
+        self._data.clear()
+        self._expires.clear()
+        return True
+
+
+class InMemoryPipeline:
+    """
+    Minimal pipeline for `InMemoryRedis`: buffers commands and runs them in order.
+    """
+
+    def __init__(self, client: InMemoryRedis) -> None:
+        """
+        Initialize an empty pipeline.
+
+        Args:
+            client (InMemoryRedis): Store the commands are executed against.
+        """
+        self._client = client
+        self._commands: typing.List[typing.Tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str) -> typing.Callable[..., "InMemoryPipeline"]:
+        """Buffer a call to the store method `name`."""
+        getattr(self._client, name)
+
+        def buffer(*args, **kwargs) -> "InMemoryPipeline":
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return buffer
+
+    async def execute(self) -> typing.List[typing.Any]:
+        """Run the buffered commands and return their results."""
+        commands, self._commands = self._commands, []
+        return [
+            await getattr(self._client, name)(*args, **kwargs)
+            for name, args, kwargs in commands
+        ]
+
+    async def __aenter__(self) -> "InMemoryPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._commands = []
+
+
+_client: aioredis.Redis | InMemoryRedis | None = None
+
+
+def get_redis() -> aioredis.Redis | InMemoryRedis:
+    """
+    Return the shared Redis client, falling back to an in-process store.
+
+    Returns:
+        Redis | InMemoryRedis: Client connected to REDIS_URL, or an in-memory
+        store when REDIS_URL is not configured.
+    """
+    global _client
+    if _client is None:
+        _client = (
+            aioredis.from_url(REDIS_URL, decode_responses=True)
+            if REDIS_URL
+            else InMemoryRedis()
+        )
+    return _client
+
+
+def set_redis(client: aioredis.Redis | InMemoryRedis | None) -> None:
+    """
+    Replace the shared client, e.g. with an `InMemoryRedis` in tests.
+
+    Args:
+        client (Redis | InMemoryRedis | None): New client, or None to recreate it lazily.
+    """
+    global _client
+    _client = client
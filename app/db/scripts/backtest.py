@@ -0,0 +1,111 @@
+import argparse
+import asyncio
+import json
+import time
+from datetime import date
+from pathlib import Path
+
+from app.db.database import get_db
+from app.services.predictions.backtester import (
+    BACKTEST_WORKERS,
+    MIN_TRAINING_BOUTS,
+    Backtester,
+    load_backtest_data,
+)
+from app.services.predictions.feature_matrix import FeatureMatrix
+from app.services.predictions.logistic_fit import (
+    DEFAULT_EPOCHS,
+    DEFAULT_L2,
+    DEFAULT_LEARNING_RATE,
+)
+from app.services.predictions.logistic_model import LogisticModel
+from app.services.predictions.model_artifacts import (
+    MODEL_DIR,
+    ModelArtifactStore,
+    load_metadata,
+)
+from app.tools.logger import logger
+
+
+async def main(
+    since: date | None = None,
+    workers: int = BACKTEST_WORKERS,
+    model_dir: Path = MODEL_DIR,
+    output: Path | None = None,
+    min_training_bouts: int = MIN_TRAINING_BOUTS,
+) -> None:
+    """Replay the bout history walk-forward with the served model's features.
+
+    A trained model is refitted before each calendar year on the earlier bouts
+    only, with the hyperparameters saved in its metadata; the default model
+    keeps its hand-set weights and only refits the standardization.
+
+    Args:
+        since (date | None): First event date scored; every bout if None.
+        workers (int): Number of worker processes.
+        model_dir (Path): Root directory of the model artifacts; the version
+            CURRENT points at is evaluated, the default model if there is none.
+        output (Path | None): File the JSON report is also written to.
+        min_training_bouts (int): Decided bouts needed before a year for it to
+            be scored.
+    """
+    start = time.perf_counter()
+    model = ModelArtifactStore(model_dir).load()
+    # a trained model's weights are refitted, the default model's are hand-set
+    learn_weights = model is not None
+    hyperparameters = (
+        load_metadata(model.version, model_dir).get("hyperparameters", {})
+        if learn_weights
+        else {}
+    )
+    async for mma_db in get_db():
+        data = await load_backtest_data(mma_db)
+        if model is None:
+            model = LogisticModel.default(await FeatureMatrix.load(mma_db))
+    logger.info(
+        f"Loaded {len(data.day)} bouts of {len(data.fighter_ids)} fighters "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+    with Backtester(data, workers) as backtester:
+        report = backtester.run(
+            model,
+            since,
+            learn_weights=learn_weights,
+            epochs=hyperparameters.get("epochs", DEFAULT_EPOCHS),
+            learning_rate=hyperparameters.get("learning_rate", DEFAULT_LEARNING_RATE),
+            l2=hyperparameters.get("l2", DEFAULT_L2),
+            min_training_bouts=min_training_bouts,
+        )
+    payload = json.dumps(report, indent=2)
+    if output is not None:
+        output.write_text(payload)
+    print(payload)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Backtest the fight outcome model on the bout history, "
+        "features and parameters using only what was known before each bout."
+    )
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        default=None,
+        help="first event date to score (YYYY-MM-DD); earlier bouts only build "
+        "records and the training history",
+    )
+    parser.add_argument("--min-training-bouts", type=int, default=MIN_TRAINING_BOUTS)
+    parser.add_argument("--workers", type=int, default=BACKTEST_WORKERS)
+    parser.add_argument("--model-dir", type=Path, default=MODEL_DIR)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            args.since,
+            args.workers,
+            args.model_dir,
+            args.output,
+            args.min_training_bouts,
+        )
+    )
@@ -0,0 +1,38 @@
+import argparse
+import asyncio
+
+from app.db.database import get_db
+from app.services.predictions.matchup_matrix import (
+    MATCHUP_MATRIX_DIR,
+    MatchupMatrixBuilder,
+)
+from app.tools.logger import logger
+
+
+async def main(full: bool = False) -> None:
+    """Build or refresh the matchup matrix of every weight class.
+
+    Args:
+        full (bool): Recompute every entry instead of only changed fighters.
+    """
+    async for mma_db in get_db():
+        recomputed = await MatchupMatrixBuilder(mma_db).build(full)
+    logger.info(
+        f"Matchup matrices written to {MATCHUP_MATRIX_DIR}: "
+        f"{len(recomputed)} weight classes, "
+        f"{sum(recomputed.values())} rows recomputed."
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Precompute the win probability of every pair of fighters "
+        "sharing a weight class."
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="recompute every matrix instead of only fighters changed since the last build",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.full))
@@ -0,0 +1,285 @@
+import argparse
+import asyncio
+import json
+import sys
+import typing
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_db
+from app.db.models.fighters import Fighters
+from app.services.fighters.fighter_group_stats import GROUP_DIMENSIONS, SUMMARY_METRICS
+from app.services.fighters.fighter_leaderboard import RANKABLE_COLUMNS
+from app.services.fighters.fighter_utils import FighterUtils
+from app.tools.exceptions.custom_api_exceptions import NotFoundException
+from app.tools.logger import logger
+
+DEFAULT_MIN_ROWS = 10_000
+
+# Sample arguments; only the shape of the generated statements matters.
+SAMPLE_ID = 1
+SAMPLE_IDS = [1, 2, 3]
+SAMPLE_COUNTRY = "Poland"
+SAMPLE_WEIGHT_CLASS = "Lightweight"
+SAMPLE_LIMIT = 10
+
+Call = typing.Callable[[FighterUtils], typing.Awaitable[typing.Any]]
+
+
+class _EmptyResult:
+    """Result returned by `StatementRecorder`: behaves like a query with no rows."""
+
+    def scalars(self) -> "_EmptyResult":
+        return self
+
+    def mappings(self) -> "_EmptyResult":
+        return self
+
+    def all(self) -> list:
+        return []
+
+
+class StatementRecorder:
+    """Session stand-in capturing the statements `FighterUtils` builds instead of running them.
+
+    Attributes:
+        statements (list): Statements passed to `execute`, in call order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.statements: typing.List[typing.Any] = []
+
+    async def execute(self, stmt: typing.Any, *args, **kwargs) -> _EmptyResult:
+        """Record a statement and return an empty result."""
+        self.statements.append(stmt)
+        return _EmptyResult()
+
+
+def build_catalog() -> typing.List[typing.Tuple[str, bool, Call]]:
+    """List every query `FighterUtils` can issue, with sample arguments.
+
+    Returns:
+        List[Tuple[str, bool, Call]]: (label, extended mode, call building the statement)
+    """
+    catalog = []
+    for extended in (False, True):
+        mode = "extended" if extended else "base"
+        catalog.extend(
+            [
+                (
+                    f"{mode} by id",
+                    extended,
+                    lambda u: u._get_records_by_single_value("fighter_id", SAMPLE_ID),
+                ),
+                (
+                    f"{mode} by country",
+                    extended,
+                    lambda u: u._get_records_by_single_value("country", SAMPLE_COUNTRY),
+                ),
+                (
+                    f"{mode} by weight class",
+                    extended,
+                    lambda u: u._get_records_by_single_value(
+                        "weight_class", SAMPLE_WEIGHT_CLASS
+                    ),
+                ),
+                (
+                    f"{mode} by name",
+                    extended,
+                    lambda u: u.get_fighter_by_name_nickname_surname("a", "b", "c"),
+                ),
+                (
+                    f"{mode} page",
+                    extended,
+                    lambda u: u._get_records_page([], SAMPLE_ID, SAMPLE_LIMIT),
+                ),
+                (
+                    f"{mode} by ids",
+                    extended,
+                    lambda u: u._get_records_by_ids(SAMPLE_IDS),
+                ),
+            ]
+        )
+        # base endpoints only rank on Fighters columns
+        columns = (
+            RANKABLE_COLUMNS
+            if extended
+            else [c for c in RANKABLE_COLUMNS if hasattr(Fighters, c)]
+        )
+        for column in columns:
+            catalog.append(
+                (
+                    f"{mode} top {column}",
+                    extended,
+                    lambda u, c=column: u.get_fighters_by_param_with_limit(
+                        c, SAMPLE_LIMIT
+                    ),
+                )
+            )
+            catalog.append(
+                (
+                    f"{mode} top {column} in weight class",
+                    extended,
+                    lambda u, c=column: u.get_fighters_by_param_with_limit(
+                        c, SAMPLE_LIMIT, weight_class=SAMPLE_WEIGHT_CLASS
+                    ),
+                )
+            )
+
+    catalog.append(("flat records", False, lambda u: u.get_flat_records(SAMPLE_IDS)))
+    for dimension in GROUP_DIMENSIONS:
+        for metric in SUMMARY_METRICS:
+            catalog.append(
+                (
+                    f"avg {metric} per {dimension}",
+                    False,
+                    lambda u, d=dimension, m=metric: u.get_grouped_stat(d, m, func.avg),
+                )
+            )
+    return catalog
+
+
+async def record_statements() -> typing.List[typing.Tuple[str, typing.Any]]:
+    """Build the statements of every catalog entry without touching the database.
+
+    Returns:
+        List[Tuple[str, Any]]: (label, SQLAlchemy statement)
+    """
+    statements = []
+    for label, extended, call in build_catalog():
+        recorder = StatementRecorder()
+        try:
+            await call(FighterUtils(recorder, extended))
+        except NotFoundException:
+            pass
+        statements.extend((label, stmt) for stmt in recorder.statements)
+    return statements
+
+
+def _seq_scans(
+    plan: typing.Dict[str, typing.Any],
+) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """Yield every sequential scan node of an EXPLAIN plan tree.
+
+    Args:
+        plan (Dict[str, Any]): Plan node from EXPLAIN (FORMAT JSON).
+
+    Yields:
+        Dict[str, Any]: Seq Scan nodes.
+    """
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan
+    for child in plan.get("Plans", []):
+        yield from _seq_scans(child)
+
+
+async def get_table_rows(db: AsyncSession) -> typing.Dict[str, int]:
+    """Read the planner's row estimate for every table in the public schema.
+
+    Args:
+        db (AsyncSession): Active SQLAlchemy session.
+
+    Returns:
+        Dict[str, int]: Estimated row count per table (0 if never analyzed).
+    """
+    conn = await db.connection()
+    rows = await conn.exec_driver_sql(
+        "SELECT relname, greatest(reltuples, 0)::bigint FROM pg_class "
+        "WHERE relkind IN ('r', 'p') AND relnamespace = 'public'::regnamespace"
+    )
+    return dict(rows.all())
+
+
+async def explain(db: AsyncSession, stmt: typing.Any) -> typing.Dict[str, typing.Any]:
+    """Run EXPLAIN on a statement with its sample parameters inlined.
+
+    Args:
+        db (AsyncSession): Active SQLAlchemy session.
+        stmt (Any): SQLAlchemy statement.
+
+    Returns:
+        Dict[str, Any]: Root plan node.
+    """
+    sql = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    conn = await db.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+async def advise(
+    db: AsyncSession, min_rows: int
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Report sequential scans on large tables for every `FighterUtils` statement.
+
+    Args:
+        db (AsyncSession): Active SQLAlchemy session.
+        min_rows (int): Only report tables with at least this many estimated rows.
+
+    Returns:
+        List[Dict[str, Any]]: One finding per (statement, scanned table).
+    """
+    table_rows = await get_table_rows(db)
+    findings = []
+    for label, stmt in await record_statements():
+        for node in _seq_scans(await explain(db, stmt)):
+            table = node.get("Relation Name")
+            rows = table_rows.get(table, 0)
+            if rows >= min_rows:
+                findings.append(
+                    {
+                        "statement": label,
+                        "table": table,
+                        "rows": rows,
+                        "filter": node.get("Filter", ""),
+                        "sql": str(stmt.compile(dialect=postgresql.dialect())),
+                    }
+                )
+    return findings
+
+
+async def main(min_rows: int, show_sql: bool) -> int:
+    """Print the advisor report.
+
+    Args:
+        min_rows (int): Only report tables with at least this many estimated rows.
+        show_sql (bool): Also print the SQL of every flagged statement.
+
+    Returns:
+        int: Process exit code, 1 if any sequential scan was reported.
+    """
+    async for mma_db in get_db():
+        findings = await advise(mma_db, min_rows)
+
+    if not findings:
+        logger.info(f"No sequential scans on tables with {min_rows}+ rows.")
+        return 0
+
+    header = f"{'statement':<45}{'table':<18}{'rows':>12}  filter"
+    print(header)
+    print("-" * len(header))
+    for finding in findings:
+        print(
+            f"{finding['statement']:<45}{finding['table']:<18}"
+            f"{finding['rows']:>12}  {finding['filter']}"
+        )
+        if show_sql:
+            print(f"    {finding['sql']}")
+    return 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Report sequential scans in the queries FighterUtils generates."
+    )
+    parser.add_argument("--min-rows", type=int, default=DEFAULT_MIN_ROWS)
+    parser.add_argument("--show-sql", action="store_true")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.min_rows, args.show_sql)))
@@ -0,0 +1,50 @@
+import argparse
+import asyncio
+
+from app.db.database import get_db
+from app.db.scripts.seed import (
+    DEFAULT_BATCH_SIZE,
+    TableFiller,
+    batched,
+    iter_json_records,
+)
+from app.services.bouts.bout_history import BoutHistory
+from app.services.ratings.rating_engine import RatingEngine
+
+
+async def main(
+    path: str, batch_size: int = DEFAULT_BATCH_SIZE, replay: bool = False
+) -> None:
+    """Append bouts from a JSON or NDJSON file to the bouts table.
+
+    Args:
+        path (str): Data file with one record per bout (event_date, fighter_id,
+            opponent_id, result and optionally method, round, time_seconds).
+        batch_size (int): Number of records sent per COPY.
+        replay (bool): Recompute every rating afterwards.
+    """
+
+    def prepared_batches():
+        for batch in batched(iter_json_records(path), batch_size):
+            TableFiller.fix_date_columns(batch, ("event_date",))
+            yield batch
+
+    async for mma_db in get_db():
+        await BoutHistory(mma_db).ingest(prepared_batches())
+        if replay:
+            await RatingEngine(mma_db).replay()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Append bouts to the partitioned bouts table with COPY."
+    )
+    parser.add_argument("path")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="recompute every rating from the full history afterwards",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.path, args.batch_size, args.replay))
@@ -0,0 +1,14 @@
+import asyncio
+
+from app.db.database import get_db
+from app.services.ratings.rating_engine import RatingEngine
+
+
+async def main() -> None:
+    """Recompute every fighter's rating from the bout history."""
+    async for mma_db in get_db():
+        await RatingEngine(mma_db).replay()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
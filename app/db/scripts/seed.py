@@ -1,96 +1,300 @@
+import argparse
 import asyncio
 import json
+import re
+import time
 import typing
-from datetime import datetime
+from datetime import date, datetime
+from itertools import islice
 from pathlib import Path
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants import example_data_paths
 from app.db.database import get_db
+from app.services.fighters.fighter_derived_stats import DerivedStatsStore
+from app.services.fighters.fighter_group_stats import FighterGroupStatsSummary
+from app.services.fighters.fighter_leaderboard import fighter_leaderboard
 from app.services.fighters.fighter_utils import FighterUtils
 from app.tools.exceptions.custom_api_exceptions import InternalServerError
 from app.tools.logger import logger
 
 LAST_FIGHT_DATE = "last_fight_date"
 LAST_UPDATED = "last_updated"
+DATE_COLUMNS = (LAST_FIGHT_DATE, LAST_UPDATED)
+
+DEFAULT_BATCH_SIZE = 10_000
+READ_CHUNK_SIZE = 1 << 20
+
+# whitespace and separators between the elements of a JSON array
+_ARRAY_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def _iter_json_array(
+    file: typing.TextIO, chunk_size: int = READ_CHUNK_SIZE
+) -> typing.Iterator[typing.Any]:
+    """Yield the elements of a top-level JSON array without loading the whole file.
+
+    Args:
+        file (TextIO): File positioned at the opening bracket.
+        chunk_size (int): Number of characters read at a time.
+
+    Yields:
+        Any: Decoded array elements.
+
+    Raises:
+        ValueError: If the array is not terminated.
+    """
+    decoder = json.JSONDecoder()
+    buffer = file.read(chunk_size).lstrip()[1:]
+    position = 0
+    eof = False
+    while True:
+        position = _ARRAY_SEPARATORS.match(buffer, position).end()
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        if position < len(buffer):
+            try:
+                record, position = decoder.raw_decode(buffer, position)
+                yield record
+                continue
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+        elif eof:
+            raise ValueError("Unterminated JSON array")
+        # the element is incomplete, keep the unparsed tail and read more
+        chunk = file.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def iter_json_records(json_path: str) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """Stream records from a JSON array or NDJSON file.
+
+    The format is detected from the first non-blank character: `[` for a JSON
+    array, anything else for one JSON object per line.
+
+    Args:
+        json_path (str): Path to the data file.
+
+    Yields:
+        Dict[str, Any]: One record per array element or line.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+    """
+    path = Path(json_path)
+    if not path.exists():
+        raise FileNotFoundError(f"JSON file not found: {json_path}")
+
+    with path.open(encoding="utf-8") as file:
+        first = file.read(READ_CHUNK_SIZE).lstrip()[:1]
+        file.seek(0)
+        if first == "[":
+            yield from _iter_json_array(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def batched(
+    records: typing.Iterable[typing.Any], size: int
+) -> typing.Iterator[typing.List[typing.Any]]:
+    """Split an iterable into lists of at most `size` items.
+
+    Args:
+        records (Iterable[Any]): Items to split.
+        size (int): Maximum batch length.
+
+    Yields:
+        list: Consecutive batches.
+    """
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 class TableFiller:
-    """Utility class for populating database tables with initial data from JSON files."""
+    """Utility class for populating database tables with initial data from JSON files.
+
+    Records are streamed from disk in batches and written with PostgreSQL
+    COPY through the session's asyncpg connection, so memory use is bounded by
+    the batch size and the load runs in the session's transaction.
+    """
 
     @staticmethod
-    def _fill_table_from_json(
-        db: AsyncSession, table: typing.Type, json_path: str
-    ) -> None:
-        """Populate a single database table with data from a JSON file.
+    async def _fill_table_from_json(
+        db: AsyncSession,
+        table: typing.Type,
+        json_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """Populate a single database table with data from a JSON or NDJSON file.
 
         Args:
             db (AsyncSession): Active SQLAlchemy session.
             table (typing.Type): ORM model class representing the target table.
-            json_path (str): Path to the JSON file containing records.
+            json_path (str): Path to the file containing records.
+            batch_size (int): Number of records sent per COPY.
+
+        Returns:
+            int: Number of rows loaded.
 
         Raises:
             FileNotFoundError: If the specified JSON file does not exist.
         """
-        path = Path(json_path)
-        if not path.exists():
-            raise FileNotFoundError(f"JSON file not found: {json_path}")
+        logger.info(f"Updating table: {table.__name__}")
+        connection = await (await db.connection()).get_raw_connection()
+        table_columns = [column.name for column in table.__table__.columns]
+        copied_columns: typing.Set[str] = set()
+        rows = 0
+        start = time.perf_counter()
+
+        for batch in batched(iter_json_records(json_path), batch_size):
+            TableFiller.fix_date_columns(batch, DATE_COLUMNS)
+            for record in batch:
+                record.setdefault(LAST_UPDATED, date.today())
+            # columns the batch provides; the others keep their defaults
+            present = set().union(*batch)
+            columns = [column for column in table_columns if column in present]
+            await connection.driver_connection.copy_records_to_table(
+                table.__tablename__,
+                records=[
+                    tuple(record.get(column) for column in columns) for record in batch
+                ],
+                columns=columns,
+            )
+            copied_columns.update(columns)
+            rows += len(batch)
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"{table.__tablename__}: {rows} rows "
+                f"({rows / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+
+        for column in table.__table__.primary_key:
+            if column.name in copied_columns:
+                await TableFiller._sync_sequence(db, table.__tablename__, column.name)
+        return rows
+
+    @staticmethod
+    async def _sync_sequence(
+        db: AsyncSession, table_name: str, column_name: str
+    ) -> None:
+        """Move a serial column's sequence past IDs loaded explicitly.
 
-        with path.open(encoding="utf-8") as file:
-            logger.info(f"Updating table: {table.__name__}")
-            for data in json.load(file):
-                TableFiller.fix_data_column(data, LAST_FIGHT_DATE)
-                TableFiller.fix_data_column(data, LAST_UPDATED)
-                db.add(table(**data))
+        Args:
+            db (AsyncSession): Active SQLAlchemy session.
+            table_name (str): Table name.
+            column_name (str): Primary key column name.
+        """
+        await db.execute(
+            text(
+                "SELECT setval(pg_get_serial_sequence(:table, :column), "
+                f'max({column_name})) FROM "{table_name}" '
+                f"HAVING pg_get_serial_sequence(:table, :column) IS NOT NULL "
+                f"AND max({column_name}) IS NOT NULL"
+            ),
+            {"table": table_name, "column": column_name},
+        )
 
     @staticmethod
     async def fill_database_with_data(
-        db: AsyncSession, data_dict: typing.List[typing.Tuple[typing.Type, str]]
+        db: AsyncSession,
+        data_dict: (
+            typing.Mapping[typing.Type, str]
+            | typing.List[typing.Tuple[typing.Type, str]]
+        ),
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> None:
-        """Populate multiple database tables defined in the provided data mapping.
+        """Populate multiple database tables defined in the provided data mapping
+        and rebuild the derived and grouped statistics from the loaded rows.
 
         Args:
             db (AsyncSession): Active SQLAlchemy session.
-            data_dict (List[Tuple[Type, str]]): A list of tuples where each
-                contains:
-                    - ORM model class (table)
-                    - Path to the JSON file with data.
+            data_dict (Mapping[Type, str] | List[Tuple[Type, str]]): ORM model
+                classes (tables) and the paths of their data files, parents first.
+            batch_size (int): Number of records sent per COPY.
 
         Raises:
             InternalServerError: If an error occurs during database seeding.
         """
+        if isinstance(data_dict, typing.Mapping):
+            data_dict = list(data_dict.items())
         try:
+            # starts the transaction the COPYs run in; a seed can be re-run if
+            # the last commits are lost, so skip waiting for the WAL flush
+            await db.execute(text("SET LOCAL synchronous_commit TO OFF"))
+            start = time.perf_counter()
+            rows = 0
             for table, path in data_dict:
-                TableFiller._fill_table_from_json(db, table, path)
+                rows += await TableFiller._fill_table_from_json(
+                    db, table, path, batch_size
+                )
+            await DerivedStatsStore(db).rebuild()
+            await FighterGroupStatsSummary(db).rebuild()
             await db.commit()
-            logger.info("Database seeded successfully.")
+            logger.info(
+                f"Database seeded successfully: {rows} rows "
+                f"in {time.perf_counter() - start:.1f}s."
+            )
         except Exception as e:
             logger.error("An error occurred during database seeding.")
             await db.rollback()
             raise InternalServerError from e
 
     @staticmethod
-    def fix_data_column(
-        data: typing.Dict[str, typing.Any], column_name: str, _format: str = "%Y-%m-%d"
+    def fix_date_columns(
+        batch: typing.List[typing.Dict[str, typing.Any]],
+        column_names: typing.Iterable[str],
+        _format: str = "%Y-%m-%d",
     ) -> None:
-        """Convert a string date column in a dictionary to a datetime.date object.
+        """Convert string date columns of a batch of records to datetime.date objects.
+
+        Each distinct string is parsed once per batch, which matters for
+        columns like `last_updated` where most records share a few dates.
 
         Args:
-            data (Dict[str, Any]): A dictionary containing record data.
-            column_name (str): The key name for the date field.
+            batch (List[Dict[str, Any]]): Records to convert in place.
+            column_names (Iterable[str]): Keys of the date fields.
             _format (str, optional): Date format to parse. Defaults to "%Y-%m-%d".
         """
-        if column_name in data and isinstance(data[column_name], str):
-            data[column_name] = datetime.strptime(data[column_name], _format).date()
+        for column_name in column_names:
+            parsed: typing.Dict[str, date] = {}
+            for data in batch:
+                value = data.get(column_name)
+                if isinstance(value, str):
+                    if value not in parsed:
+                        parsed[value] = datetime.strptime(value, _format).date()
+                    data[column_name] = parsed[value]
+
 
+async def main(batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+    """Clear all tables, populate them with initial data from JSON files and
+    rebuild the leaderboards.
 
-async def main() -> None:
-    """Clear all tables and populate them with initial data from JSON files."""
+    Args:
+        batch_size (int): Number of records sent per COPY.
+    """
     async for mma_db in get_db():
         await FighterUtils(mma_db, False).clear_all_tables()
-        await TableFiller.fill_database_with_data(mma_db, example_data_paths)
+        await TableFiller.fill_database_with_data(
+            mma_db, example_data_paths, batch_size
+        )
+        try:
+            await fighter_leaderboard.rebuild(mma_db, force=True)
+        except Exception as e:
+            logger.warning(f"Leaderboard rebuild skipped: {e}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(
+        description="Reset the database and load the example data."
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size))
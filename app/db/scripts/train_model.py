@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from app.db.database import get_db
+from app.services.predictions.feature_matrix import FeatureMatrix
+from app.services.predictions.model_artifacts import MODEL_DIR, save_model
+from app.services.predictions.model_training import (
+    DEFAULT_EPOCHS,
+    DEFAULT_L2,
+    DEFAULT_LEARNING_RATE,
+    DEFAULT_VALIDATION_FRACTION,
+    train_model,
+)
+from app.tools.logger import logger
+
+
+async def main(
+    epochs: int = DEFAULT_EPOCHS,
+    learning_rate: float = DEFAULT_LEARNING_RATE,
+    l2: float = DEFAULT_L2,
+    validation_fraction: float = DEFAULT_VALIDATION_FRACTION,
+    seed: int = 0,
+    output: Path = MODEL_DIR,
+    activate: bool = True,
+) -> None:
+    """Train a fight outcome model on the current data and save it as an artifact.
+
+    Args:
+        epochs (int): Maximum number of gradient steps.
+        learning_rate (float): Step size.
+        l2 (float): L2 penalty on the weights.
+        validation_fraction (float): Share of fighters held out.
+        seed (int): Seed of the train/validation split.
+        output (Path): Root directory of the model artifacts.
+        activate (bool): Make the new model the one served by the API.
+    """
+    start = time.perf_counter()
+    async for mma_db in get_db():
+        matrix = await FeatureMatrix.load(mma_db)
+    logger.info(f"Loaded {len(matrix)} fighters in {time.perf_counter() - start:.1f}s")
+
+    model, metadata = train_model(
+        matrix, epochs, learning_rate, l2, validation_fraction, seed
+    )
+    path = save_model(model, metadata, output, activate)
+    logger.info(
+        f"Model {model.version} written to {path}"
+        f"{' and activated' if activate else ''}"
+    )
+    print(json.dumps(metadata, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Train the fight outcome model and write a versioned artifact."
+    )
+    parser.add_argument("--epochs", type=int, default=DEFAULT_EPOCHS)
+    parser.add_argument("--learning-rate", type=float, default=DEFAULT_LEARNING_RATE)
+    parser.add_argument("--l2", type=float, default=DEFAULT_L2)
+    parser.add_argument(
+        "--validation-fraction", type=float, default=DEFAULT_VALIDATION_FRACTION
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=MODEL_DIR)
+    parser.add_argument(
+        "--no-activate",
+        action="store_true",
+        help="save the artifact without serving it",
+    )
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            args.epochs,
+            args.learning_rate,
+            args.l2,
+            args.validation_fraction,
+            args.seed,
+            args.output,
+            not args.no_activate,
+        )
+    )
@@ -0,0 +1,144 @@
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from app.db.database import get_db
+from app.services.predictions.feature_matrix import FeatureMatrix
+from app.services.predictions.model_artifacts import MODEL_DIR, save_model
+from app.services.predictions.model_training import (
+    DEFAULT_EPOCHS,
+    DEFAULT_VALIDATION_FRACTION,
+    training_set,
+)
+from app.services.predictions.model_tuning import (
+    DEFAULT_TEST_FRACTION,
+    DEFAULT_TUNING_CANDIDATES,
+    STRATEGIES,
+    TUNING_WORKERS,
+    ModelTuner,
+)
+from app.tools.logger import logger
+
+
+async def main(
+    strategy: str = "halving",
+    candidates: int = DEFAULT_TUNING_CANDIDATES,
+    epochs: int = DEFAULT_EPOCHS,
+    validation_fraction: float = DEFAULT_VALIDATION_FRACTION,
+    seed: int = 0,
+    workers: int = TUNING_WORKERS,
+    leaderboard: Path = Path("tuning_leaderboard.json"),
+    save_best: bool = False,
+    model_dir: Path = MODEL_DIR,
+    test_fraction: float = DEFAULT_TEST_FRACTION,
+) -> None:
+    """Search hyperparameters of the fight outcome model and write a leaderboard.
+
+    Args:
+        strategy (str): "grid", "random" or "halving".
+        candidates (int): Number of random candidates.
+        epochs (int): Maximum number of gradient steps per candidate.
+        validation_fraction (float): Share of fighters used to select candidates.
+        seed (int): Seed of the train/validation/test split and random candidates.
+        workers (int): Number of worker processes.
+        leaderboard (Path): File the JSON report is written to.
+        save_best (bool): Save the best candidate as a model artifact, without
+            activating it.
+        model_dir (Path): Root directory of the model artifacts.
+        test_fraction (float): Share of fighters held out of the search.
+    """
+    start = time.perf_counter()
+    async for mma_db in get_db():
+        matrix = await FeatureMatrix.load(mma_db)
+    logger.info(f"Loaded {len(matrix)} fighters in {time.perf_counter() - start:.1f}s")
+
+    with ModelTuner(
+        training_set(matrix), validation_fraction, seed, workers, test_fraction
+    ) as tuner:
+        report, best = tuner.run(strategy, candidates, epochs)
+        leaderboard.write_text(json.dumps(report, indent=2))
+        logger.info(f"Leaderboard written to {leaderboard}")
+        # `best` is the leaderboard's first entry, so the losses saved below
+        # are the saved candidate's
+        entry = report["leaderboard"][0]
+        if save_best and entry["selection_log_loss"] is None:
+            logger.warning("Every candidate diverged, no model saved")
+        elif save_best:
+            model = tuner.model(best)
+            path = save_model(
+                model,
+                {
+                    "hyperparameters": {
+                        "epochs": best.state.best_epochs,
+                        "learning_rate": best.candidate.learning_rate,
+                        "l2": best.candidate.l2,
+                        "feature_set": best.candidate.feature_set,
+                        "validation_fraction": validation_fraction,
+                        "test_fraction": test_fraction,
+                        "seed": seed,
+                    },
+                    "validation": {"log_loss": entry["selection_log_loss"]},
+                    "test": {
+                        "log_loss": entry["test_log_loss"],
+                        "baseline_log_loss": report["baseline_log_loss"],
+                    },
+                    "tuning": {
+                        "strategy": strategy,
+                        "candidates": len(report["leaderboard"]),
+                    },
+                },
+                model_dir,
+                activate=False,
+            )
+            logger.info(f"Model {model.version} written to {path}")
+
+    for entry in report["leaderboard"][:10]:
+        print(
+            f"{entry['rank']:>3}  test_loss={entry['test_log_loss']}  "
+            f"selection_loss={entry['selection_log_loss']}  "
+            f"lr={entry['learning_rate']:.4g}  l2={entry['l2']:.3g}  "
+            f"features={entry['feature_set']}  epochs={entry['epochs']}  "
+            f"{entry['status']}  train={entry['train_seconds']}s  "
+            f"serve={entry['serving_microseconds_per_1000']}us/1000"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Tune the fight outcome model's hyperparameters in parallel."
+    )
+    parser.add_argument("--strategy", choices=STRATEGIES, default="halving")
+    parser.add_argument("--candidates", type=int, default=DEFAULT_TUNING_CANDIDATES)
+    parser.add_argument("--epochs", type=int, default=DEFAULT_EPOCHS)
+    parser.add_argument(
+        "--validation-fraction", type=float, default=DEFAULT_VALIDATION_FRACTION
+    )
+    parser.add_argument("--test-fraction", type=float, default=DEFAULT_TEST_FRACTION)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=TUNING_WORKERS)
+    parser.add_argument(
+        "--leaderboard", type=Path, default=Path("tuning_leaderboard.json")
+    )
+    parser.add_argument(
+        "--save-best",
+        action="store_true",
+        help="save the best candidate as an artifact without activating it",
+    )
+    parser.add_argument("--model-dir", type=Path, default=MODEL_DIR)
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            args.strategy,
+            args.candidates,
+            args.epochs,
+            args.validation_fraction,
+            args.seed,
+            args.workers,
+            args.leaderboard,
+            args.save_best,
+            args.model_dir,
+            args.test_fraction,
+        )
+    )
@@ -1,17 +1,57 @@
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from app.constants import PREFIX, version
+from app.db.database import SessionLocal
 from app.middleware.middlewares import log_requests
 from app.routers.auth_router import auth_router
 from app.routers.base_fighter_router import base_fighter_router
+from app.routers.bout_router import bout_router
 from app.routers.database_manager_router import database_manager_router
 from app.routers.extended_fighter_router import extended_fighter_router
+from app.routers.internal_router import internal_router
+from app.routers.prediction_router import prediction_router
+from app.routers.rating_router import rating_router
 from app.services.auth import AuthService
+from app.services.fighters.fighter_leaderboard import fighter_leaderboard
+from app.services.password_hasher import password_hasher
+from app.services.predictions.event_simulator import event_simulator
+from app.services.predictions.fight_predictor import fight_predictor
 from app.tools.exception_handlers import register_exception_handlers
 from app.tools.exceptions.custom_api_exceptions import UnauthorizedException
+from app.tools.logger import logger
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build state derived from PostgreSQL before serving requests and stop the
+    simulation workers and password hashing threads on shutdown.
+
+    Failures are logged and the app still starts; affected features fall back
+    to querying PostgreSQL directly.
+
+    Args:
+        app (FastAPI): The application instance.
+    """
+    try:
+        async with SessionLocal() as db:
+            await fighter_leaderboard.rebuild(db)
+    except Exception as e:
+        logger.warning(f"Leaderboard rebuild skipped: {e}")
+    try:
+        async with SessionLocal() as db:
+            await fight_predictor.rebuild(db)
+    except Exception as e:
+        logger.warning(f"Prediction features not loaded: {e}")
+    yield
+    event_simulator.shutdown()
+    password_hasher.shutdown()
+
 
-app = FastAPI(title="MMA Fighters API", version=version)
+app = FastAPI(title="MMA Fighters API", version=version, lifespan=lifespan)
 
 app.middleware("http")(log_requests)
 
@@ -19,6 +59,10 @@ app.include_router(base_fighter_router, prefix=PREFIX)
 app.include_router(extended_fighter_router, prefix=PREFIX)
 app.include_router(auth_router, prefix=PREFIX)
 app.include_router(database_manager_router, prefix=PREFIX)
+app.include_router(internal_router, prefix=PREFIX)
+app.include_router(prediction_router, prefix=PREFIX)
+app.include_router(rating_router, prefix=PREFIX)
+app.include_router(bout_router, prefix=PREFIX)
 
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
@@ -1,9 +1,10 @@
 import typing
 
-from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import HTMLResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.db.database import get_db
 from app.routers.endpoints.base_fighter_endpoints.country_endpoints import (
     base_country_router,
@@ -21,7 +22,7 @@ from app.routers.endpoints.base_fighter_endpoints.top_fighter_endpoints import (
 from app.schemas.fighter import FighterFilter
 from app.services.fighters.fighter_getter import FighterGetter
 from app.services.fighters.fighter_updater import FighterUpdater
-from app.templates import templates
+from app.templates import stream_template_response, templates
 
 base_fighter_router = APIRouter(prefix="/base_fighter", tags=["Base Fighter"])
 
@@ -39,21 +40,73 @@ IS_EXTENDED = False
 )
 async def get_all_base_fighters_list(
     request: Request,
+    cursor: str | None = None,
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
 ) -> HTMLResponse:
     """
-    Retrieve a list of all base fighters.
+    Retrieve a keyset-paginated list of base fighters.
 
     Args:
         request (Request): The incoming HTTP request.
+        cursor (str | None): Cursor token of the page to fetch, omitted for the first page.
+        page_size (int): Maximum number of fighters on the page.
         db (AsyncSession): Asynchronous database session.
 
     Returns:
-        HTMLResponse: Rendered HTML page displaying the list of fighters.
+        HTMLResponse: Rendered HTML page displaying one page of fighters.
     """
-    fighters = await FighterGetter(db, IS_EXTENDED).get_all_fighters_records()
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_fighters_page(
+        cursor, page_size
+    )
     return templates.TemplateResponse(
-        "fighter_list.html", {"request": request, "fighters": fighters}
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
+    )
+
+
+@base_fighter_router.get("/stream", status_code=status.HTTP_200_OK)
+async def stream_all_base_fighters(
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream all base fighters as newline-delimited JSON.
+
+    Args:
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        StreamingResponse: NDJSON stream with one fighter per line.
+    """
+    return StreamingResponse(
+        FighterGetter(db, IS_EXTENDED).stream_all_fighters_records(),
+        media_type="application/x-ndjson",
+    )
+
+
+@base_fighter_router.get(
+    "/stream/html", status_code=status.HTTP_200_OK, response_class=HTMLResponse
+)
+async def stream_all_base_fighters_html(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Render all base fighters as chunked HTML while rows are still being fetched.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        StreamingResponse: HTML page streamed fighter by fighter.
+    """
+    return stream_template_response(
+        "fighter_list_stream.html",
+        {
+            "request": request,
+            "fighters": FighterGetter(db, IS_EXTENDED).iter_records(),
+        },
     )
 
 
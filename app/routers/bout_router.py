@@ -0,0 +1,63 @@
+import typing
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.db.database import get_db
+from app.services.bouts.bout_history import BoutHistory
+
+bout_router = APIRouter(prefix="/bouts", tags=["Bouts"])
+
+
+@bout_router.get("", status_code=status.HTTP_200_OK)
+async def get_bouts(
+    start: date = Query(...),
+    end: date = Query(...),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Retrieve the bouts of a date range in chronological order.
+
+    Args:
+        start (date): Earliest event date (inclusive).
+        end (date): Latest event date (inclusive).
+        limit (int): The maximum number of bouts to retrieve.
+        offset (int): Number of bouts to skip.
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        typing.List[typing.Dict[str, typing.Any]]: Bouts with both fighters and the result.
+    """
+    return await BoutHistory(db).get_bouts(start, end, limit, offset)
+
+
+@bout_router.get("/fighters/{fighter_id}", status_code=status.HTTP_200_OK)
+async def get_fighter_bouts(
+    fighter_id: int,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    start: date | None = None,
+    end: date | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Retrieve a fighter's fight history, most recent first.
+
+    Args:
+        fighter_id (int): Fighter ID.
+        limit (int): The maximum number of bouts to retrieve.
+        offset (int): Number of bouts to skip.
+        start (date | None): Optional earliest event date (inclusive).
+        end (date | None): Optional latest event date (inclusive).
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        typing.List[typing.Dict[str, typing.Any]]: Bouts with the opponent and the fighter's result.
+    """
+    return await BoutHistory(db).get_fighter_bouts(
+        fighter_id, limit, offset, start, end
+    )
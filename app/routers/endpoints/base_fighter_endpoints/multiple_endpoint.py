@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
-from app.schemas.fighter import FighterFilter
+from app.schemas.fighter import FighterFilter, FighterUpdate
 from app.services.fighters.fighter_updater import FighterUpdater
 from app.tools.utils import handle_empty_response
 
@@ -25,11 +25,28 @@ async def create_multiple_base_fighter(
         db (AsyncSession): Active database session (dependency-injected).
 
     Returns:
-        List[Dict[str, Any]]: A list of created fighter records.
+        List[Dict[str, Any]]: Per-item result with `index`, `success` and either `fighter_id` or `error`.
     """
     return await FighterUpdater(db, IS_EXTENDED).add_multiple_fighters(fighters_data)
 
 
+@base_multiple_router.put("", status_code=status.HTTP_202_ACCEPTED)
+async def update_multiple_base_fighter(
+    updates: typing.List[FighterUpdate],
+    db: AsyncSession = Depends(get_db),
+) -> typing.List[int]:
+    """Apply partial updates to multiple fighters in one transaction.
+
+    Args:
+        updates (List[FighterUpdate]): Fighter IDs with the fields to change.
+        db (AsyncSession): Active database session (dependency-injected).
+
+    Returns:
+        List[int]: IDs of the updated fighters.
+    """
+    return await FighterUpdater(db, IS_EXTENDED).update_multiple_fighters(updates)
+
+
 @base_multiple_router.delete("", status_code=status.HTTP_200_OK)
 @handle_empty_response
 async def delete_multiple_base_fighter(
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from fastapi.responses import HTMLResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.constants import MAX_PAGE_SIZE
 from app.db.database import get_db
 from app.services.fighters.fighter_getter import FighterGetter
 from app.templates import templates
@@ -18,7 +19,10 @@ IS_EXTENDED = False
 )
 async def get_top_fighters_by_wins(
     request: Request,
-    limit: int,
+    limit: int = Query(..., ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    offset: int = Query(0, ge=0),
+    weight_class: str | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> HTMLResponse:
     """Retrieve the top fighters ranked by number of wins.
@@ -26,16 +30,20 @@ async def get_top_fighters_by_wins(
     Args:
         request (Request): The FastAPI request object.
         limit (int): The maximum number of fighters to retrieve.
+        cursor (str | None): Cursor returned with the previous page; overrides `offset`.
+        offset (int): Rank of the first fighter to return (0-based).
+        weight_class (str | None): Optional weight class to restrict the ranking to.
         db (AsyncSession): Active database session (dependency-injected).
 
     Returns:
         HTMLResponse: Rendered HTML page displaying top fighters by wins.
     """
-    fighters = await FighterGetter(db, IS_EXTENDED).get_fighters_by_param_with_limit(
-        "wins", limit
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_top_fighters(
+        "wins", limit, cursor, offset, weight_class
     )
     return templates.TemplateResponse(
-        "fighter_list.html", {"request": request, "fighters": fighters}
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
     )
 
 
@@ -46,7 +54,10 @@ async def get_top_fighters_by_wins(
 )
 async def get_top_fighters_by_loss(
     request: Request,
-    limit: int,
+    limit: int = Query(..., ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    offset: int = Query(0, ge=0),
+    weight_class: str | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> HTMLResponse:
     """Retrieve the top fighters ranked by number of losses.
@@ -54,14 +65,18 @@ async def get_top_fighters_by_loss(
     Args:
         request (Request): The FastAPI request object.
         limit (int): The maximum number of fighters to retrieve.
+        cursor (str | None): Cursor returned with the previous page; overrides `offset`.
+        offset (int): Rank of the first fighter to return (0-based).
+        weight_class (str | None): Optional weight class to restrict the ranking to.
         db (AsyncSession): Active database session (dependency-injected).
 
     Returns:
         HTMLResponse: Rendered HTML page displaying top fighters by losses.
     """
-    fighters = await FighterGetter(db, IS_EXTENDED).get_fighters_by_param_with_limit(
-        "loss", limit
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_top_fighters(
+        "loss", limit, cursor, offset, weight_class
     )
     return templates.TemplateResponse(
-        "fighter_list.html", {"request": request, "fighters": fighters}
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
     )
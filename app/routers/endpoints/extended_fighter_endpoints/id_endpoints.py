@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, Request, status
+import typing
+
+from fastapi import APIRouter, Depends, Query, Request, status
 from fastapi.responses import HTMLResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.constants import DEFAULT_SIMILAR_FIGHTERS, MAX_SIMILAR_FIGHTERS
 from app.db.database import get_db
 from app.schemas.extended_fighter import ExtendedFighterFilter
 from app.services.fighters.fighter_getter import FighterGetter
@@ -36,6 +39,29 @@ async def get_extended_fighter_by_id(
     )
 
 
+@extended_id_router.get("/{fighter_id}/similar", status_code=status.HTTP_200_OK)
+async def get_similar_extended_fighters(
+    fighter_id: int,
+    k: int = Query(DEFAULT_SIMILAR_FIGHTERS, ge=1, le=MAX_SIMILAR_FIGHTERS),
+    same_weight_class: bool = False,
+    db: AsyncSession = Depends(get_db),
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Retrieve the fighters whose base and extended stats are closest to a fighter's.
+
+    Args:
+        fighter_id (int): Unique identifier of the fighter.
+        k (int): Number of similar fighters to return.
+        same_weight_class (bool): Only return fighters of the same weight class.
+        db (AsyncSession): Active SQLAlchemy database session.
+
+    Returns:
+        list[dict]: Similar fighters with their distance in standard deviations, closest first.
+    """
+    return await FighterGetter(db, IS_EXTENDED).get_similar_fighters(
+        fighter_id, k, same_weight_class
+    )
+
+
 @extended_id_router.put("/{fighter_id}", status_code=status.HTTP_202_ACCEPTED)
 @handle_empty_response
 async def update_extended_fighter_by_id(
@@ -0,0 +1,101 @@
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.db.database import get_db
+from app.schemas.fighter import FighterFilter
+from app.services.fighters.fighter_json_reader import FighterJsonReader
+from app.tools.utils import decode_after_id, encode_cursor
+
+extended_json_router = APIRouter(prefix="/json")
+
+IS_EXTENDED = True
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@extended_json_router.get("", status_code=status.HTTP_200_OK)
+async def get_extended_fighters_json(
+    cursor: str | None = None,
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Retrieve a keyset-paginated page of extended fighters as JSON built by the database.
+
+    The cursor of the next page, if any, is returned in the `X-Next-Cursor` header.
+
+    Args:
+        cursor (str | None): Cursor token of the page to fetch, omitted for the first page.
+        page_size (int): Maximum number of fighters on the page.
+        db (AsyncSession): Active SQLAlchemy database session.
+
+    Returns:
+        Response: JSON array of extended fighters.
+    """
+    payload, last_id = await FighterJsonReader(db, IS_EXTENDED).get_fighters_page_json(
+        decode_after_id(cursor), page_size
+    )
+    headers = (
+        {"X-Next-Cursor": encode_cursor({"after": last_id})}
+        if last_id is not None
+        else {}
+    )
+    return Response(content=payload, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+@extended_json_router.get("/id/{fighter_id}", status_code=status.HTTP_200_OK)
+async def get_extended_fighter_by_id_json(
+    fighter_id: int, db: AsyncSession = Depends(get_db)
+) -> Response:
+    """Retrieve an extended fighter by ID as JSON built by the database.
+
+    Args:
+        fighter_id (int): Unique identifier of the fighter.
+        db (AsyncSession): Active SQLAlchemy database session.
+
+    Returns:
+        Response: JSON object with the fighter's data.
+    """
+    payload = await FighterJsonReader(db, IS_EXTENDED).get_fighter_by_id_json(
+        fighter_id
+    )
+    return Response(content=payload, media_type=JSON_MEDIA_TYPE)
+
+
+@extended_json_router.get("/country/{country}", status_code=status.HTTP_200_OK)
+async def get_extended_fighters_by_country_json(
+    country: str, db: AsyncSession = Depends(get_db)
+) -> Response:
+    """Retrieve extended fighters from a specific country as JSON built by the database.
+
+    Args:
+        country (str): The country name used to filter fighters.
+        db (AsyncSession): Active SQLAlchemy database session.
+
+    Returns:
+        Response: JSON array of fighters from the given country.
+    """
+    payload = await FighterJsonReader(db, IS_EXTENDED).get_fighters_by_country_json(
+        country
+    )
+    return Response(content=payload, media_type=JSON_MEDIA_TYPE)
+
+
+@extended_json_router.get("/search", status_code=status.HTTP_200_OK)
+async def search_extended_fighters_json(
+    fighter_filters: FighterFilter = Depends(),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Search for extended fighters and return them as JSON built by the database.
+
+    Args:
+        fighter_filters (FighterFilter): Query parameters used to filter fighters.
+        db (AsyncSession): Active SQLAlchemy database session.
+
+    Returns:
+        Response: JSON array of matching fighters.
+    """
+    payload = await FighterJsonReader(db, IS_EXTENDED).search_extended_fighter_json(
+        fighter_filters
+    )
+    return Response(content=payload, media_type=JSON_MEDIA_TYPE)
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
-from app.schemas.extended_fighter import ExtendedFighterFilter
+from app.schemas.extended_fighter import ExtendedFighterFilter, ExtendedFighterUpdate
 from app.services.fighters.fighter_updater import FighterUpdater
 from app.tools.utils import handle_empty_response
 
@@ -25,11 +25,28 @@ async def create_multiple_extended_fighter(
         db (AsyncSession): Active SQLAlchemy database session.
 
     Returns:
-        dict: Confirmation message or list of created fighters.
+        list[dict]: Per-item result with `index`, `success` and either `fighter_id` or `error`.
     """
     return await FighterUpdater(db, IS_EXTENDED).add_multiple_fighters(fighters_data)
 
 
+@extended_multiple_router.put("", status_code=status.HTTP_202_ACCEPTED)
+async def update_multiple_extended_fighter(
+    updates: typing.List[ExtendedFighterUpdate],
+    db: AsyncSession = Depends(get_db),
+):
+    """Apply partial updates to multiple extended fighters in one transaction.
+
+    Args:
+        updates (List[ExtendedFighterUpdate]): Fighter IDs with the fields and stats to change.
+        db (AsyncSession): Active SQLAlchemy database session.
+
+    Returns:
+        list[int]: IDs of the updated fighters.
+    """
+    return await FighterUpdater(db, IS_EXTENDED).update_multiple_fighters(updates)
+
+
 @extended_multiple_router.delete("", status_code=status.HTTP_200_OK)
 @handle_empty_response
 async def delete_multiple_extended_fighter(
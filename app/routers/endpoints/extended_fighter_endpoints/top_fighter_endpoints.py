@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from fastapi.responses import HTMLResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.constants import MAX_PAGE_SIZE
 from app.db.database import get_db
 from app.services.fighters.fighter_getter import FighterGetter
 from app.templates import templates
@@ -15,23 +16,32 @@ IS_EXTENDED = True
     "/wins", status_code=status.HTTP_200_OK, response_class=HTMLResponse
 )
 async def get_top_extended_fighters_by_wins(
-    request: Request, limit: int, db: AsyncSession = Depends(get_db)
+    request: Request,
+    limit: int = Query(..., ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    offset: int = Query(0, ge=0),
+    weight_class: str | None = None,
+    db: AsyncSession = Depends(get_db),
 ):
     """Retrieve top extended fighters ranked by total wins.
 
     Args:
         request (Request): FastAPI request object.
         limit (int): Maximum number of fighters to return.
+        cursor (str | None): Cursor returned with the previous page; overrides `offset`.
+        offset (int): Rank of the first fighter to return (0-based).
+        weight_class (str | None): Optional weight class to restrict the ranking to.
         db (AsyncSession): Active SQLAlchemy asynchronous session.
 
     Returns:
         TemplateResponse: Rendered HTML displaying top fighters by wins.
     """
-    fighters = await FighterGetter(db, IS_EXTENDED).get_fighters_by_param_with_limit(
-        "wins", limit
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_top_fighters(
+        "wins", limit, cursor, offset, weight_class
     )
     return templates.TemplateResponse(
-        "fighter_list.html", {"request": request, "fighters": fighters}
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
     )
 
 
@@ -39,23 +49,32 @@ async def get_top_extended_fighters_by_wins(
     "/loss", status_code=status.HTTP_200_OK, response_class=HTMLResponse
 )
 async def get_top_fighters_by_loss(
-    request: Request, limit: int, db: AsyncSession = Depends(get_db)
+    request: Request,
+    limit: int = Query(..., ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    offset: int = Query(0, ge=0),
+    weight_class: str | None = None,
+    db: AsyncSession = Depends(get_db),
 ):
     """Retrieve top extended fighters ranked by total losses.
 
     Args:
         request (Request): FastAPI request object.
         limit (int): Maximum number of fighters to return.
+        cursor (str | None): Cursor returned with the previous page; overrides `offset`.
+        offset (int): Rank of the first fighter to return (0-based).
+        weight_class (str | None): Optional weight class to restrict the ranking to.
         db (AsyncSession): Active SQLAlchemy asynchronous session.
 
     Returns:
         TemplateResponse: Rendered HTML displaying top fighters by losses.
     """
-    fighters = await FighterGetter(db, IS_EXTENDED).get_fighters_by_param_with_limit(
-        "loss", limit
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_top_fighters(
+        "loss", limit, cursor, offset, weight_class
     )
     return templates.TemplateResponse(
-        "fighter_list.html", {"request": request, "fighters": fighters}
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
     )
 
 
@@ -63,23 +82,32 @@ async def get_top_fighters_by_loss(
     "/wins/ko", status_code=status.HTTP_200_OK, response_class=HTMLResponse
 )
 async def get_top_fighters_by_ko_wins(
-    request: Request, limit: int, db: AsyncSession = Depends(get_db)
+    request: Request,
+    limit: int = Query(..., ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    offset: int = Query(0, ge=0),
+    weight_class: str | None = None,
+    db: AsyncSession = Depends(get_db),
 ):
     """Retrieve top extended fighters ranked by knockout or TKO wins.
 
     Args:
         request (Request): FastAPI request object.
         limit (int): Maximum number of fighters to return.
+        cursor (str | None): Cursor returned with the previous page; overrides `offset`.
+        offset (int): Rank of the first fighter to return (0-based).
+        weight_class (str | None): Optional weight class to restrict the ranking to.
         db (AsyncSession): Active SQLAlchemy asynchronous session.
 
     Returns:
         TemplateResponse: Rendered HTML displaying top fighters by KO/TKO wins.
     """
-    fighters = await FighterGetter(db, IS_EXTENDED).get_fighters_by_param_with_limit(
-        "win_by_ko_tko", limit
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_top_fighters(
+        "win_by_ko_tko", limit, cursor, offset, weight_class
     )
     return templates.TemplateResponse(
-        "fighter_list.html", {"request": request, "fighters": fighters}
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
     )
 
 
@@ -87,21 +115,131 @@ async def get_top_fighters_by_ko_wins(
     "/loss/ko", status_code=status.HTTP_200_OK, response_class=HTMLResponse
 )
 async def get_top_fighters_by_ko_loss(
-    request: Request, limit: int, db: AsyncSession = Depends(get_db)
+    request: Request,
+    limit: int = Query(..., ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    offset: int = Query(0, ge=0),
+    weight_class: str | None = None,
+    db: AsyncSession = Depends(get_db),
 ):
     """Retrieve top extended fighters ranked by knockout or TKO losses.
 
     Args:
         request (Request): FastAPI request object.
         limit (int): Maximum number of fighters to return.
+        cursor (str | None): Cursor returned with the previous page; overrides `offset`.
+        offset (int): Rank of the first fighter to return (0-based).
+        weight_class (str | None): Optional weight class to restrict the ranking to.
         db (AsyncSession): Active SQLAlchemy asynchronous session.
 
     Returns:
         TemplateResponse: Rendered HTML displaying top fighters by KO/TKO losses.
     """
-    fighters = await FighterGetter(db, IS_EXTENDED).get_fighters_by_param_with_limit(
-        "loss_by_ko_tko", limit
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_top_fighters(
+        "loss_by_ko_tko", limit, cursor, offset, weight_class
     )
     return templates.TemplateResponse(
-        "fighter_list.html", {"request": request, "fighters": fighters}
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
+    )
+
+
+@extended_top_router.get(
+    "/win_percentage", status_code=status.HTTP_200_OK, response_class=HTMLResponse
+)
+async def get_top_fighters_by_win_percentage(
+    request: Request,
+    limit: int = Query(..., ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    offset: int = Query(0, ge=0),
+    weight_class: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Retrieve top extended fighters ranked by win percentage.
+
+    Args:
+        request (Request): FastAPI request object.
+        limit (int): Maximum number of fighters to return.
+        cursor (str | None): Cursor returned with the previous page; overrides `offset`.
+        offset (int): Rank of the first fighter to return (0-based).
+        weight_class (str | None): Optional weight class to restrict the ranking to.
+        db (AsyncSession): Active SQLAlchemy asynchronous session.
+
+    Returns:
+        TemplateResponse: Rendered HTML displaying top fighters by win percentage.
+    """
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_top_fighters(
+        "win_percentage", limit, cursor, offset, weight_class
+    )
+    return templates.TemplateResponse(
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
+    )
+
+
+@extended_top_router.get(
+    "/finish_rate", status_code=status.HTTP_200_OK, response_class=HTMLResponse
+)
+async def get_top_fighters_by_finish_rate(
+    request: Request,
+    limit: int = Query(..., ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    offset: int = Query(0, ge=0),
+    weight_class: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Retrieve top extended fighters ranked by share of wins by KO/TKO or submission.
+
+    Args:
+        request (Request): FastAPI request object.
+        limit (int): Maximum number of fighters to return.
+        cursor (str | None): Cursor returned with the previous page; overrides `offset`.
+        offset (int): Rank of the first fighter to return (0-based).
+        weight_class (str | None): Optional weight class to restrict the ranking to.
+        db (AsyncSession): Active SQLAlchemy asynchronous session.
+
+    Returns:
+        TemplateResponse: Rendered HTML displaying top fighters by finish rate.
+    """
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_top_fighters(
+        "finish_rate", limit, cursor, offset, weight_class
+    )
+    return templates.TemplateResponse(
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
+    )
+
+
+@extended_top_router.get(
+    "/striking_differential",
+    status_code=status.HTTP_200_OK,
+    response_class=HTMLResponse,
+)
+async def get_top_fighters_by_striking_differential(
+    request: Request,
+    limit: int = Query(..., ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    offset: int = Query(0, ge=0),
+    weight_class: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Retrieve top extended fighters ranked by strikes landed minus absorbed per minute.
+
+    Args:
+        request (Request): FastAPI request object.
+        limit (int): Maximum number of fighters to return.
+        cursor (str | None): Cursor returned with the previous page; overrides `offset`.
+        offset (int): Rank of the first fighter to return (0-based).
+        weight_class (str | None): Optional weight class to restrict the ranking to.
+        db (AsyncSession): Active SQLAlchemy asynchronous session.
+
+    Returns:
+        TemplateResponse: Rendered HTML displaying top fighters by striking differential.
+    """
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_top_fighters(
+        "striking_differential", limit, cursor, offset, weight_class
+    )
+    return templates.TemplateResponse(
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
     )
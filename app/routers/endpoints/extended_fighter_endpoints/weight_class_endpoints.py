@@ -84,3 +84,80 @@ async def get_avg_loss_per_weight_class(
     return templates.TemplateResponse(
         "stats.html", {"request": request, "result": results[0], "title": title}
     )
+
+
+@extended_weightclass_router.get("/win_percentage", status_code=status.HTTP_200_OK)
+async def get_avg_win_percentage_per_weight_class(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    """Retrieve the average win percentage per weight class.
+
+    Args:
+        request (Request): FastAPI request object.
+        db (AsyncSession): Active SQLAlchemy asynchronous session.
+
+    Returns:
+        TemplateResponse: Rendered HTML with the average win percentage grouped by weight class.
+    """
+    results = await FighterGetter(db, IS_EXTENDED).get_grouped_stat(
+        param_name1="weight_class",
+        param_name2="win_percentage",
+        math_func1=func.avg,
+        label1="avg_win_percentage",
+    )
+    title = "Average Win Percentage per Weight Class"
+    return templates.TemplateResponse(
+        "stats.html", {"request": request, "result": results[0], "title": title}
+    )
+
+
+@extended_weightclass_router.get("/finish_rate", status_code=status.HTTP_200_OK)
+async def get_avg_finish_rate_per_weight_class(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    """Retrieve the average finish rate per weight class.
+
+    Args:
+        request (Request): FastAPI request object.
+        db (AsyncSession): Active SQLAlchemy asynchronous session.
+
+    Returns:
+        TemplateResponse: Rendered HTML with the average finish rate grouped by weight class.
+    """
+    results = await FighterGetter(db, IS_EXTENDED).get_grouped_stat(
+        param_name1="weight_class",
+        param_name2="finish_rate",
+        math_func1=func.avg,
+        label1="avg_finish_rate",
+    )
+    title = "Average Finish Rate per Weight Class"
+    return templates.TemplateResponse(
+        "stats.html", {"request": request, "result": results[0], "title": title}
+    )
+
+
+@extended_weightclass_router.get(
+    "/striking_differential", status_code=status.HTTP_200_OK
+)
+async def get_avg_striking_differential_per_weight_class(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    """Retrieve the average striking differential per weight class.
+
+    Args:
+        request (Request): FastAPI request object.
+        db (AsyncSession): Active SQLAlchemy asynchronous session.
+
+    Returns:
+        TemplateResponse: Rendered HTML with the average striking differential grouped by weight class.
+    """
+    results = await FighterGetter(db, IS_EXTENDED).get_grouped_stat(
+        param_name1="weight_class",
+        param_name2="striking_differential",
+        math_func1=func.avg,
+        label1="avg_striking_differential",
+    )
+    title = "Average Striking Differential per Weight Class"
+    return templates.TemplateResponse(
+        "stats.html", {"request": request, "result": results[0], "title": title}
+    )
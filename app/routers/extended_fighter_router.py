@@ -1,9 +1,10 @@
 import typing
 
-from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import HTMLResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.db.database import get_db
 from app.routers.endpoints.extended_fighter_endpoints.country_endpoints import (
     extended_country_router,
@@ -14,6 +15,9 @@ from app.routers.endpoints.extended_fighter_endpoints.fighter_details_endpoints
 from app.routers.endpoints.extended_fighter_endpoints.id_endpoints import (
     extended_id_router,
 )
+from app.routers.endpoints.extended_fighter_endpoints.json_endpoints import (
+    extended_json_router,
+)
 from app.routers.endpoints.extended_fighter_endpoints.multiple_endpoint import (
     extended_multiple_router,
 )
@@ -29,7 +33,7 @@ from app.routers.endpoints.extended_fighter_endpoints.weight_class_endpoints imp
 from app.schemas.extended_fighter import ExtendedFighterFilter
 from app.services.fighters.fighter_getter import FighterGetter
 from app.services.fighters.fighter_updater import FighterUpdater
-from app.templates import templates
+from app.templates import stream_template_response, templates
 
 extended_fighter_router = APIRouter(
     prefix="/extended_fighter", tags=["Extended Fighter"]
@@ -42,6 +46,7 @@ extended_fighter_router.include_router(extended_multiple_router)
 extended_fighter_router.include_router(extended_search_router)
 extended_fighter_router.include_router(extended_top_router)
 extended_fighter_router.include_router(extended_weightclass_router)
+extended_fighter_router.include_router(extended_json_router)
 
 IS_EXTENDED = True
 
@@ -51,21 +56,73 @@ IS_EXTENDED = True
 )
 async def get_all_extended_fighters_list(
     request: Request,
+    cursor: str | None = None,
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
 ) -> HTMLResponse:
     """
-    Retrieve a list of all extended fighters.
+    Retrieve a keyset-paginated list of extended fighters.
 
     Args:
         request (Request): The incoming HTTP request.
+        cursor (str | None): Cursor token of the page to fetch, omitted for the first page.
+        page_size (int): Maximum number of fighters on the page.
         db (AsyncSession): Asynchronous database session.
 
     Returns:
-        HTMLResponse: Rendered HTML page displaying all extended fighters.
+        HTMLResponse: Rendered HTML page displaying one page of fighters.
     """
-    fighters = await FighterGetter(db, IS_EXTENDED).get_all_fighters_records()
+    fighters, next_cursor = await FighterGetter(db, IS_EXTENDED).get_fighters_page(
+        cursor, page_size
+    )
     return templates.TemplateResponse(
-        "fighter_list.html", {"request": request, "fighters": fighters}
+        "fighter_list.html",
+        {"request": request, "fighters": fighters, "next_cursor": next_cursor},
+    )
+
+
+@extended_fighter_router.get("/stream", status_code=status.HTTP_200_OK)
+async def stream_all_extended_fighters(
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream all extended fighters as newline-delimited JSON.
+
+    Args:
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        StreamingResponse: NDJSON stream with one fighter per line.
+    """
+    return StreamingResponse(
+        FighterGetter(db, IS_EXTENDED).stream_all_fighters_records(),
+        media_type="application/x-ndjson",
+    )
+
+
+@extended_fighter_router.get(
+    "/stream/html", status_code=status.HTTP_200_OK, response_class=HTMLResponse
+)
+async def stream_all_extended_fighters_html(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Render all extended fighters as chunked HTML while rows are still being fetched.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        StreamingResponse: HTML page streamed fighter by fighter.
+    """
+    return stream_template_response(
+        "fighter_list_stream.html",
+        {
+            "request": request,
+            "fighters": FighterGetter(db, IS_EXTENDED).iter_records(),
+        },
     )
 
 
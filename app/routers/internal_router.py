@@ -0,0 +1,66 @@
+import typing
+
+from fastapi import APIRouter, status
+
+from app.db.database import get_pool_stats
+from app.services.fighters.fighter_cache import fighter_cache
+from app.services.password_hasher import password_hasher
+from app.services.predictions.prediction_batcher import prediction_batcher
+from app.services.predictions.prediction_cache import prediction_cache
+
+internal_router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+@internal_router.get("/cache", status_code=status.HTTP_200_OK)
+async def get_cache_stats() -> typing.Dict[str, typing.Any]:
+    """
+    Expose fighter cache counters.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Hit, miss, invalidation, eviction and error counts.
+    """
+    return await fighter_cache.get_stats()
+
+
+@internal_router.get("/predictions/batching", status_code=status.HTTP_200_OK)
+async def get_prediction_batching_stats() -> typing.Dict[str, typing.Any]:
+    """
+    Expose prediction micro-batching settings and counters.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Batch size and queueing delay statistics.
+    """
+    return prediction_batcher.get_stats()
+
+
+@internal_router.get("/predictions/cache", status_code=status.HTTP_200_OK)
+async def get_prediction_cache_stats() -> typing.Dict[str, typing.Any]:
+    """
+    Expose prediction cache settings and counters.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Size, hit, miss, invalidation, eviction and error counts.
+    """
+    return prediction_cache.get_stats()
+
+
+@internal_router.get("/db/pool", status_code=status.HTTP_200_OK)
+async def get_db_pool_stats() -> typing.Dict[str, typing.Any]:
+    """
+    Expose this worker's database connection pool settings and usage.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Connections in use, idle and in overflow, and checkout wait statistics.
+    """
+    return get_pool_stats()
+
+
+@internal_router.get("/auth/hashing", status_code=status.HTTP_200_OK)
+async def get_password_hashing_stats() -> typing.Dict[str, typing.Any]:
+    """
+    Expose password hashing pool settings, queue depth and counters.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Threads busy, requests queued, rejections and queue wait statistics.
+    """
+    return password_hasher.get_stats()
@@ -0,0 +1,182 @@
+import typing
+
+from fastapi import APIRouter, Body, Depends, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import MAX_PREDICTION_PAIRS
+from app.db.database import get_db
+from app.schemas.prediction import BracketSimulation, CardSimulation, MatchupPair
+from app.services.predictions.event_simulator import event_simulator
+from app.services.predictions.fight_predictor import fight_predictor
+from app.services.predictions.matchup_matrix import matchup_store
+from app.services.predictions.prediction_batcher import prediction_batcher
+from app.services.predictions.prediction_cache import prediction_cache
+
+prediction_router = APIRouter(prefix="/predict", tags=["Prediction"])
+
+
+@prediction_router.get("", status_code=status.HTTP_200_OK)
+async def predict_fight(
+    fighter_a: int = Query(...),
+    fighter_b: int = Query(...),
+    db: AsyncSession = Depends(get_db),
+) -> typing.Dict[str, typing.Any]:
+    """
+    Predict the winner of a fight between two fighters.
+
+    Repeated fights are answered from `PredictionCache`; the others are
+    scored together with concurrent requests in micro-batches (see
+    `PredictionBatcher`).
+
+    Args:
+        fighter_a (int): ID of the first fighter.
+        fighter_b (int): ID of the second fighter.
+        db (AsyncSession): Asynchronous database session, only used to load the
+            feature matrix when it is missing or stale.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Win probability of each fighter and the model version.
+    """
+    await fight_predictor.ensure_ready(db)
+    return await prediction_cache.get_or_predict(
+        fighter_a, fighter_b, prediction_batcher.predict
+    )
+
+
+@prediction_router.post("/batch", status_code=status.HTTP_200_OK)
+async def predict_fights_batch(
+    pairs: typing.List[MatchupPair] = Body(..., max_length=MAX_PREDICTION_PAIRS),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Predict many fights at once, e.g. a whole event card.
+
+    The fighters involved are reloaded in one query, then every pair is scored
+    in a single vectorized pass. Invalid pairs produce an `error` line instead
+    of failing the batch.
+
+    Args:
+        pairs (List[MatchupPair]): Fights to predict.
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        StreamingResponse: NDJSON stream with one result per pair, in request order.
+    """
+    await fight_predictor.ensure_ready(db)
+    await fight_predictor.refresh(
+        db,
+        (
+            fighter_id
+            for pair in pairs
+            for fighter_id in (pair.fighter_a, pair.fighter_b)
+        ),
+    )
+    return StreamingResponse(
+        fight_predictor.stream_predictions(
+            [(pair.fighter_a, pair.fighter_b) for pair in pairs]
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+@prediction_router.post("/simulate/bracket", status_code=status.HTTP_200_OK)
+async def simulate_bracket(
+    bracket: BracketSimulation,
+    db: AsyncSession = Depends(get_db),
+) -> typing.Dict[str, typing.Any]:
+    """
+    Run Monte Carlo trials of a single-elimination bracket.
+
+    Trials run in a pool of worker processes, so the server keeps handling
+    other requests while a large simulation is in progress.
+
+    Args:
+        bracket (BracketSimulation): Entrants in bracket order, trial count and optional seed.
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Champion probability per fighter and the
+        distribution of the number of finishes.
+    """
+    await fight_predictor.ensure_ready(db)
+    await fight_predictor.refresh(db, bracket.fighter_ids)
+    return await event_simulator.simulate_bracket(
+        bracket.fighter_ids, bracket.trials, bracket.seed
+    )
+
+
+@prediction_router.post("/simulate/card", status_code=status.HTTP_200_OK)
+async def simulate_card(
+    card: CardSimulation,
+    db: AsyncSession = Depends(get_db),
+) -> typing.Dict[str, typing.Any]:
+    """
+    Run Monte Carlo trials of an event card.
+
+    Args:
+        card (CardSimulation): Bouts of the card, trial count and optional seed.
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Win and finish frequency per bout and the
+        distribution of the number of finishes.
+    """
+    await fight_predictor.ensure_ready(db)
+    await fight_predictor.refresh(
+        db,
+        (
+            fighter_id
+            for bout in card.bouts
+            for fighter_id in (bout.fighter_a, bout.fighter_b)
+        ),
+    )
+    return await event_simulator.simulate_card(
+        [(bout.fighter_a, bout.fighter_b) for bout in card.bouts],
+        card.trials,
+        card.seed,
+    )
+
+
+@prediction_router.get("/matchups/{fighter_id}", status_code=status.HTTP_200_OK)
+async def get_matchup_row(
+    fighter_id: int,
+    weight_class: str = Query(...),
+) -> typing.Dict[str, typing.Any]:
+    """
+    Read a fighter's precomputed win probability against every fighter of
+    their weight class.
+
+    Served from the matchup matrix built by `app.db.scripts.build_matchups`,
+    so the result reflects the data as of the last build.
+
+    Args:
+        fighter_id (int): Fighter ID.
+        weight_class (str): Weight class of the fighter.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Opponents sorted by win probability, highest first.
+    """
+    return matchup_store.get_row(weight_class, fighter_id)
+
+
+@prediction_router.get(
+    "/matchups/{fighter_id}/{opponent_id}", status_code=status.HTTP_200_OK
+)
+async def get_matchup(
+    fighter_id: int,
+    opponent_id: int,
+    weight_class: str = Query(...),
+) -> typing.Dict[str, typing.Any]:
+    """
+    Read the precomputed prediction of a fight within a weight class.
+
+    Args:
+        fighter_id (int): ID of the first fighter.
+        opponent_id (int): ID of the second fighter.
+        weight_class (str): Weight class of both fighters.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Win probability of each fighter and the model version.
+    """
+    return matchup_store.get_probability(weight_class, fighter_id, opponent_id)
@@ -0,0 +1,69 @@
+import typing
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.db.database import get_db
+from app.schemas.bout import BoutCreate
+from app.services.ratings.rating_engine import RatingEngine
+
+rating_router = APIRouter(prefix="/ratings", tags=["Ratings"])
+
+
+@rating_router.get("", status_code=status.HTTP_200_OK)
+async def get_rating_leaderboard(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    weight_class: str | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Rank fighters by Glicko-2 rating, highest first.
+
+    Args:
+        limit (int): The maximum number of fighters to retrieve.
+        offset (int): Rank of the first fighter to return (0-based).
+        weight_class (str | None): Optional weight class to restrict the ranking to.
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        typing.List[typing.Dict[str, typing.Any]]: Fighters with their rating, deviation and volatility.
+    """
+    return await RatingEngine(db).get_leaderboard(offset, limit, weight_class)
+
+
+@rating_router.get("/{fighter_id}", status_code=status.HTTP_200_OK)
+async def get_fighter_rating(
+    fighter_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> typing.Dict[str, typing.Any]:
+    """
+    Retrieve a fighter's Glicko-2 rating.
+
+    Args:
+        fighter_id (int): Fighter ID.
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        typing.Dict[str, typing.Any]: Rating, deviation, volatility and number of rated bouts.
+    """
+    return await RatingEngine(db).get_rating(fighter_id)
+
+
+@rating_router.post("/bouts", status_code=status.HTTP_201_CREATED)
+async def record_bout(
+    bout: BoutCreate,
+    db: AsyncSession = Depends(get_db),
+) -> typing.Dict[str, typing.Any]:
+    """
+    Record a bout and update both fighters' ratings.
+
+    Args:
+        bout (BoutCreate): Fighters, result and date of the bout.
+        db (AsyncSession): Asynchronous database session.
+
+    Returns:
+        typing.Dict[str, typing.Any]: The bout ID and both fighters' new ratings.
+    """
+    return await RatingEngine(db).record_bout(**bout.model_dump())
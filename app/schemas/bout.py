@@ -0,0 +1,27 @@
+import typing
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class BoutCreate(BaseModel):
+    """
+    A bout to record.
+
+    Attributes:
+        fighter_id (int): ID of the first fighter.
+        opponent_id (int): ID of the second fighter.
+        result (str): Outcome for `fighter_id`: "win", "loss", "draw" or "nc" (no contest).
+        event_date (date): Date of the bout.
+        method (str | None): How the bout ended, e.g. "KO/TKO", "SUB" or "DEC".
+        round (int | None): Round the bout ended in.
+        time_seconds (int | None): Time elapsed in the final round, in seconds.
+    """
+
+    fighter_id: int
+    opponent_id: int
+    result: typing.Literal["win", "loss", "draw", "nc"]
+    event_date: date
+    method: str | None = Field(None, max_length=30)
+    round: int | None = Field(None, ge=1)
+    time_seconds: int | None = Field(None, ge=0)
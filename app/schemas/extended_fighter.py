@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from .base_stats import BaseStats, BaseStatsFilter
 from .extended_stats import ExtendedStats, ExtendedStatsFilter
-from .fighter import Fighter, FighterFilter
+from .fighter import Fighter, FighterFilter, FighterUpdate
 from .fights_results import FightsResults, FightsResultsFilter
 
 
@@ -38,3 +38,17 @@ class ExtendedFighterFilter(FighterFilter):
     fights_results: FightsResultsFilter | None = None
 
     model_config = {"from_attributes": True}
+
+
+class ExtendedFighterUpdate(ExtendedFighterFilter, FighterUpdate):
+    """
+    Partial update of one extended fighter, used by batch updates.
+
+    Fields left unset (None), including inside the stats sections, keep their
+    current value. Stats of a fighter without a row in that stats table are ignored.
+
+    Attributes:
+        fighter_id (int): ID of the fighter to update.
+    """
+
+    model_config = {"from_attributes": True}
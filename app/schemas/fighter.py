@@ -39,3 +39,13 @@ class Fighter(BaseModel):
 
 
 FighterFilter = create_filter_schema(Fighter)
+
+
+class FighterUpdate(FighterFilter):
+    """Partial update of one fighter, used by batch updates.
+    Fields left unset (None) keep their current value.
+    Attributes:
+        fighter_id (int): ID of the fighter to update.
+    """
+
+    fighter_id: int
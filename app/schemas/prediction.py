@@ -0,0 +1,57 @@
+import typing
+
+from pydantic import BaseModel, Field
+
+from app.constants import (
+    DEFAULT_SIMULATION_TRIALS,
+    MAX_BRACKET_SIZE,
+    MAX_CARD_BOUTS,
+    MAX_SIMULATION_TRIALS,
+)
+
+
+class MatchupPair(BaseModel):
+    """
+    One fight to predict.
+
+    Attributes:
+        fighter_a (int): ID of the first fighter.
+        fighter_b (int): ID of the second fighter.
+    """
+
+    fighter_a: int
+    fighter_b: int
+
+
+class BracketSimulation(BaseModel):
+    """
+    A single-elimination bracket to simulate.
+
+    Attributes:
+        fighter_ids (List[int]): Entrants in bracket order (1 vs 2, 3 vs 4, ...); a power of two.
+        trials (int): Number of Monte Carlo trials.
+        seed (int | None): Seed for reproducible results; random if not set.
+    """
+
+    fighter_ids: typing.List[int] = Field(
+        ..., min_length=2, max_length=MAX_BRACKET_SIZE
+    )
+    trials: int = Field(DEFAULT_SIMULATION_TRIALS, ge=1, le=MAX_SIMULATION_TRIALS)
+    seed: int | None = Field(None, ge=0)
+
+
+class CardSimulation(BaseModel):
+    """
+    An event card to simulate.
+
+    Attributes:
+        bouts (List[MatchupPair]): Bouts of the card.
+        trials (int): Number of Monte Carlo trials.
+        seed (int | None): Seed for reproducible results; random if not set.
+    """
+
+    bouts: typing.List[MatchupPair] = Field(
+        ..., min_length=1, max_length=MAX_CARD_BOUTS
+    )
+    trials: int = Field(DEFAULT_SIMULATION_TRIALS, ge=1, le=MAX_SIMULATION_TRIALS)
+    seed: int | None = Field(None, ge=0)
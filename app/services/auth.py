@@ -5,7 +5,6 @@ from datetime import datetime, timedelta
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
-from passlib.context import CryptContext
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,16 +12,17 @@ from app.constants import PREFIX
 from app.db.models.users import Users
 from app.schemas.users import User as UserSchema
 from app.schemas.users import UserFilter
+from app.services.password_hasher import password_hasher
 from app.tools import logger
 from app.tools.exceptions.custom_api_exceptions import (
     NotFoundException,
+    ServiceUnavailableException,
     UnauthorizedException,
 )
 
 SECRET_KEY: str | None = os.getenv("SECRET_KEY")
 ALGORITHM: str | None = os.getenv("ALGORITHM")
 
-bcrypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl=f"{PREFIX}/auth/token")
 
 
@@ -81,12 +81,14 @@ class AuthService:
 
         Returns:
             bool: True if the user was successfully created, False otherwise.
+
+        Raises:
+            ServiceUnavailableException: If the password hashing queue is full.
         """
+        # hashed on the hasher's threads, so the event loop keeps serving requests
+        hashed_password = await password_hasher.hash(user_filter.password[:30])
         try:
-            user = Users(
-                email=user_filter.email,
-                hashed_password=bcrypt_context.hash(user_filter.password[:30]),
-            )
+            user = Users(email=user_filter.email, hashed_password=hashed_password)
             self.db.add(user)
             await self.db.commit()
             return True
@@ -118,6 +120,7 @@ class AuthService:
 
         Raises:
             UnauthorizedException: If credentials are invalid.
+            ServiceUnavailableException: If the password hashing queue is full.
         """
         records = await self.db.execute(
             select(Users).filter(Users.email == user_filter.email)
@@ -127,8 +130,12 @@ class AuthService:
             raise UnauthorizedException
 
         try:
-            if not bcrypt_context.verify(user_filter.password, user.hashed_password):
+            if not await password_hasher.verify(
+                user_filter.password, user.hashed_password
+            ):
                 raise UnauthorizedException
+        except ServiceUnavailableException:
+            raise
         except Exception as e:
             logger.error("Password verification error")
             raise UnauthorizedException from e
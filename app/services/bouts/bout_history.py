@@ -0,0 +1,259 @@
+import time
+import typing
+from datetime import date
+
+from sqlalchemy import case, func, or_, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Bouts, FighterBoutSpans
+from app.db.models.fighters import Fighters
+from app.services.fighters.fighter_bulk_writer import MAX_BIND_PARAMS
+from app.tools.exceptions.custom_api_exceptions import NotFoundException
+from app.tools.logger import logger
+
+# Columns written by COPY; bout_id comes from the sequence.
+COPY_COLUMNS = (
+    "event_date",
+    "fighter_id",
+    "opponent_id",
+    "result",
+    "method",
+    "round",
+    "time_seconds",
+)
+
+BOUT_COLUMNS = (
+    Bouts.bout_id,
+    Bouts.event_date,
+    Bouts.method,
+    Bouts.round,
+    Bouts.time_seconds,
+)
+
+# Years whose partition is known to exist, shared by all sessions of the process.
+_known_partitions: typing.Set[int] = set()
+
+
+def partition_name(year: int) -> str:
+    """
+    Return the name of the bouts partition holding a year.
+
+    Args:
+        year (int): Event year.
+
+    Returns:
+        str: Partition table name.
+    """
+    return f"bouts_{year}"
+
+
+def _merge_span(
+    spans: typing.Dict[int, typing.Tuple[date, date]], fighter_id: int, day: date
+) -> None:
+    """Widen a fighter's (first, last) bout date span to include a day."""
+    first, last = spans.get(fighter_id, (day, day))
+    spans[fighter_id] = (min(first, day), max(last, day))
+
+
+class BoutHistory:
+    """
+    Writes and reads the bout-level fight history.
+
+    `bouts` is partitioned by year of event_date, so date range queries only
+    scan the partitions of the requested years, and a fighter's history is
+    bounded by the dates in `fighter_bout_spans` so it only scans the years
+    of their career. Partitions are created the first time a bout of their
+    year is written.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize the history service.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+        """
+        self.db = db
+
+    async def ensure_partitions(self, years: typing.Iterable[int]) -> None:
+        """
+        Create the partitions of some years if they do not exist yet.
+
+        Args:
+            years (Iterable[int]): Event years about to be written.
+        """
+        for year in sorted(set(years) - _known_partitions):
+            name = partition_name(year)
+            exists = await self.db.execute(select(func.to_regclass(name)))
+            if exists.scalar() is not None:
+                # only cache partitions visible outside this transaction
+                _known_partitions.add(year)
+                continue
+            await self.db.execute(
+                text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF bouts '
+                    f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+                )
+            )
+            logger.info(f"Created bouts partition {name}")
+
+    async def update_spans(
+        self, spans: typing.Dict[int, typing.Tuple[date, date]]
+    ) -> None:
+        """
+        Widen the stored bout date span of some fighters.
+
+        Args:
+            spans (Dict[int, Tuple[date, date]]): (first, last) bout date per fighter ID.
+        """
+        # sorted so concurrent writers lock span rows in the same order
+        rows = [
+            {"fighter_id": fighter_id, "first_bout_date": first, "last_bout_date": last}
+            for fighter_id, (first, last) in sorted(spans.items())
+        ]
+        chunk_size = MAX_BIND_PARAMS // 3
+        for start in range(0, len(rows), chunk_size):
+            stmt = insert(FighterBoutSpans).values(rows[start : start + chunk_size])
+            await self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[FighterBoutSpans.fighter_id],
+                    set_={
+                        "first_bout_date": func.least(
+                            FighterBoutSpans.first_bout_date,
+                            stmt.excluded.first_bout_date,
+                        ),
+                        "last_bout_date": func.greatest(
+                            FighterBoutSpans.last_bout_date,
+                            stmt.excluded.last_bout_date,
+                        ),
+                    },
+                )
+            )
+
+    async def ingest(self, batches: typing.Iterable[typing.List[dict]]) -> int:
+        """
+        Append bouts with COPY and commit them in one transaction.
+
+        Args:
+            batches (Iterable[list[dict]]): Batches of bout records with the
+                keys of COPY_COLUMNS; `event_date` as datetime.date.
+
+        Returns:
+            int: Number of bouts written.
+        """
+        connection = await (await self.db.connection()).get_raw_connection()
+        rows = 0
+        start = time.perf_counter()
+        for batch in batches:
+            await self.ensure_partitions(record["event_date"].year for record in batch)
+            await connection.driver_connection.copy_records_to_table(
+                Bouts.__tablename__,
+                records=[
+                    tuple(record.get(column) for column in COPY_COLUMNS)
+                    for record in batch
+                ],
+                columns=list(COPY_COLUMNS),
+            )
+            spans: typing.Dict[int, typing.Tuple[date, date]] = {}
+            for record in batch:
+                _merge_span(spans, record["fighter_id"], record["event_date"])
+                _merge_span(spans, record["opponent_id"], record["event_date"])
+            await self.update_spans(spans)
+            rows += len(batch)
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"bouts: {rows} rows ({rows / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+        await self.db.commit()
+        return rows
+
+    async def get_fighter_bouts(
+        self,
+        fighter_id: int,
+        limit: int,
+        offset: int = 0,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Read a fighter's bouts from their point of view, most recent first.
+
+        The date bounds come from `fighter_bout_spans` through sub-queries, so
+        PostgreSQL prunes the partitions outside the fighter's career when the
+        query starts.
+
+        Args:
+            fighter_id (int): Fighter ID.
+            limit (int): Maximum number of bouts to return.
+            offset (int): Number of bouts to skip.
+            start (date | None): Optional earliest event date (inclusive).
+            end (date | None): Optional latest event date (inclusive).
+
+        Returns:
+            list[dict]: Bouts with the opponent ID and the result for `fighter_id`.
+
+        Raises:
+            NotFoundException: If the fighter does not exist.
+        """
+        span = select(FighterBoutSpans).where(FighterBoutSpans.fighter_id == fighter_id)
+        first = span.with_only_columns(FighterBoutSpans.first_bout_date)
+        last = span.with_only_columns(FighterBoutSpans.last_bout_date)
+        is_fighter = Bouts.fighter_id == fighter_id
+        stmt = select(
+            *BOUT_COLUMNS,
+            case((is_fighter, Bouts.opponent_id), else_=Bouts.fighter_id).label(
+                "opponent_id"
+            ),
+            case(
+                (is_fighter, Bouts.result),
+                (Bouts.result == "win", "loss"),
+                (Bouts.result == "loss", "win"),
+                else_=Bouts.result,
+            ).label("result"),
+        ).where(
+            or_(is_fighter, Bouts.opponent_id == fighter_id),
+            Bouts.event_date >= first.scalar_subquery(),
+            Bouts.event_date <= last.scalar_subquery(),
+        )
+        if start is not None:
+            stmt = stmt.where(Bouts.event_date >= start)
+        if end is not None:
+            stmt = stmt.where(Bouts.event_date <= end)
+        result = await self.db.execute(
+            stmt.order_by(Bouts.event_date.desc(), Bouts.bout_id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        bouts = [dict(row) for row in result.mappings().all()]
+        if not bouts:
+            found = await self.db.execute(
+                select(Fighters.fighter_id).where(Fighters.fighter_id == fighter_id)
+            )
+            if found.scalar_one_or_none() is None:
+                raise NotFoundException(f"Fighter {fighter_id} not found")
+        return bouts
+
+    async def get_bouts(
+        self, start: date, end: date, limit: int, offset: int = 0
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Read the bouts of a date range in chronological order.
+
+        Args:
+            start (date): Earliest event date (inclusive).
+            end (date): Latest event date (inclusive).
+            limit (int): Maximum number of bouts to return.
+            offset (int): Number of bouts to skip.
+
+        Returns:
+            list[dict]: Bouts with both fighter IDs and the result for `fighter_id`.
+        """
+        result = await self.db.execute(
+            select(*BOUT_COLUMNS, Bouts.fighter_id, Bouts.opponent_id, Bouts.result)
+            .where(Bouts.event_date >= start, Bouts.event_date <= end)
+            .order_by(Bouts.event_date, Bouts.bout_id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return [dict(row) for row in result.mappings().all()]
@@ -0,0 +1,389 @@
+import typing
+
+from sqlalchemy import Integer, String, func, insert, select, tuple_, update
+from sqlalchemy import column as values_column
+from sqlalchemy import values as values_clause
+from sqlalchemy.exc import IntegrityError
+
+from app.db.models import BaseStats, ExtendedStats, FightsResults
+from app.db.models.fighters import Fighters
+from app.schemas.extended_fighter import ExtendedFighterFilter, ExtendedFighterUpdate
+from app.schemas.fighter import FighterFilter, FighterUpdate
+from app.services.fighters.fighter_utils import FighterUtils
+from app.tools.exceptions.custom_api_exceptions import BadRequestException
+from app.tools.logger import logger
+
+CHILD_MODELS = {
+    "base_stats": BaseStats,
+    "extended_stats": ExtendedStats,
+    "fights_results": FightsResults,
+}
+TABLE_MODELS = {"fighters": Fighters, **CHILD_MODELS}
+KEY_COLUMNS = ("name", "nickname", "surname")
+MAX_INT4 = 2**31 - 1
+
+# (name, nickname, surname) tuples per existence check; 3 bind parameters each
+EXISTING_KEYS_CHUNK = 5000
+
+# PostgreSQL's limit on bind parameters in one statement
+MAX_BIND_PARAMS = 32767
+
+
+def _insert_columns(model: typing.Type) -> typing.List[typing.Any]:
+    """
+    List the columns a bulk insert provides values for.
+
+    `fighter_id` is generated (or taken from the parent) and `last_updated`
+    keeps its column default.
+
+    Args:
+        model (Type): ORM model class.
+
+    Returns:
+        list: SQLAlchemy Column objects.
+    """
+    return [
+        column
+        for column in model.__table__.columns
+        if column.name not in ("fighter_id", "last_updated")
+    ]
+
+
+INSERT_COLUMNS = {model: _insert_columns(model) for model in TABLE_MODELS.values()}
+
+
+class FighterBulkWriter(FighterUtils):
+    """
+    Bulk ingestion engine for the `/multiple` endpoints.
+
+    Fighters are inserted with multi-row `INSERT ... RETURNING fighter_id`
+    statements and the child stats tables are then filled in bulk using the
+    returned IDs, instead of one ORM flush per row and table. Rows that would
+    fail (too long strings, out of range integers, duplicate names) are
+    rejected up front and reported individually, so the valid rows of a
+    request are still inserted.
+
+    Batch updates run one `UPDATE ... FROM (VALUES ...)` per table instead of
+    a locked read, flush and refresh per fighter.
+
+    Inherits from:
+        FighterUtils: Provides shared database access utilities.
+    """
+
+    @staticmethod
+    def _row_error(
+        model: typing.Type, values: typing.Dict[str, typing.Any]
+    ) -> str | None:
+        """
+        Check a row against the column types of its table.
+
+        Args:
+            model (Type): ORM model class the row is inserted into.
+            values (Dict[str, Any]): Column values.
+
+        Returns:
+            str | None: Description of the first problem found, None if the row is valid.
+        """
+        for column in INSERT_COLUMNS[model]:
+            value = values.get(column.name)
+            if value is None:
+                continue
+            if isinstance(column.type, String) and column.type.length:
+                if len(value) > column.type.length:
+                    return (
+                        f"{column.name} is longer than {column.type.length} characters"
+                    )
+            if (
+                isinstance(column.type, Integer)
+                and not -MAX_INT4 - 1 <= value <= MAX_INT4
+            ):
+                return f"{column.name} is out of range"
+        return None
+
+    def _prepare_rows(
+        self, fighters_data: typing.List[FighterFilter | ExtendedFighterFilter]
+    ) -> typing.Tuple[
+        typing.Dict[int, typing.Dict[str, typing.Any]], typing.Dict[int, str]
+    ]:
+        """
+        Turn request items into table rows and reject invalid ones.
+
+        Args:
+            fighters_data (list[FighterFilter | ExtendedFighterFilter]): Fighters to insert.
+
+        Returns:
+            tuple: (rows by request index, error message by request index)
+        """
+        rows: typing.Dict[int, typing.Dict[str, typing.Any]] = {}
+        errors: typing.Dict[int, str] = {}
+        seen_keys: typing.Dict[tuple, int] = {}
+
+        for index, fighter_data in enumerate(fighters_data):
+            data = fighter_data.model_dump()
+            row = {
+                "fighters": {
+                    column.name: data.get(column.name)
+                    for column in INSERT_COLUMNS[Fighters]
+                }
+            }
+            if self.is_extended:
+                for relation, model in CHILD_MODELS.items():
+                    if data.get(relation) is not None:
+                        row[relation] = {
+                            column.name: data[relation].get(column.name)
+                            for column in INSERT_COLUMNS[model]
+                        }
+
+            error = None
+            for relation, values in row.items():
+                error = self._row_error(TABLE_MODELS[relation], values)
+                if error is not None:
+                    break
+            key = tuple(row["fighters"][column] for column in KEY_COLUMNS)
+            # NULLs never collide in the unique constraint
+            if error is None and None not in key:
+                if key in seen_keys:
+                    error = f"Duplicate of item {seen_keys[key]} in this request"
+                else:
+                    seen_keys[key] = index
+
+            if error is None:
+                rows[index] = row
+            else:
+                errors[index] = error
+        return rows, errors
+
+    async def _existing_keys(self, keys: typing.List[tuple]) -> typing.Set[tuple]:
+        """
+        Find which (name, nickname, surname) keys are already taken.
+
+        Args:
+            keys (list[tuple]): Candidate keys without NULL parts.
+
+        Returns:
+            set[tuple]: Keys that already exist in the fighters table.
+        """
+        key_columns = tuple_(*(getattr(Fighters, column) for column in KEY_COLUMNS))
+        existing = set()
+        for start in range(0, len(keys), EXISTING_KEYS_CHUNK):
+            result = await self.db.execute(
+                select(*key_columns.clauses).where(
+                    key_columns.in_(keys[start : start + EXISTING_KEYS_CHUNK])
+                )
+            )
+            existing.update(tuple(row) for row in result.all())
+        return existing
+
+    async def _insert_rows(
+        self, rows: typing.Dict[int, typing.Dict[str, typing.Any]]
+    ) -> typing.Dict[int, int]:
+        """
+        Insert fighters and their stats in bulk, without committing.
+
+        Args:
+            rows (Dict[int, Dict[str, Any]]): Rows by request index.
+
+        Returns:
+            Dict[int, int]: New fighter ID by request index.
+        """
+        indexes = list(rows)
+        result = await self.db.execute(
+            insert(Fighters).returning(
+                Fighters.fighter_id, sort_by_parameter_order=True
+            ),
+            [rows[index]["fighters"] for index in indexes],
+        )
+        fighter_ids = dict(zip(indexes, result.scalars().all()))
+
+        for relation, model in CHILD_MODELS.items():
+            child_rows = [
+                {"fighter_id": fighter_ids[index], **row[relation]}
+                for index, row in rows.items()
+                if relation in row
+            ]
+            if child_rows:
+                await self.db.execute(insert(model), child_rows)
+        return fighter_ids
+
+    async def insert_fighters(
+        self, fighters_data: typing.List[FighterFilter | ExtendedFighterFilter]
+    ) -> typing.Tuple[
+        typing.List[typing.Dict[str, typing.Any]],
+        typing.List[typing.Dict[str, typing.Any]],
+    ]:
+        """
+        Insert many fighters at once, reporting success or failure per item.
+
+        The caller owns the transaction and must commit.
+
+        Args:
+            fighters_data (list[FighterFilter | ExtendedFighterFilter]): Fighters to insert.
+
+        Returns:
+            tuple: (one result dict per request item, flat records of the inserted fighters)
+        """
+        rows, errors = self._prepare_rows(fighters_data)
+
+        # a concurrent insert can take a name between the check and the insert;
+        # the savepoint lets the batch be re-checked and retried once
+        for attempt in range(2):
+            keys = [
+                key
+                for key in (
+                    tuple(row["fighters"][column] for column in KEY_COLUMNS)
+                    for row in rows.values()
+                )
+                if None not in key
+            ]
+            existing = await self._existing_keys(keys)
+            for index in list(rows):
+                key = tuple(rows[index]["fighters"][column] for column in KEY_COLUMNS)
+                if key in existing:
+                    errors[index] = "Fighter already exists"
+                    del rows[index]
+
+            if not rows:
+                fighter_ids = {}
+                break
+            try:
+                async with self.db.begin_nested():
+                    fighter_ids = await self._insert_rows(rows)
+                break
+            except IntegrityError:
+                if attempt:
+                    raise
+                logger.warning(
+                    "Bulk insert conflicted with a concurrent write, retrying"
+                )
+
+        logger.info(
+            f"Bulk inserted {len(fighter_ids)} fighters, rejected {len(errors)}"
+        )
+        results = [
+            (
+                {"index": index, "success": True, "fighter_id": fighter_ids[index]}
+                if index in fighter_ids
+                else {"index": index, "success": False, "error": errors[index]}
+            )
+            for index in range(len(fighters_data))
+        ]
+        flat_records = [
+            {
+                "fighter_id": fighter_ids[index],
+                **{
+                    name: value
+                    for relation, values in rows[index].items()
+                    for name, value in values.items()
+                },
+            }
+            for index in fighter_ids
+        ]
+        return results, flat_records
+
+    async def _update_table(
+        self, model: typing.Type, rows: typing.Dict[int, typing.Dict[str, typing.Any]]
+    ) -> typing.Set[int]:
+        """
+        Apply partial updates to one table with `UPDATE ... FROM (VALUES ...)`.
+
+        Columns missing from a row keep their value. Rows are sent in chunks
+        that stay under the bind parameter limit.
+
+        Args:
+            model (Type): ORM model class of the table.
+            rows (Dict[int, Dict[str, Any]]): New column values by fighter ID.
+
+        Returns:
+            set[int]: IDs of the fighters that have a row in the table.
+        """
+        table = model.__table__
+        fighter_ids = sorted(rows)
+        columns = [
+            table_column
+            for table_column in INSERT_COLUMNS[model]
+            if any(table_column.name in rows[fighter_id] for fighter_id in fighter_ids)
+        ]
+        chunk_size = MAX_BIND_PARAMS // (len(columns) + 1)
+        updated = set()
+
+        for start in range(0, len(fighter_ids), chunk_size):
+            chunk = fighter_ids[start : start + chunk_size]
+            # a VALUES column without any typed value would be resolved as text
+            chunk_columns = [
+                table_column
+                for table_column in columns
+                if any(table_column.name in rows[fighter_id] for fighter_id in chunk)
+            ]
+            new_values = values_clause(
+                values_column("fighter_id", Integer),
+                *(values_column(c.name, c.type) for c in chunk_columns),
+                name="new_values",
+            ).data(
+                [
+                    (fighter_id, *(rows[fighter_id].get(c.name) for c in chunk_columns))
+                    for fighter_id in chunk
+                ]
+            )
+            result = await self.db.execute(
+                update(table)
+                .values(
+                    {
+                        c.name: func.coalesce(new_values.c[c.name], c)
+                        for c in chunk_columns
+                    }
+                )
+                .where(table.c.fighter_id == new_values.c.fighter_id)
+                .returning(table.c.fighter_id)
+            )
+            updated.update(result.scalars().all())
+        return updated
+
+    async def update_fighters(
+        self, updates: typing.List[FighterUpdate | ExtendedFighterUpdate]
+    ) -> typing.List[int]:
+        """
+        Apply many partial fighter updates, without committing.
+
+        Later items for the same fighter override earlier ones field by field.
+
+        Args:
+            updates (list[FighterUpdate | ExtendedFighterUpdate]): Updates to apply.
+
+        Returns:
+            list[int]: Sorted IDs of the fighters that exist and were updated.
+
+        Raises:
+            BadRequestException: If an item holds a value its column cannot store.
+        """
+        rows: typing.Dict[str, typing.Dict[int, typing.Dict[str, typing.Any]]] = {
+            relation: {} for relation in TABLE_MODELS
+        }
+        for index, item in enumerate(updates):
+            data = item.model_dump(exclude_none=True)
+            fighter_id = data.pop("fighter_id")
+            sections = {
+                "fighters": {
+                    key: value for key, value in data.items() if key not in CHILD_MODELS
+                }
+            }
+            if self.is_extended:
+                sections.update(
+                    (relation, data[relation])
+                    for relation in CHILD_MODELS
+                    if relation in data
+                )
+            for relation, section in sections.items():
+                error = self._row_error(TABLE_MODELS[relation], section)
+                if error is not None:
+                    raise BadRequestException(f"Item {index}: {error}")
+                if section:
+                    rows[relation].setdefault(fighter_id, {}).update(section)
+
+        updated = set()
+        for relation, table_rows in rows.items():
+            if table_rows:
+                updated.update(
+                    await self._update_table(TABLE_MODELS[relation], table_rows)
+                )
+        logger.info(f"Batch updated {len(updated)} of {len(updates)} fighters")
+        return sorted(updated)
@@ -0,0 +1,375 @@
+import hashlib
+import inspect
+import json
+import os
+import typing
+from functools import wraps
+
+from pydantic import BaseModel
+from sqlalchemy import literal_column
+
+from app.db.redis_client import get_redis
+from app.tools.logger import logger
+
+CACHE_TTL_SECONDS: int = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+CACHE_PREFIX = "fighter_cache"
+
+# Tags invalidated on writes that can change which fighters a query returns.
+SEARCH_TAG = "search"
+RANKING_TAG = "ranking"
+GROUPS_TAG = "groups"
+
+
+def fighter_tag(fighter_id: typing.Any) -> str:
+    """Tag shared by every cached entry that contains the given fighter."""
+    return f"fighter:{fighter_id}"
+
+
+def country_tag(country: typing.Any) -> str:
+    """Tag shared by every cached entry that depends on the given country."""
+    return f"country:{country}"
+
+
+def weight_class_tag(weight_class: typing.Any) -> str:
+    """Tag shared by every cached entry that depends on the given weight class."""
+    return f"weight_class:{weight_class}"
+
+
+def _normalize_arg(value: typing.Any) -> typing.Any:
+    """
+    Convert a method argument into a stable, JSON-serializable form.
+
+    Args:
+        value (Any): Argument value (scalar, Pydantic filter or SQL function generator).
+
+    Returns:
+        Any: JSON-serializable representation.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", exclude_none=True)
+    if callable(value):
+        # SQLAlchemy function generators such as func.avg render as "avg(_)"
+        return str(value(literal_column("_")))
+    return value
+
+
+class CacheStats:
+    """
+    Counters describing cache effectiveness.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to query the database.
+        invalidations (int): Cache entries removed by write-driven invalidation.
+        errors (int): Backend failures, each treated as a miss.
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+
+
+class FighterCache:
+    """
+    Read-through cache for `FighterGetter` queries with tag-based invalidation.
+
+    Entries are keyed on method name, base/extended mode and normalized
+    arguments. Every entry is registered in tag sets (fighter, country,
+    weight class, ...) so `FighterUpdater` writes can drop exactly the entries
+    they affect.
+    """
+
+    def __init__(self, ttl: int = CACHE_TTL_SECONDS) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl (int): Time to live of cache entries and tag sets, in seconds.
+        """
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @staticmethod
+    def build_key(method: str, is_extended: bool, arguments: typing.Dict) -> str:
+        """
+        Build the cache key for a method call.
+
+        Args:
+            method (str): Name of the cached method.
+            is_extended (bool): Whether the call used the extended schema.
+            arguments (Dict): Bound call arguments, excluding `self`.
+
+        Returns:
+            str: Cache key.
+        """
+        normalized = json.dumps(
+            {name: _normalize_arg(value) for name, value in arguments.items()},
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha1(normalized.encode()).hexdigest()
+        mode = "extended" if is_extended else "base"
+        return f"{CACHE_PREFIX}:{mode}:{method}:{digest}"
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        """Return the Redis key of a tag set."""
+        return f"{CACHE_PREFIX}:tag:{tag}"
+
+    @staticmethod
+    def _to_schema(result: typing.Any, schema: typing.Type[BaseModel]) -> typing.Any:
+        """
+        Convert a query result to the form a cache hit returns.
+
+        Args:
+            result (Any): Single record, list of records or list of row mappings.
+            schema (Type[BaseModel]): Schema used to validate ORM objects.
+
+        Returns:
+            Any: Schema instances for records and dictionaries for row mappings.
+        """
+
+        def convert(item: typing.Any) -> typing.Any:
+            if item is None or isinstance(item, BaseModel):
+                return item
+            if isinstance(item, typing.Mapping):
+                return dict(item)
+            return schema.model_validate(item)
+
+        if isinstance(result, (list, tuple)):
+            return [convert(item) for item in result]
+        return convert(result)
+
+    @staticmethod
+    def _serialize(result: typing.Any, schema: typing.Type[BaseModel]) -> str:
+        """
+        Serialize a query result into JSON.
+
+        Args:
+            result (Any): Single record, list of records or list of row mappings.
+            schema (Type[BaseModel]): Schema used to dump ORM objects.
+
+        Returns:
+            str: JSON payload.
+        """
+
+        def dump(item: typing.Any) -> typing.Any:
+            if isinstance(item, BaseModel):
+                return item.model_dump(mode="json")
+            if isinstance(item, typing.Mapping):
+                return dict(item)
+            return schema.model_validate(item).model_dump(mode="json")
+
+        many = isinstance(result, (list, tuple))
+        records = list(result) if many else [result]
+        rows = bool(records) and all(
+            isinstance(record, typing.Mapping) for record in records
+        )
+        return json.dumps(
+            {"many": many, "rows": rows, "items": [dump(r) for r in records]},
+            default=str,
+        )
+
+    @staticmethod
+    def _deserialize(payload: str, schema: typing.Type[BaseModel]) -> typing.Any:
+        """
+        Rebuild a query result from its JSON payload.
+
+        Args:
+            payload (str): JSON produced by `_serialize`.
+            schema (Type[BaseModel]): Schema used to validate fighter records.
+
+        Returns:
+            Any: Single record, list of records or list of row dictionaries.
+        """
+        data = json.loads(payload)
+        items = (
+            data["items"]
+            if data["rows"]
+            else [schema.model_validate(item) for item in data["items"]]
+        )
+        return items if data["many"] else items[0]
+
+    @staticmethod
+    def _result_tags(result: typing.Any) -> typing.List[str]:
+        """
+        Derive fighter tags from the records contained in a result.
+
+        Args:
+            result (Any): Single record or list of records.
+
+        Returns:
+            list[str]: One fighter tag per record carrying a fighter_id.
+        """
+        items = result if isinstance(result, (list, tuple)) else [result]
+        tags = []
+        for item in items:
+            fighter_id = (
+                item.get("fighter_id")
+                if isinstance(item, typing.Mapping)
+                else getattr(item, "fighter_id", None)
+            )
+            if fighter_id is not None:
+                tags.append(fighter_tag(fighter_id))
+        return tags
+
+    async def get(self, key: str, schema: typing.Type[BaseModel]) -> typing.Any:
+        """
+        Look up a cached result.
+
+        Args:
+            key (str): Cache key.
+            schema (Type[BaseModel]): Schema used to rebuild fighter records.
+
+        Returns:
+            Any: Cached result, or None on a miss.
+        """
+        try:
+            payload = await get_redis().get(key)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Cache lookup failed: {e}")
+            payload = None
+
+        if payload is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return self._deserialize(payload, schema)
+
+    async def set(
+        self,
+        key: str,
+        result: typing.Any,
+        schema: typing.Type[BaseModel],
+        tags: typing.Iterable[str],
+    ) -> None:
+        """
+        Store a result and register it in its tag sets.
+
+        Args:
+            key (str): Cache key.
+            result (Any): Query result to store.
+            schema (Type[BaseModel]): Schema used to dump ORM objects.
+            tags (Iterable[str]): Tags the entry depends on.
+        """
+        try:
+            # one round trip however many tags the entry has
+            pipe = get_redis().pipeline(transaction=False)
+            pipe.set(key, self._serialize(result, schema), ex=self.ttl)
+            for tag in {*tags, *self._result_tags(result)}:
+                pipe.sadd(self._tag_key(tag), key)
+                pipe.expire(self._tag_key(tag), self.ttl)
+            await pipe.execute()
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Cache store failed: {e}")
+
+    async def invalidate(self, tags: typing.Iterable[str]) -> int:
+        """
+        Remove every cache entry registered under any of the given tags.
+
+        Args:
+            tags (Iterable[str]): Tags affected by a write.
+
+        Returns:
+            int: Number of cache entries removed.
+        """
+        client = get_redis()
+        tag_keys = [self._tag_key(tag) for tag in set(tags)]
+        removed = 0
+        try:
+            if tag_keys:
+                pipe = client.pipeline(transaction=False)
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                members = await pipe.execute()
+                keys = set().union(*members)
+                # empty tag sets do not exist, so every other deleted key is an entry
+                deleted = await client.delete(*keys, *tag_keys)
+                removed = deleted - sum(1 for tag_members in members if tag_members)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Cache invalidation failed: {e}")
+
+        self.stats.invalidations += removed
+        if removed:
+            logger.info(f"Invalidated {removed} cache entries")
+        return removed
+
+    async def get_stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return hit/miss/invalidation counters and backend eviction count.
+
+        Returns:
+            Dict[str, Any]: Cache statistics.
+        """
+        try:
+            evictions = int((await get_redis().info("stats")).get("evicted_keys", 0))
+        except Exception as e:
+            logger.warning(f"Cache stats unavailable: {e}")
+            evictions = None
+
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_ratio": round(self.stats.hits / lookups, 4) if lookups else None,
+            "invalidations": self.stats.invalidations,
+            "evictions": evictions,
+            "errors": self.stats.errors,
+        }
+
+    def cached(
+        self,
+        tags: typing.Callable[
+            [typing.Dict[str, typing.Any], typing.Any], typing.Iterable[str]
+        ] = lambda arguments, result: (),
+    ) -> typing.Callable:
+        """
+        Decorator caching the result of a `FighterGetter` method.
+
+        Args:
+            tags (Callable[[Dict[str, Any], Any], Iterable[str]]): Receives the bound
+                call arguments (without `self`) and the result, and returns the
+                entry's tags. One fighter tag per returned record is always added.
+
+        Returns:
+            Callable: Decorator for async methods of `FighterUtils` subclasses.
+        """
+
+        def decorator(
+            func: typing.Callable[..., typing.Awaitable[typing.Any]],
+        ) -> typing.Callable[..., typing.Awaitable[typing.Any]]:
+            signature = inspect.signature(func)
+
+            @wraps(func)
+            async def wrapper(instance, *args, **kwargs) -> typing.Any:
+                bound = signature.bind(instance, *args, **kwargs)
+                bound.apply_defaults()
+                arguments = dict(bound.arguments)
+                arguments.pop("self")
+
+                key = self.build_key(func.__name__, instance.is_extended, arguments)
+                cached = await self.get(key, instance.fighter_schema)
+                if cached is not None:
+                    return cached
+
+                # same types as a cache hit, e.g. schemas rather than ORM rows
+                result = self._to_schema(
+                    await func(instance, *args, **kwargs), instance.fighter_schema
+                )
+                await self.set(
+                    key, result, instance.fighter_schema, tags(arguments, result)
+                )
+                return result
+
+            return wrapper
+
+        return decorator
+
+
+fighter_cache = FighterCache()
@@ -0,0 +1,104 @@
+import typing
+
+from sqlalchemy import Float, Integer, any_, bindparam, cast, delete, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import DerivedStats, ExtendedStats, FightsResults
+from app.db.models.fighters import Fighters
+from app.services.fighters.fighter_utils import STATS_FROM
+from app.tools.logger import logger
+
+# SQL definition of every derived column; NULL when an input is NULL or the
+# denominator is zero.
+DERIVED_EXPRESSIONS = {
+    "win_percentage": 100.0
+    * cast(Fighters.wins, Float)
+    / func.nullif(Fighters.wins + Fighters.loss + func.coalesce(Fighters.draw, 0), 0),
+    "finish_rate": cast(FightsResults.win_by_ko_tko + FightsResults.win_by_sub, Float)
+    / func.nullif(Fighters.wins, 0),
+    "striking_differential": ExtendedStats.slpm - ExtendedStats.sapm,
+}
+DERIVED_COLUMNS = tuple(DERIVED_EXPRESSIONS)
+
+
+class DerivedStatsStore:
+    """
+    Maintains the `fighter_derived_stats` table.
+
+    The derived columns are computed by PostgreSQL from DERIVED_EXPRESSIONS,
+    so every writer uses the same definition. `FighterUpdater` refreshes the
+    written fighters in the same transaction as the write; fighters deleted
+    from `fighters` lose their row through the foreign key cascade.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+        """
+        self.db = db
+
+    @staticmethod
+    def _select() -> typing.Any:
+        """Build the SELECT computing the derived columns of every fighter."""
+        return select(
+            Fighters.fighter_id,
+            *(
+                expression.label(name)
+                for name, expression in DERIVED_EXPRESSIONS.items()
+            ),
+        ).select_from(STATS_FROM)
+
+    async def refresh(self, records: typing.List[typing.Dict[str, typing.Any]]) -> None:
+        """
+        Recompute the derived stats of written fighters without committing.
+
+        The new values are also set on `records`, so the leaderboards, the
+        group summary and the prediction features see them.
+
+        Args:
+            records (list[dict]): Flat records of the inserted or updated fighters.
+        """
+        if not records:
+            return
+        fighter_ids = [record["fighter_id"] for record in records]
+        stmt = insert(DerivedStats).from_select(
+            ["fighter_id", *DERIVED_COLUMNS],
+            # sorted so concurrent writers lock rows in the same order
+            self._select()
+            .where(
+                Fighters.fighter_id
+                == any_(bindparam("fighter_ids", fighter_ids, type_=ARRAY(Integer)))
+            )
+            .order_by(Fighters.fighter_id),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DerivedStats.fighter_id],
+            set_={name: getattr(stmt.excluded, name) for name in DERIVED_COLUMNS},
+        ).returning(
+            DerivedStats.fighter_id,
+            *(getattr(DerivedStats, name) for name in DERIVED_COLUMNS),
+        )
+        result = await self.db.execute(stmt)
+        derived = {row["fighter_id"]: row for row in result.mappings().all()}
+        for record in records:
+            row = derived.get(record["fighter_id"])
+            if row is not None:
+                record.update({name: row[name] for name in DERIVED_COLUMNS})
+
+    async def rebuild(self) -> None:
+        """
+        Recompute the derived stats of every fighter without committing.
+
+        Used after bulk loads that bypass `FighterUpdater`, e.g. seeding.
+        """
+        await self.db.execute(delete(DerivedStats))
+        await self.db.execute(
+            insert(DerivedStats).from_select(
+                ["fighter_id", *DERIVED_COLUMNS], self._select()
+            )
+        )
+        logger.info("Rebuilt fighter derived statistics")
@@ -1,8 +1,24 @@
 import typing
 
+from sqlalchemy import func, select
+
+from app.constants import STREAM_CHUNK_SIZE
+from app.db.models.fighters import Fighters
 from app.schemas.fighter import FighterFilter
+from app.services.fighters.fighter_cache import (
+    GROUPS_TAG,
+    RANKING_TAG,
+    SEARCH_TAG,
+    country_tag,
+    fighter_cache,
+)
+from app.services.fighters.fighter_group_stats import FighterGroupStatsSummary
+from app.services.fighters.fighter_leaderboard import fighter_leaderboard
 from app.services.fighters.fighter_utils import FighterUtils
+from app.services.predictions.fight_predictor import fight_predictor
+from app.services.predictions.similarity_index import similarity_index
 from app.tools.logger import logger
+from app.tools.utils import decode_after_id, decode_offset, encode_cursor
 
 
 class FighterGetter(FighterUtils):
@@ -26,6 +42,48 @@ class FighterGetter(FighterUtils):
             self.fighter_schema.model_validate(row) for row in records.scalars().all()
         ]
 
+    async def get_fighters_page(
+        self, cursor: str | None, page_size: int
+    ) -> typing.Tuple[typing.List[typing.Any], str | None]:
+        """
+        Retrieve one keyset-paginated page of fighter records.
+
+        Args:
+            cursor (str | None): Cursor token returned with the previous page, None for the first page.
+            page_size (int): Maximum number of records to return.
+
+        Returns:
+            tuple: (list of validated records, cursor for the next page or None)
+        """
+        after_id = decode_after_id(cursor)
+
+        page, last_id = await self._get_records_page([], after_id, page_size)
+        logger.info(
+            f"Returning page of {self.fighter_schema.__name__} after id {after_id}"
+        )
+        next_cursor = encode_cursor({"after": last_id}) if last_id is not None else None
+        return page, next_cursor
+
+    async def stream_all_fighters_records(
+        self, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> typing.AsyncIterator[str]:
+        """
+        Stream all fighter records as newline-delimited JSON.
+
+        Rows are read through a server-side cursor, so memory use depends on
+        `chunk_size` rather than on the size of the table.
+
+        Args:
+            chunk_size (int): Number of rows fetched and serialized per chunk.
+
+        Yields:
+            str: NDJSON fragment containing one serialized chunk of fighters.
+        """
+        logger.info(f"Streaming contents of {self.fighter_schema.__name__}")
+        async for chunk in self._stream_records([], chunk_size):
+            yield "".join(f"{fighter.model_dump_json()}\n" for fighter in chunk)
+
+    @fighter_cache.cached()
     async def get_fighter_by_id(self, fighter_id: int) -> typing.Any:
         """
         Retrieve a fighter by their unique ID.
@@ -38,6 +96,46 @@ class FighterGetter(FighterUtils):
         """
         return await self._get_records_by_single_value("fighter_id", fighter_id)
 
+    async def get_similar_fighters(
+        self, fighter_id: int, k: int, same_weight_class: bool = False
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Retrieve the fighters whose base and extended stats are closest to a fighter's.
+
+        Neighbours come from the in-memory `similarity_index`; only their names
+        are read from the database.
+
+        Args:
+            fighter_id (int): The unique identifier of the fighter.
+            k (int): Number of similar fighters to return.
+            same_weight_class (bool): Only return fighters of the same weight class.
+
+        Returns:
+            list[dict]: Similar fighters with names, weight class and distance, closest first.
+        """
+        await fight_predictor.ensure_ready(self.db)
+        similarity_index.sync(fight_predictor.matrix)
+        neighbours = similarity_index.nearest(fighter_id, k, same_weight_class)
+        result = await self.db.execute(
+            select(
+                Fighters.fighter_id,
+                Fighters.name,
+                Fighters.nickname,
+                Fighters.surname,
+            ).where(
+                Fighters.fighter_id.in_(
+                    [neighbour["fighter_id"] for neighbour in neighbours]
+                )
+            )
+        )
+        names = {row["fighter_id"]: dict(row) for row in result.mappings().all()}
+        logger.info(f"Returning {len(neighbours)} fighters similar to {fighter_id}")
+        return [
+            {**names.get(neighbour["fighter_id"], {}), **neighbour}
+            for neighbour in neighbours
+        ]
+
+    @fighter_cache.cached(lambda args, result: [country_tag(args["country"])])
     async def get_fighters_by_country(self, country: str) -> typing.List[typing.Any]:
         """
         Retrieve all fighters belonging to a specific country.
@@ -50,6 +148,7 @@ class FighterGetter(FighterUtils):
         """
         return await self._get_records_by_single_value("country", country)
 
+    @fighter_cache.cached(lambda args, result: [SEARCH_TAG])
     async def search_extended_fighter(
         self, fighter_filters: FighterFilter
     ) -> typing.List[typing.Any]:
@@ -65,3 +164,116 @@ class FighterGetter(FighterUtils):
         return await self._get_records_with_where_stmt(
             self.build_where_stmt(fighter_filters)
         )
+
+    @fighter_cache.cached(lambda args, result: [RANKING_TAG])
+    async def get_fighters_by_param_with_limit(
+        self,
+        param_name: str,
+        limit: int,
+        order: str = "desc",
+        offset: int = 0,
+        weight_class: str | None = None,
+    ) -> typing.List[typing.Any]:
+        """
+        Retrieve fighters ordered by a specific parameter, served through the cache.
+
+        Args:
+            param_name (str): Column to sort by.
+            limit (int): Maximum number of records to return.
+            order (str): Sort order ('asc' or 'desc').
+            offset (int): Number of leading records to skip.
+            weight_class (str | None): Optional weight class to restrict the ranking to.
+
+        Returns:
+            list[Any]: Top fighters ordered by the given column.
+        """
+        return await super().get_fighters_by_param_with_limit(
+            param_name, limit, order, offset, weight_class
+        )
+
+    async def get_top_fighters(
+        self,
+        param_name: str,
+        limit: int,
+        cursor: str | None = None,
+        offset: int = 0,
+        weight_class: str | None = None,
+        order: str = "desc",
+    ) -> typing.Tuple[typing.List[typing.Any], str | None]:
+        """
+        Retrieve one page of a leaderboard.
+
+        Ranks come from the Redis sorted-set leaderboards and the fighters are
+        fetched in one batched query; while the leaderboards are not built the
+        page is computed with ORDER BY in PostgreSQL instead.
+
+        Args:
+            param_name (str): Column to rank by.
+            limit (int): Maximum number of fighters on the page.
+            cursor (str | None): Cursor token returned with the previous page; overrides `offset`.
+            offset (int): Rank of the first fighter on the page (0-based).
+            weight_class (str | None): Optional weight class to restrict the ranking to.
+            order (str): Sort order ('asc' or 'desc').
+
+        Returns:
+            tuple: (fighters in rank order, cursor for the next page or None)
+        """
+        offset = decode_offset(cursor, offset)
+        fighter_ids = await fighter_leaderboard.get_ranked_ids(
+            param_name, offset, limit + 1, order, weight_class
+        )
+        if fighter_ids is None:
+            fighters = list(
+                await self.get_fighters_by_param_with_limit(
+                    param_name, limit + 1, order, offset, weight_class
+                )
+            )
+        else:
+            fighters = await self._get_records_by_ids(fighter_ids)
+
+        next_cursor = (
+            encode_cursor({"offset": offset + limit}) if len(fighters) > limit else None
+        )
+        return fighters[:limit], next_cursor
+
+    @fighter_cache.cached(
+        lambda args, result: [
+            GROUPS_TAG,
+            *(f"{args['param_name1']}:{row[args['param_name1']]}" for row in result),
+        ]
+    )
+    async def get_grouped_stat(
+        self,
+        param_name1: str,
+        param_name2: str,
+        math_func1,
+        math_func2=func.count,
+        label1: str = "stat",
+        label2: str = "count",
+    ):
+        """
+        Retrieve grouped statistical data for fighters, served through the cache.
+
+        Weight class and country statistics supported by the `fighter_group_stats`
+        summary table are read from it; anything else falls back to a full
+        GROUP BY over the fighter tables. Each cached result is tagged with its
+        group keys (e.g. "country:Poland"), so writes touching a group drop it.
+
+        Args:
+            param_name1 (str): First parameter name (group by column).
+            param_name2 (str): Second parameter name (aggregate column).
+            math_func1: SQL function applied to the second parameter.
+            math_func2: SQL aggregation function (default: func.count).
+            label1 (str): Label for the aggregated value.
+            label2 (str): Label for the count.
+
+        """
+        if FighterGroupStatsSummary.supports(
+            param_name1, param_name2, math_func1, math_func2
+        ):
+            return await FighterGroupStatsSummary(self.db).get_grouped_stat(
+                param_name1, param_name2, math_func1, label1, label2
+            )
+        return await super().get_grouped_stat(
+            param_name1, param_name2, math_func1, math_func2, label1, label2
+        )
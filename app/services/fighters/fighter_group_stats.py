@@ -0,0 +1,263 @@
+import typing
+from collections import defaultdict
+
+from sqlalchemy import delete, func, literal, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import MODELS_LIST
+from app.db.models import FighterGroupStats
+from app.db.models.fighters import Fighters
+from app.services.fighters.fighter_utils import FLAT_FROM
+from app.tools.logger import logger
+
+GROUP_DIMENSIONS = ("weight_class", "country")
+SUMMARY_METRICS = (
+    "wins",
+    "loss",
+    "age",
+    "slpm",
+    "str_acc",
+    "sapm",
+    "str_def",
+    "td_avg",
+    "td_acc",
+    "td_def",
+    "sub_avg",
+    "win_percentage",
+    "finish_rate",
+    "striking_differential",
+)
+SUPPORTED_FUNCTIONS = ("avg", "sum", "count")
+
+# Fighters without a weight class or country are grouped under this key.
+NO_GROUP_KEY = ""
+
+COUNTER_COLUMNS = (
+    "fighters_count",
+    *(f"{metric}_{part}" for metric in SUMMARY_METRICS for part in ("sum", "count")),
+)
+
+
+def _metric_column(metric: str) -> typing.Any:
+    """
+    Find the source column of a summary metric.
+
+    Args:
+        metric (str): Metric name.
+
+    Returns:
+        Any: SQLAlchemy column attribute of the first model defining it.
+    """
+    return next(
+        getattr(model, metric) for model in MODELS_LIST if hasattr(model, metric)
+    )
+
+
+def _function_name(math_func: typing.Callable) -> str:
+    """
+    Return the SQL name of a function generator such as `func.avg`.
+
+    Args:
+        math_func (Callable): SQLAlchemy function generator.
+
+    Returns:
+        str: Lower-case SQL function name.
+    """
+    return math_func(literal_column("_")).name.lower()
+
+
+class FighterGroupStatsSummary:
+    """
+    Maintains and reads the `fighter_group_stats` summary table.
+
+    The table holds one row per (dimension, group key) with running sums and
+    counts, so grouped statistics cost O(groups) to read. `FighterUpdater`
+    applies the contribution of every inserted, updated or deleted fighter in
+    the same transaction as the write.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize the summary service.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+        """
+        self.db = db
+
+    @staticmethod
+    def supports(param_name1: str, param_name2: str, math_func1, math_func2) -> bool:
+        """
+        Check whether a grouped statistic can be answered from the summary table.
+
+        Args:
+            param_name1 (str): Group by column.
+            param_name2 (str): Aggregated column.
+            math_func1: SQL function applied to the aggregated column.
+            math_func2: SQL function used for the group size.
+
+        Returns:
+            bool: True if the summary table holds everything the query needs.
+        """
+        return (
+            param_name1 in GROUP_DIMENSIONS
+            and param_name2 in SUMMARY_METRICS
+            and _function_name(math_func1) in SUPPORTED_FUNCTIONS
+            and _function_name(math_func2) == "count"
+        )
+
+    @staticmethod
+    def _contribution(record: typing.Dict[str, typing.Any]) -> typing.Dict[str, float]:
+        """
+        Compute the counters a single fighter adds to each of its groups.
+
+        Args:
+            record (Dict[str, Any]): Flat fighter record (see `FighterUtils.get_flat_records`).
+
+        Returns:
+            Dict[str, float]: Value per counter column.
+        """
+        contribution = {"fighters_count": 1}
+        for metric in SUMMARY_METRICS:
+            value = record.get(metric)
+            contribution[f"{metric}_sum"] = 0.0 if value is None else float(value)
+            contribution[f"{metric}_count"] = 0 if value is None else 1
+        return contribution
+
+    @classmethod
+    def _deltas(
+        cls,
+        removed: typing.Iterable[typing.Dict[str, typing.Any]],
+        added: typing.Iterable[typing.Dict[str, typing.Any]],
+    ) -> typing.Dict[typing.Tuple[str, str], typing.Dict[str, float]]:
+        """
+        Merge fighter contributions into one counter delta per affected group.
+
+        Args:
+            removed (Iterable[Dict[str, Any]]): Flat records leaving their groups.
+            added (Iterable[Dict[str, Any]]): Flat records entering their groups.
+
+        Returns:
+            Dict[Tuple[str, str], Dict[str, float]]: Non-zero deltas keyed by (dimension, group key).
+        """
+        deltas = defaultdict(lambda: dict.fromkeys(COUNTER_COLUMNS, 0))
+        for sign, records in ((-1, removed), (1, added)):
+            for record in records:
+                contribution = cls._contribution(record)
+                for dimension in GROUP_DIMENSIONS:
+                    delta = deltas[(dimension, record.get(dimension) or NO_GROUP_KEY)]
+                    for column, value in contribution.items():
+                        delta[column] += sign * value
+        return {group: delta for group, delta in deltas.items() if any(delta.values())}
+
+    async def apply(
+        self,
+        removed: typing.Iterable[typing.Dict[str, typing.Any]],
+        added: typing.Iterable[typing.Dict[str, typing.Any]],
+    ) -> None:
+        """
+        Apply a fighter write to the summary table without committing.
+
+        Args:
+            removed (Iterable[Dict[str, Any]]): Flat records before the write (updated or deleted fighters).
+            added (Iterable[Dict[str, Any]]): Flat records after the write (inserted or updated fighters).
+        """
+        deltas = self._deltas(removed, added)
+        if not deltas:
+            return
+
+        # sorted so concurrent writers lock group rows in the same order
+        rows = [
+            {"dimension": dimension, "group_key": key, **delta}
+            for (dimension, key), delta in sorted(deltas.items())
+        ]
+        stmt = insert(FighterGroupStats).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[FighterGroupStats.dimension, FighterGroupStats.group_key],
+            set_={
+                column: getattr(FighterGroupStats, column)
+                + getattr(stmt.excluded, column)
+                for column in COUNTER_COLUMNS
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.execute(
+            delete(FighterGroupStats).where(
+                tuple_(FighterGroupStats.dimension, FighterGroupStats.group_key).in_(
+                    list(deltas)
+                ),
+                FighterGroupStats.fighters_count <= 0,
+            )
+        )
+
+    async def rebuild(self) -> None:
+        """
+        Recompute the whole summary table from the fighter tables without committing.
+
+        Used after bulk loads that bypass `FighterUpdater`, e.g. seeding.
+        """
+        await self.db.execute(delete(FighterGroupStats))
+        for dimension in GROUP_DIMENSIONS:
+            key = func.coalesce(getattr(Fighters, dimension), NO_GROUP_KEY)
+            aggregates = [func.count(Fighters.fighter_id)]
+            for metric in SUMMARY_METRICS:
+                column = _metric_column(metric)
+                aggregates.extend(
+                    (func.coalesce(func.sum(column), 0), func.count(column))
+                )
+            await self.db.execute(
+                insert(FighterGroupStats).from_select(
+                    ["dimension", "group_key", *COUNTER_COLUMNS],
+                    select(literal(dimension), key, *aggregates)
+                    .select_from(FLAT_FROM)
+                    .group_by(key),
+                )
+            )
+        logger.info("Rebuilt fighter group statistics")
+
+    async def get_grouped_stat(
+        self,
+        param_name1: str,
+        param_name2: str,
+        math_func1,
+        label1: str = "stat",
+        label2: str = "count",
+    ):
+        """
+        Retrieve grouped statistical data from the summary table.
+
+        Mirrors `FighterUtils.get_grouped_stat`: one row per group with more
+        than one fighter, ordered by the statistic descending.
+
+        Args:
+            param_name1 (str): Group by column, one of GROUP_DIMENSIONS.
+            param_name2 (str): Aggregated column, one of SUMMARY_METRICS.
+            math_func1: SQL function applied to the aggregated column (avg, sum or count).
+            label1 (str): Label for the aggregated value.
+            label2 (str): Label for the number of fighters in the group.
+
+        """
+        total = getattr(FighterGroupStats, f"{param_name2}_sum")
+        count = getattr(FighterGroupStats, f"{param_name2}_count")
+        stat = {
+            "avg": total / func.nullif(count, 0),
+            "sum": total,
+            "count": count,
+        }[_function_name(math_func1)]
+
+        result = await self.db.execute(
+            select(
+                func.nullif(FighterGroupStats.group_key, NO_GROUP_KEY).label(
+                    param_name1
+                ),
+                stat.label(label1),
+                FighterGroupStats.fighters_count.label(label2),
+            )
+            .where(
+                FighterGroupStats.dimension == param_name1,
+                FighterGroupStats.fighters_count > 1,
+            )
+            .order_by(stat.desc())
+        )
+        return result.mappings().all()
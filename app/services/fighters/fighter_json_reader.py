@@ -0,0 +1,247 @@
+import typing
+
+from pydantic import BaseModel
+from sqlalchemy import Text, case, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from app.db.models.fighters import Fighters
+from app.schemas import ExtendedFighter
+from app.schemas.fighter import FighterFilter
+from app.services.fighters.fighter_utils import FighterUtils
+from app.tools.exceptions.custom_api_exceptions import NotFoundException
+from app.tools.logger import logger
+
+
+def _nested_schema(annotation: typing.Any) -> typing.Type[BaseModel] | None:
+    """
+    Return the schema of a nested section field, e.g. `BaseStats | None`.
+
+    Args:
+        annotation (Any): Field annotation.
+
+    Returns:
+        Type[BaseModel] | None: Nested schema, or None for a plain column field.
+    """
+    for candidate in (annotation, *typing.get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+def _sections(
+    schema: typing.Type[BaseModel],
+) -> typing.Iterator[typing.Tuple[str, typing.Type[BaseModel], typing.Type]]:
+    """
+    Yield the nested sections of a schema with the ORM model of each.
+
+    Args:
+        schema (Type[BaseModel]): Fighter schema.
+
+    Yields:
+        tuple: (field name, nested schema, model of the `Fighters` relationship)
+    """
+    for name, field in schema.model_fields.items():
+        nested = _nested_schema(field.annotation)
+        if nested is not None:
+            yield name, nested, getattr(Fighters, name).property.mapper.class_
+
+
+def _json_object(schema: typing.Type[BaseModel], model: typing.Type) -> typing.Any:
+    """
+    Build a `json_build_object` expression with one key per schema field.
+
+    Keys follow the response schema rather than the table, so the JSON has
+    the same shape as the validated responses of the other endpoints.
+    Nested sections are NULL when the fighter has no matching child row,
+    mirroring the optional fields of the schema.
+
+    Args:
+        schema (Type[BaseModel]): Schema whose fields become the keys.
+        model (Type): ORM model holding the column of each plain field.
+
+    Returns:
+        Any: SQL expression producing one JSON object per row.
+    """
+    sections = {name: (nested, related) for name, nested, related in _sections(schema)}
+    args = []
+    for name in schema.model_fields:
+        if name in sections:
+            nested, related = sections[name]
+            value = case(
+                (related.fighter_id.is_(None), None),
+                else_=_json_object(nested, related),
+            )
+        else:
+            value = getattr(model, name)
+        args.extend((literal(name), value))
+    return func.json_build_object(*args)
+
+
+def _json_from(schema: typing.Type[BaseModel]) -> typing.Any:
+    """
+    Build the FROM clause joining every table a schema's sections read.
+
+    Args:
+        schema (Type[BaseModel]): Fighter schema.
+
+    Returns:
+        Any: `fighters` outer-joined with the model of each section.
+    """
+    joined = Fighters.__table__
+    for _, _, related in _sections(schema):
+        joined = joined.outerjoin(related, Fighters.fighter_id == related.fighter_id)
+    return joined
+
+
+EXTENDED_FIGHTER_JSON = _json_object(ExtendedFighter, Fighters)
+JSON_FROM = _json_from(ExtendedFighter)
+
+
+class FighterJsonReader(FighterUtils):
+    """
+    Read engine returning extended fighters as JSON built entirely by PostgreSQL.
+
+    Each query is a single round trip that returns one text value, so no ORM
+    objects are hydrated and no Pydantic validation runs; the JSON is passed
+    straight through to the client.
+
+    Inherits from:
+        FighterUtils: Provides shared filter-building utilities.
+    """
+
+    @staticmethod
+    def _rows_stmt(where_stmt: list, limit: int | None = None) -> typing.Any:
+        """
+        Build the subquery returning one JSON object per matching fighter.
+
+        Args:
+            where_stmt (list): SQLAlchemy filter expressions.
+            limit (int | None): Optional row limit.
+
+        Returns:
+            Any: Aliased subquery with `fighter_id`, `rn` and `fighter` columns.
+        """
+        stmt = (
+            select(
+                Fighters.fighter_id,
+                func.row_number().over(order_by=Fighters.fighter_id).label("rn"),
+                EXTENDED_FIGHTER_JSON.label("fighter"),
+            )
+            .select_from(JSON_FROM)
+            .where(*where_stmt)
+            .order_by(Fighters.fighter_id)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt.subquery("fighter_rows")
+
+    async def _get_json_array(self, where_stmt: list) -> str:
+        """
+        Retrieve all matching fighters as a JSON array.
+
+        Args:
+            where_stmt (list): SQLAlchemy filter expressions.
+
+        Returns:
+            str: JSON array text.
+
+        Raises:
+            NotFoundException: If no fighter matches.
+        """
+        rows = self._rows_stmt(where_stmt)
+        result = await self.db.execute(
+            select(
+                cast(
+                    func.json_agg(
+                        aggregate_order_by(rows.c.fighter, rows.c.fighter_id)
+                    ),
+                    Text,
+                )
+            )
+        )
+        payload = result.scalar_one()
+        if payload is None:
+            raise NotFoundException
+        return payload
+
+    async def get_fighters_page_json(
+        self, after_id: int | None, page_size: int
+    ) -> typing.Tuple[str, int | None]:
+        """
+        Retrieve one keyset page of fighters as a JSON array.
+
+        Args:
+            after_id (int | None): Last fighter ID of the previous page, None for the first page.
+            page_size (int): Maximum number of fighters on the page.
+
+        Returns:
+            tuple: (JSON array text, last fighter ID if another page exists, else None)
+        """
+        where_stmt = [] if after_id is None else [Fighters.fighter_id > after_id]
+        rows = self._rows_stmt(where_stmt, page_size + 1)
+        in_page = rows.c.rn <= page_size
+        result = await self.db.execute(
+            select(
+                func.coalesce(
+                    cast(
+                        func.json_agg(
+                            aggregate_order_by(rows.c.fighter, rows.c.fighter_id)
+                        ).filter(in_page),
+                        Text,
+                    ),
+                    "[]",
+                ),
+                func.count(),
+                func.max(rows.c.fighter_id).filter(in_page),
+            )
+        )
+        payload, fetched, last_id = result.one()
+        logger.info(f"Returning JSON page of extended fighters after id {after_id}")
+        return payload, (last_id if fetched > page_size else None)
+
+    async def get_fighter_by_id_json(self, fighter_id: int) -> str:
+        """
+        Retrieve a single fighter as a JSON object.
+
+        Args:
+            fighter_id (int): The unique identifier of the fighter.
+
+        Returns:
+            str: JSON object text.
+
+        Raises:
+            NotFoundException: If the fighter does not exist.
+        """
+        result = await self.db.execute(
+            select(cast(EXTENDED_FIGHTER_JSON, Text))
+            .select_from(JSON_FROM)
+            .where(Fighters.fighter_id == fighter_id)
+        )
+        payload = result.scalar_one_or_none()
+        if payload is None:
+            raise NotFoundException
+        return payload
+
+    async def get_fighters_by_country_json(self, country: str) -> str:
+        """
+        Retrieve all fighters from a specific country as a JSON array.
+
+        Args:
+            country (str): Name of the country.
+
+        Returns:
+            str: JSON array text.
+        """
+        return await self._get_json_array([Fighters.country == country])
+
+    async def search_extended_fighter_json(self, fighter_filters: FighterFilter) -> str:
+        """
+        Search for fighters using dynamic filter parameters, returning a JSON array.
+
+        Args:
+            fighter_filters (FighterFilter): Filter object defining search criteria.
+
+        Returns:
+            str: JSON array text.
+        """
+        return await self._get_json_array(self.build_where_stmt(fighter_filters))
@@ -0,0 +1,291 @@
+import os
+import typing
+import uuid
+from collections import defaultdict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.redis_client import get_redis
+from app.services.fighters.fighter_utils import FLAT_COLUMNS, FighterUtils
+from app.tools.logger import logger
+
+LEADERBOARD_PREFIX = "leaderboard"
+LEADERBOARD_REGISTRY = f"{LEADERBOARD_PREFIX}:keys"
+LEADERBOARD_READY = f"{LEADERBOARD_PREFIX}:ready"
+# Held by the one process rebuilding the boards.
+LEADERBOARD_LOCK = f"{LEADERBOARD_PREFIX}:rebuild-lock"
+# IDs of fighters written while a rebuild may be running, re-applied after it.
+LEADERBOARD_DIRTY = f"{LEADERBOARD_PREFIX}:rebuild-dirty"
+
+# Longest a rebuild may hold the lock; also how long written IDs are kept.
+LEADERBOARD_REBUILD_LOCK_SECONDS: int = int(
+    os.getenv("LEADERBOARD_REBUILD_LOCK_SECONDS", "600")
+)
+
+# Every numeric column of MODELS_LIST except the primary key can be ranked.
+RANKABLE_COLUMNS = tuple(
+    column.key
+    for column in FLAT_COLUMNS
+    if column.key != "fighter_id" and column.type.python_type in (int, float)
+)
+
+
+def leaderboard_key(column: str, weight_class: str | None = None) -> str:
+    """
+    Return the sorted set key of a leaderboard.
+
+    Args:
+        column (str): Ranked column.
+        weight_class (str | None): Weight class partition, None for the global board.
+
+    Returns:
+        str: Redis key.
+    """
+    if weight_class is None:
+        return f"{LEADERBOARD_PREFIX}:{column}"
+    return f"{LEADERBOARD_PREFIX}:{column}:weight_class:{weight_class}"
+
+
+def _record_scores(
+    record: typing.Dict[str, typing.Any],
+) -> typing.Iterator[typing.Tuple[str, float | None]]:
+    """
+    Yield the leaderboard keys a fighter belongs to with its score in each.
+
+    Args:
+        record (Dict[str, Any]): Flat fighter record (see `FighterUtils.get_flat_records`).
+
+    Yields:
+        tuple: (leaderboard key, score or None when the column is not set)
+    """
+    partitions = [None]
+    if record.get("weight_class") is not None:
+        partitions.append(record["weight_class"])
+    for column in RANKABLE_COLUMNS:
+        value = record.get(column)
+        for weight_class in partitions:
+            yield leaderboard_key(column, weight_class), (
+                None if value is None else float(value)
+            )
+
+
+class FighterLeaderboard:
+    """
+    Redis sorted-set leaderboards for every rankable fighter column.
+
+    One global sorted set per column plus one per (column, weight class) is
+    kept, scored by the column value with the fighter ID as member. Fighters
+    whose value is NULL are left out. `FighterUpdater` applies every write and
+    the boards are built from PostgreSQL on the first startup, so a top-N
+    query is a single ZRANGE followed by one batched fetch of the fighters.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the leaderboard engine."""
+        self.errors = 0
+
+    async def is_ready(self) -> bool:
+        """
+        Check whether the leaderboards have been built.
+
+        Returns:
+            bool: True if the boards exist in Redis.
+        """
+        try:
+            return bool(await get_redis().exists(LEADERBOARD_READY))
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Leaderboard unavailable: {e}")
+            return False
+
+    async def rebuild(self, db: AsyncSession, force: bool = False) -> int | None:
+        """
+        Rebuild every leaderboard from PostgreSQL.
+
+        Only one process rebuilds at a time, under LEADERBOARD_LOCK. Boards are
+        written under temporary keys and renamed over the live ones at the end,
+        so readers never see a partially built board. Writes made meanwhile
+        only reach the replaced boards, so the fighters they touched (collected
+        in LEADERBOARD_DIRTY by `update`) are read again and re-applied.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+            force (bool): Rebuild even if the boards already exist, e.g. after
+                a bulk load that bypassed `FighterUpdater`.
+
+        Returns:
+            int | None: Number of fighters loaded, or None if the boards already
+            exist or another process is rebuilding them.
+        """
+        client = get_redis()
+        if not force and await client.exists(LEADERBOARD_READY):
+            logger.info("Leaderboards already built, rebuild skipped")
+            return None
+        token = uuid.uuid4().hex
+        if not await client.set(
+            LEADERBOARD_LOCK, token, ex=LEADERBOARD_REBUILD_LOCK_SECONDS, nx=True
+        ):
+            logger.info("Leaderboards are being rebuilt by another process")
+            return None
+
+        try:
+            await client.delete(LEADERBOARD_DIRTY)
+            suffix = f":rebuild:{token}"
+            built: typing.Set[str] = set()
+            fighters = 0
+
+            async for chunk in FighterUtils(db).stream_flat_records():
+                boards: typing.Dict[str, typing.Dict[str, float]] = defaultdict(dict)
+                for record in chunk:
+                    for key, score in _record_scores(record):
+                        if score is not None:
+                            boards[key][str(record["fighter_id"])] = score
+                pipe = client.pipeline(transaction=False)
+                for key, mapping in boards.items():
+                    pipe.zadd(key + suffix, mapping)
+                await pipe.execute()
+                built.update(boards)
+                fighters += len(chunk)
+
+            stale = set(await client.smembers(LEADERBOARD_REGISTRY)) - built
+            pipe = client.pipeline(transaction=False)
+            for key in built:
+                pipe.rename(key + suffix, key)
+            if stale:
+                pipe.delete(*stale)
+            pipe.delete(LEADERBOARD_REGISTRY)
+            if built:
+                pipe.sadd(LEADERBOARD_REGISTRY, *built)
+            pipe.set(LEADERBOARD_READY, "1")
+            await pipe.execute()
+            replayed = await self._replay_writes(db, built)
+        finally:
+            # released only if it is still ours, i.e. it has not expired
+            if await client.get(LEADERBOARD_LOCK) == token:
+                await client.delete(LEADERBOARD_LOCK)
+
+        logger.info(
+            f"Rebuilt {len(built)} leaderboards from {fighters} fighters, "
+            f"re-applied {replayed} written during the rebuild"
+        )
+        return fighters
+
+    async def _replay_writes(self, db: AsyncSession, keys: typing.Set[str]) -> int:
+        """
+        Re-apply the current records of fighters written during a rebuild.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+            keys (Set[str]): Leaderboard keys that may hold the fighters.
+
+        Returns:
+            int: Number of fighters re-applied.
+        """
+        client = get_redis()
+        pipe = client.pipeline(transaction=False)
+        pipe.smembers(LEADERBOARD_DIRTY)
+        pipe.delete(LEADERBOARD_DIRTY)
+        dirty, _ = await pipe.execute()
+        if not dirty:
+            return 0
+
+        members = sorted(dirty, key=int)
+        additions: typing.Dict[str, typing.Dict[str, float]] = defaultdict(dict)
+        for record in await FighterUtils(db).get_flat_records(map(int, members)):
+            for key, score in _record_scores(record):
+                if score is not None:
+                    additions[key][str(record["fighter_id"])] = score
+        pipe = client.pipeline(transaction=False)
+        # the written values may have moved the fighters to other boards or
+        # deleted them, so they are first removed from every board
+        for key in keys:
+            pipe.zrem(key, *members)
+        for key, mapping in additions.items():
+            pipe.zadd(key, mapping)
+        if additions:
+            pipe.sadd(LEADERBOARD_REGISTRY, *additions)
+        await pipe.execute()
+        return len(members)
+
+    async def update(
+        self,
+        removed: typing.Iterable[typing.Dict[str, typing.Any]],
+        added: typing.Iterable[typing.Dict[str, typing.Any]],
+    ) -> None:
+        """
+        Apply a committed fighter write to the leaderboards.
+
+        Args:
+            removed (Iterable[Dict[str, Any]]): Flat records before the write (updated or deleted fighters).
+            added (Iterable[Dict[str, Any]]): Flat records after the write (inserted or updated fighters).
+        """
+        removals: typing.Dict[str, typing.Set[str]] = defaultdict(set)
+        additions: typing.Dict[str, typing.Dict[str, float]] = defaultdict(dict)
+        written: typing.Set[str] = set()
+        for record in removed:
+            written.add(str(record["fighter_id"]))
+            for key, _ in _record_scores(record):
+                removals[key].add(str(record["fighter_id"]))
+        for record in added:
+            written.add(str(record["fighter_id"]))
+            for key, score in _record_scores(record):
+                if score is not None:
+                    additions[key][str(record["fighter_id"])] = score
+
+        if not removals and not additions:
+            return
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            for key, members in removals.items():
+                pipe.zrem(key, *members)
+            for key, mapping in additions.items():
+                pipe.zadd(key, mapping)
+            if additions:
+                pipe.sadd(LEADERBOARD_REGISTRY, *additions)
+            # a running rebuild would otherwise overwrite this write
+            pipe.sadd(LEADERBOARD_DIRTY, *written)
+            pipe.expire(LEADERBOARD_DIRTY, LEADERBOARD_REBUILD_LOCK_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Leaderboard update failed: {e}")
+
+    async def get_ranked_ids(
+        self,
+        column: str,
+        offset: int,
+        limit: int,
+        order: str = "desc",
+        weight_class: str | None = None,
+    ) -> typing.List[int] | None:
+        """
+        Read one slice of a leaderboard.
+
+        Args:
+            column (str): Ranked column.
+            offset (int): Rank of the first fighter to return (0-based).
+            limit (int): Maximum number of fighters to return.
+            order (str): Sort order ('asc' or 'desc').
+            weight_class (str | None): Optional weight class partition.
+
+        Returns:
+            list[int] | None: Fighter IDs in rank order, or None if the
+            leaderboards are unavailable and the caller should fall back to SQL.
+        """
+        if column not in RANKABLE_COLUMNS or not await self.is_ready():
+            return None
+        try:
+            members = await get_redis().zrange(
+                leaderboard_key(column, weight_class),
+                offset,
+                offset + limit - 1,
+                desc=order.lower() == "desc",
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Leaderboard lookup failed: {e}")
+            return None
+        return [int(member) for member in members]
+
+
+fighter_leaderboard = FighterLeaderboard()
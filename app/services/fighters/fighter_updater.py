@@ -1,20 +1,84 @@
 import typing
 
 from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.fighters import Fighters
-from app.schemas.extended_fighter import ExtendedFighterFilter
-from app.schemas.fighter import FighterFilter
+from app.schemas.extended_fighter import ExtendedFighterFilter, ExtendedFighterUpdate
+from app.schemas.fighter import FighterFilter, FighterUpdate
+from app.services.fighters.fighter_bulk_writer import FighterBulkWriter
+from app.services.fighters.fighter_derived_stats import DerivedStatsStore
+from app.services.fighters.fighter_cache import (
+    GROUPS_TAG,
+    RANKING_TAG,
+    SEARCH_TAG,
+    country_tag,
+    fighter_cache,
+    fighter_tag,
+    weight_class_tag,
+)
+from app.services.fighters.fighter_group_stats import FighterGroupStatsSummary
+from app.services.fighters.fighter_leaderboard import fighter_leaderboard
 from app.services.fighters.fighter_utils import FighterUtils
+from app.services.predictions.fight_predictor import fight_predictor
+from app.services.predictions.prediction_cache import prediction_cache
+from app.services.predictions.similarity_index import similarity_index
+from app.tools.exceptions.custom_api_exceptions import BadRequestException
 
 
 class FighterUpdater(FighterUtils):
     """
     Service class responsible for creating, updating, and deleting fighter records.
+    Every write also updates the `fighter_derived_stats` and
+    `fighter_group_stats` tables in the same transaction, and the Redis
+    leaderboards, prediction features and similarity index once committed.
     Inherits from FighterUtils for shared database query logic.
     """
 
+    @staticmethod
+    def _cache_tags(
+        fighters: typing.Iterable[typing.Dict[str, typing.Any]], *tags: str
+    ) -> typing.List[str]:
+        """
+        Collect the cache tags affected by a write to the given fighters.
+
+        Args:
+            fighters (Iterable[Dict[str, Any]]): Fighter values before and/or after the write.
+            *tags (str): Additional tags to invalidate.
+
+        Returns:
+            list[str]: Fighter, country and weight class tags plus the extra tags.
+        """
+        collected = list(tags)
+        for fighter in fighters:
+            if fighter.get("fighter_id") is not None:
+                collected.append(fighter_tag(fighter["fighter_id"]))
+            if "country" in fighter:
+                collected.append(country_tag(fighter["country"]))
+            if "weight_class" in fighter:
+                collected.append(weight_class_tag(fighter["weight_class"]))
+        return collected
+
+    @staticmethod
+    async def _publish_write(
+        removed: typing.List[typing.Dict[str, typing.Any]],
+        added: typing.List[typing.Dict[str, typing.Any]],
+    ) -> None:
+        """
+        Apply a committed write to the state derived from the fighter tables.
+
+        Args:
+            removed (list[dict]): Flat records before the write (updated or deleted fighters).
+            added (list[dict]): Flat records after the write (inserted or updated fighters).
+        """
+        await fighter_leaderboard.update(removed, added)
+        fight_predictor.update(removed, added)
+        similarity_index.update(removed, added)
+        prediction_cache.invalidate(
+            record["fighter_id"] for record in (*removed, *added)
+        )
+
     async def add_fighter(
         self, fighter_data: FighterFilter | ExtendedFighterFilter
     ) -> bool:
@@ -30,34 +94,50 @@ class FighterUpdater(FighterUtils):
         data = fighter_data.model_dump(exclude_none=True)
         if self.is_extended:
             self.convert_stats_dicts_to_models(data)
-        self.db.add(Fighters(**data))
+        fighter = Fighters(**data)
+        self.db.add(fighter)
+        await self.db.flush()
+        added = await self.get_flat_records([fighter.fighter_id])
+        await DerivedStatsStore(self.db).refresh(added)
+        await FighterGroupStatsSummary(self.db).apply([], added)
         await self.db.commit()
+        await self._publish_write([], added)
+        await fighter_cache.invalidate(
+            self._cache_tags([data], SEARCH_TAG, RANKING_TAG, GROUPS_TAG)
+        )
         return True
 
     async def add_multiple_fighters(
         self, fighters_data: typing.List[FighterFilter | ExtendedFighterFilter]
-    ) -> typing.List[bool]:
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
         """
         Add multiple fighters to the database in a single transaction.
 
+        Rows are written with bulk statements by `FighterBulkWriter`; invalid or
+        duplicate items are skipped and reported without failing the others.
+
         Args:
             fighters_data (list[FighterFilter | ExtendedFighterFilter]): List of fighter data to insert.
 
         Returns:
-            list[bool]: List of True values for each successfully added fighter.
+            list[dict]: One result per item, in request order, with `index`,
+            `success` and either `fighter_id` or `error`.
         """
-        fighters_to_add: typing.List[Fighters] = []
-        for fighter_data in fighters_data:
-            data = fighter_data.model_dump(exclude_none=True)
-            if self.is_extended:
-                self.convert_stats_dicts_to_models(data)
-            fighters_to_add.append(Fighters(**data))
+        writer = FighterBulkWriter(self.db, self.is_extended)
+        results, added = await writer.insert_fighters(fighters_data)
 
-        if fighters_to_add:
-            self.db.add_all(fighters_to_add)
+        if added:
+            await DerivedStatsStore(self.db).refresh(added)
+            await FighterGroupStatsSummary(self.db).apply([], added)
             await self.db.commit()
+            await self._publish_write([], added)
+            await fighter_cache.invalidate(
+                self._cache_tags(added, SEARCH_TAG, RANKING_TAG, GROUPS_TAG)
+            )
+        else:
+            await self.db.rollback()
 
-        return [True for _ in fighters_to_add]
+        return results
 
     async def _update_fighter(
         self, fighter: Fighters, fighter_data: FighterFilter | ExtendedFighterFilter
@@ -76,11 +156,21 @@ class FighterUpdater(FighterUtils):
         if self.is_extended:
             self.convert_stats_dicts_to_models(data)
 
+        before = await self.get_flat_records([fighter.fighter_id])
         for key, value in data.items():
             setattr(fighter, key, value)
 
+        await self.db.flush()
+        after = await self.get_flat_records([fighter.fighter_id])
+        await DerivedStatsStore(self.db).refresh(after)
+        await FighterGroupStatsSummary(self.db).apply(before, after)
         await self.db.commit()
         await self.db.refresh(fighter)
+        await self._publish_write(before, after)
+
+        await fighter_cache.invalidate(
+            self._cache_tags([*before, *after], SEARCH_TAG, RANKING_TAG, GROUPS_TAG)
+        )
 
     async def update_fighter_by_id(
         self, fighter_id: int, fighter_data: FighterFilter | ExtendedFighterFilter
@@ -124,6 +214,55 @@ class FighterUpdater(FighterUtils):
         )
         return await self._update_fighter(fighter, fighter_data)
 
+    async def update_multiple_fighters(
+        self, updates: typing.List[FighterUpdate | ExtendedFighterUpdate]
+    ) -> typing.List[int]:
+        """
+        Apply partial updates to many fighters in a single transaction.
+
+        Each table is updated with set-based statements by `FighterBulkWriter`
+        instead of one locked read, flush and refresh per fighter.
+
+        Args:
+            updates (list[FighterUpdate | ExtendedFighterUpdate]): Updates to apply.
+
+        Returns:
+            list[int]: IDs of the fighters that were updated; unknown IDs are skipped.
+
+        Raises:
+            BadRequestException: If a value does not fit its column or an update
+                would duplicate another fighter's name, nickname and surname.
+        """
+        if not updates:
+            return []
+        before = await self.get_flat_records(
+            {update.fighter_id for update in updates}, lock_record=True
+        )
+        try:
+            updated_ids = await FighterBulkWriter(
+                self.db, self.is_extended
+            ).update_fighters(updates)
+        except IntegrityError as e:
+            await self.db.rollback()
+            raise BadRequestException(
+                "Update would duplicate an existing fighter"
+            ) from e
+        if not updated_ids:
+            await self.db.rollback()
+            return []
+
+        updated = set(updated_ids)
+        before = [record for record in before if record["fighter_id"] in updated]
+        after = await self.get_flat_records(updated_ids)
+        await DerivedStatsStore(self.db).refresh(after)
+        await FighterGroupStatsSummary(self.db).apply(before, after)
+        await self.db.commit()
+        await self._publish_write(before, after)
+        await fighter_cache.invalidate(
+            self._cache_tags([*before, *after], SEARCH_TAG, RANKING_TAG, GROUPS_TAG)
+        )
+        return updated_ids
+
     async def remove_record_by_fighter_id(self, fighter_id: int) -> bool:
         """
         Remove a fighter record from the database by its ID.
@@ -135,13 +274,19 @@ class FighterUpdater(FighterUtils):
             bool: True if the record was successfully deleted.
         """
         fighter = await self.db.get(Fighters, fighter_id)
+        removed = await self.get_flat_records([fighter_id], lock_record=True)
         await self.db.delete(fighter)
+        await FighterGroupStatsSummary(self.db).apply(removed, [])
         await self.db.commit()
+        await self._publish_write(removed, [])
+        await fighter_cache.invalidate(
+            self._cache_tags(removed, RANKING_TAG, GROUPS_TAG)
+        )
         return True
 
     async def remove_multiple_records(
         self, list_of_ids: typing.List[int]
-    ) -> typing.Any:
+    ) -> typing.List[int]:
         """
         Remove multiple fighters from the database by their IDs.
 
@@ -149,11 +294,23 @@ class FighterUpdater(FighterUtils):
             list_of_ids (list[int]): List of fighter IDs to delete.
 
         Returns:
-            Any: The result of the delete operation (SQLAlchemy execution result).
+            list[int]: IDs of the fighters that were actually deleted.
         """
         if not list_of_ids:
             return []
-        stmt = delete(Fighters).where(Fighters.fighter_id.in_(list_of_ids))
+        records = await self.get_flat_records(list_of_ids, lock_record=True)
+        stmt = (
+            delete(Fighters)
+            .where(Fighters.fighter_id.in_(list_of_ids))
+            .returning(Fighters.fighter_id)
+        )
         result = await self.db.execute(stmt)
+        deleted_ids = set(result.scalars().all())
+        removed = [record for record in records if record["fighter_id"] in deleted_ids]
+        await FighterGroupStatsSummary(self.db).apply(removed, [])
         await self.db.commit()
-        return result
+        await self._publish_write(removed, [])
+        await fighter_cache.invalidate(
+            self._cache_tags(removed, RANKING_TAG, GROUPS_TAG)
+        )
+        return [fighter["fighter_id"] for fighter in removed]
@@ -1,11 +1,29 @@
 import typing
 
-from sqlalchemy import asc, desc, func, select, text
+from sqlalchemy import (
+    Integer,
+    String,
+    any_,
+    asc,
+    bindparam,
+    cast,
+    desc,
+    func,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased, joinedload
 
-from app.constants import MODELS_LIST
-from app.db.models import Base, BaseStats, ExtendedStats, FightsResults
+from app.constants import MODELS_LIST, STREAM_CHUNK_SIZE
+from app.db.models import (
+    Base,
+    BaseStats,
+    DerivedStats,
+    ExtendedStats,
+    FightsResults,
+)
 from app.db.models.fighters import Fighters
 from app.schemas import ExtendedFighter as ExtendedFighterSchema
 from app.schemas.extended_fighter import ExtendedFighterFilter
@@ -20,12 +38,44 @@ EXTENDED_STMT = (
     .join(BaseStats, Fighters.fighter_id == BaseStats.fighter_id, isouter=True)
     .join(ExtendedStats, Fighters.fighter_id == ExtendedStats.fighter_id, isouter=True)
     .join(FightsResults, Fighters.fighter_id == FightsResults.fighter_id, isouter=True)
+    .join(DerivedStats, Fighters.fighter_id == DerivedStats.fighter_id, isouter=True)
     .options(
         joinedload(Fighters.base_stats),
         joinedload(Fighters.extended_stats),
         joinedload(Fighters.fights_results),
     )
 )
+# Fighters with their entered stats; the source of the derived stats.
+STATS_FROM = (
+    Fighters.__table__.outerjoin(BaseStats, Fighters.fighter_id == BaseStats.fighter_id)
+    .outerjoin(ExtendedStats, Fighters.fighter_id == ExtendedStats.fighter_id)
+    .outerjoin(FightsResults, Fighters.fighter_id == FightsResults.fighter_id)
+)
+FLAT_FROM = STATS_FROM.outerjoin(
+    DerivedStats, Fighters.fighter_id == DerivedStats.fighter_id
+)
+
+
+def _flat_columns() -> typing.List[typing.Any]:
+    """
+    Collect the columns of every model in MODELS_LIST under unique names.
+
+    Columns repeated across models (`fighter_id`, `last_updated`) are taken
+    from the first model that defines them, i.e. `Fighters`.
+
+    Returns:
+        list: SQLAlchemy column attributes.
+    """
+    columns, seen = [], set()
+    for model in MODELS_LIST:
+        for column in model.__table__.columns:
+            if column.name not in seen:
+                seen.add(column.name)
+                columns.append(getattr(model, column.key))
+    return columns
+
+
+FLAT_COLUMNS = _flat_columns()
 
 
 class FighterUtils:
@@ -119,6 +169,151 @@ class FighterUtils:
 
         return convert(fighters_list[0])
 
+    async def _get_records_page(
+        self, where_stmt: list, after_id: int | None, page_size: int
+    ) -> typing.Tuple[typing.List[typing.Any], int | None]:
+        """
+        Retrieve a single keyset page of records ordered by fighter ID.
+
+        Args:
+            where_stmt (list): SQLAlchemy filter expressions.
+            after_id (int | None): Last fighter ID of the previous page, None for the first page.
+            page_size (int): Maximum number of records on the page.
+
+        Returns:
+            tuple: (validated records, last fighter ID if another page exists, else None)
+        """
+        if after_id is not None:
+            where_stmt = [*where_stmt, Fighters.fighter_id > after_id]
+
+        records = await self.db.execute(
+            self.stmt.where(*where_stmt)
+            .order_by(Fighters.fighter_id)
+            .limit(page_size + 1)
+        )
+        fighters_list = records.scalars().all()
+
+        has_next = len(fighters_list) > page_size
+        page = [
+            self.fighter_schema.model_validate(fighter)
+            for fighter in fighters_list[:page_size]
+        ]
+        return page, (page[-1].fighter_id if has_next else None)
+
+    async def _stream_records(
+        self, where_stmt: list, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> typing.AsyncIterator[typing.List[typing.Any]]:
+        """
+        Stream records through a server-side cursor in validated chunks.
+
+        Args:
+            where_stmt (list): SQLAlchemy filter expressions.
+            chunk_size (int): Number of rows fetched from the cursor per round trip.
+
+        Yields:
+            list[Any]: Chunk of validated records, at most `chunk_size` long.
+        """
+        result = await self.db.stream(
+            self.stmt.where(*where_stmt)
+            .order_by(Fighters.fighter_id)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for partition in result.scalars().partitions():
+            yield [self.fighter_schema.model_validate(row) for row in partition]
+
+    async def iter_records(
+        self, where_stmt: list | None = None, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> typing.AsyncIterator[typing.Any]:
+        """
+        Iterate over validated records one by one, backed by a server-side cursor.
+
+        Args:
+            where_stmt (list | None): Optional SQLAlchemy filter expressions.
+            chunk_size (int): Number of rows fetched from the cursor per round trip.
+
+        Yields:
+            Any: A single validated fighter record.
+        """
+        async for chunk in self._stream_records(where_stmt or [], chunk_size):
+            for record in chunk:
+                yield record
+
+    async def get_flat_records(
+        self, fighter_ids: typing.Iterable[int], lock_record: bool = False
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Retrieve fighters with all their stats as flat dictionaries.
+
+        Args:
+            fighter_ids (Iterable[int]): IDs of the fighters to read.
+            lock_record (bool): Whether to lock the fighter rows for update.
+
+        Returns:
+            list[dict]: One dictionary of column values per existing fighter, ordered by ID.
+        """
+        fighter_ids = list(fighter_ids)
+        if not fighter_ids:
+            return []
+        stmt = (
+            select(*FLAT_COLUMNS)
+            .select_from(FLAT_FROM)
+            # one array parameter instead of one per ID, so any number of IDs fits
+            .where(
+                Fighters.fighter_id
+                == any_(bindparam("fighter_ids", fighter_ids, type_=ARRAY(Integer)))
+            )
+            .order_by(Fighters.fighter_id)
+        )
+        if lock_record:
+            stmt = stmt.with_for_update(of=Fighters)
+        result = await self.db.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+
+    async def stream_flat_records(
+        self, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> typing.AsyncIterator[typing.List[typing.Dict[str, typing.Any]]]:
+        """
+        Stream every fighter as flat dictionaries through a server-side cursor.
+
+        Args:
+            chunk_size (int): Number of rows fetched from the cursor per round trip.
+
+        Yields:
+            list[dict]: Chunk of flat records ordered by fighter ID.
+        """
+        result = await self.db.stream(
+            select(*FLAT_COLUMNS)
+            .select_from(FLAT_FROM)
+            .order_by(Fighters.fighter_id)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+
+    async def _get_records_by_ids(
+        self, fighter_ids: typing.Sequence[int]
+    ) -> typing.List[typing.Any]:
+        """
+        Retrieve validated records for a list of IDs in a single query.
+
+        Args:
+            fighter_ids (Sequence[int]): Fighter IDs in the desired output order.
+
+        Returns:
+            list[Any]: Validated records in the order of `fighter_ids`; missing IDs are skipped.
+        """
+        if not fighter_ids:
+            return []
+        records = await self.db.execute(
+            self.stmt.where(Fighters.fighter_id.in_(fighter_ids))
+        )
+        by_id = {fighter.fighter_id: fighter for fighter in records.scalars().all()}
+        return [
+            self.fighter_schema.model_validate(by_id[fighter_id])
+            for fighter_id in fighter_ids
+            if fighter_id in by_id
+        ]
+
     async def _get_records_by_single_value(
         self,
         column: str,
@@ -174,21 +369,39 @@ class FighterUtils:
         )
 
     async def get_fighters_by_param_with_limit(
-        self, param_name: str, limit: int, order: str = "desc"
+        self,
+        param_name: str,
+        limit: int,
+        order: str = "desc",
+        offset: int = 0,
+        weight_class: str | None = None,
     ):
         """
         Retrieve fighters ordered by a specific parameter.
 
+        Matches the Redis leaderboards, so pages are the same whichever one
+        serves them: fighters without a value are left out, and ties are
+        ordered by fighter ID compared as text, in the ranking's direction.
+
         Args:
             param_name (str): Column to sort by.
             limit (int): Maximum number of records to return.
             order (str): Sort order ('asc' or 'desc').
+            offset (int): Number of leading records to skip.
+            weight_class (str | None): Optional weight class to restrict the ranking to.
 
         """
         column, _ = self._get_column_if_param_in_tables(param_name)
         order_func = desc if order.lower() == "desc" else asc
+        # sorted set members are the IDs as strings, compared byte by byte
+        member = cast(Fighters.fighter_id, String).collate("C")
+        stmt = self.stmt.where(column.isnot(None))
+        if weight_class is not None:
+            stmt = stmt.where(Fighters.weight_class == weight_class)
         result = await self.db.execute(
-            self.stmt.order_by(order_func(column)).limit(limit)
+            stmt.order_by(order_func(column), order_func(member))
+            .offset(offset)
+            .limit(limit)
         )
         return result.scalars().all()
 
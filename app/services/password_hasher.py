@@ -0,0 +1,225 @@
+import asyncio
+import bisect
+import os
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from app.tools.exceptions.custom_api_exceptions import ServiceUnavailableException
+
+# Threads hashing and verifying passwords; bcrypt releases the GIL, so each
+# one keeps a CPU core busy while the event loop goes on serving requests.
+PASSWORD_HASH_WORKERS: int = int(
+    os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+# Requests allowed to wait for a free thread; further ones are rejected with
+# 503 so a login storm cannot queue up unbounded work. 0 disables the limit.
+PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
+
+# Upper bounds of the queue wait histogram buckets, in milliseconds.
+WAIT_BUCKETS_MS = (1.0, 10.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 5000.0)
+
+bcrypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class HashingStats:
+    """
+    Counters describing password hashing.
+
+    Attributes:
+        hashes (int): Passwords hashed.
+        verifications (int): Passwords verified.
+        rejected (int): Requests refused because the queue was full.
+        peak_queued (int): Most requests waiting at once.
+        work_total_ms (float): Sum of the hashing times.
+        wait_total_ms (float): Sum of the queue waits.
+        max_wait_ms (float): Longest queue wait.
+        waits (list[int]): Number of requests per WAIT_BUCKETS_MS bucket, plus
+            one for longer waits.
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.hashes = 0
+        self.verifications = 0
+        self.rejected = 0
+        self.peak_queued = 0
+        self.work_total_ms = 0.0
+        self.wait_total_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.waits = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_wait(self, wait_ms: float) -> None:
+        """
+        Record the time one request waited for a thread.
+
+        Args:
+            wait_ms (float): Queue wait, in milliseconds.
+        """
+        self.wait_total_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.waits[bisect.bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification in a bounded thread pool.
+
+    At most `workers` calls run at once; others wait on a semaphore, in
+    arrival order, and are counted as queued, so the pool's own queue never
+    grows and the queue depth is known. Waiting requests beyond `max_queue`
+    are rejected. Queue bookkeeping happens on the event loop, so no locking
+    is needed.
+    """
+
+    def __init__(
+        self,
+        workers: int = PASSWORD_HASH_WORKERS,
+        max_queue: int = PASSWORD_HASH_MAX_QUEUE,
+        context: CryptContext = bcrypt_context,
+    ) -> None:
+        """
+        Initialize the hasher; the thread pool starts on first use.
+
+        Args:
+            workers (int): Number of hashing threads.
+            max_queue (int): Requests allowed to wait for a thread, 0 for no limit.
+            context (CryptContext): Passlib context doing the hashing.
+        """
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        self.context = context
+        self.stats = HashingStats()
+        self.in_flight = 0
+        self.queued = 0
+        self._slots = asyncio.Semaphore(self.workers)
+        self._pool: ThreadPoolExecutor | None = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Return the thread pool, starting it if needed."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                self.workers, thread_name_prefix="password-hasher"
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the hashing threads."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    async def _run(
+        self, function: typing.Callable[..., typing.Any], *args
+    ) -> typing.Any:
+        """
+        Run a hashing call on a free thread, waiting for one if needed.
+
+        Args:
+            function (Callable): Blocking passlib call.
+            *args: Arguments of the call.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            ServiceUnavailableException: If `max_queue` requests are already waiting.
+        """
+        if self._slots.locked():
+            if self.max_queue and self.queued >= self.max_queue:
+                self.stats.rejected += 1
+                raise ServiceUnavailableException(
+                    "Too many concurrent authentication requests, retry later"
+                )
+        self.queued += 1
+        self.stats.peak_queued = max(self.stats.peak_queued, self.queued)
+        enqueued = time.perf_counter()
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+        started = time.perf_counter()
+        self.stats.record_wait((started - enqueued) * 1000)
+
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_pool(), function, *args
+            )
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+            self.stats.work_total_ms += (time.perf_counter() - started) * 1000
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password.
+
+        Args:
+            password (str): Plain-text password.
+
+        Returns:
+            str: The bcrypt hash.
+
+        Raises:
+            ServiceUnavailableException: If the hashing queue is full.
+        """
+        hashed = await self._run(self.context.hash, password)
+        self.stats.hashes += 1
+        return hashed
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Check a password against its hash.
+
+        Args:
+            password (str): Plain-text password.
+            hashed_password (str): Stored bcrypt hash.
+
+        Returns:
+            bool: True if the password matches.
+
+        Raises:
+            ServiceUnavailableException: If the hashing queue is full.
+        """
+        matches = await self._run(self.context.verify, password, hashed_password)
+        self.stats.verifications += 1
+        return matches
+
+    def get_stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return the pool settings, current queue depth and counters.
+
+        Returns:
+            Dict[str, Any]: Threads busy, requests queued and queue wait statistics.
+        """
+        stats = self.stats
+        calls = stats.hashes + stats.verifications
+        waited = sum(stats.waits)
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_queued": stats.peak_queued,
+            "hashes": stats.hashes,
+            "verifications": stats.verifications,
+            "rejected": stats.rejected,
+            "mean_work_ms": round(stats.work_total_ms / calls, 3) if calls else None,
+            "mean_wait_ms": (
+                round(stats.wait_total_ms / waited, 3) if waited else None
+            ),
+            "max_wait_ms": round(stats.max_wait_ms, 3),
+            "wait_buckets_ms": {
+                **{
+                    f"<={bound:g}": count
+                    for bound, count in zip(WAIT_BUCKETS_MS, stats.waits)
+                },
+                f">{WAIT_BUCKETS_MS[-1]:g}": stats.waits[-1],
+            },
+        }
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,312 @@
+import typing
+
+import numpy as np
+
+from app.services.predictions.logistic_fit import (
+    fit_logistic,
+    fit_standardization,
+    sigmoid,
+)
+from app.services.predictions.shared_arrays import SharedArray, attach
+
+# Chronological replay run inside the backtest worker processes. Like
+# `simulation_trials`, only NumPy-based modules are imported here, so spawned
+# workers start without loading the web app or the database layer.
+
+# Outcome of a bout for the fighter on one side of it.
+WIN, LOSS, DRAW, NO_CONTEST = 0, 1, 2, 3
+# How a bout ended; OTHER covers DQs, overturned results and unknown methods.
+KO_TKO, SUBMISSION, DECISION, OTHER = 0, 1, 2, 3
+
+# Columns of the per-fighter record kept during the replay: wins and losses by
+# method, then draws and no contests.
+RECORD_COLUMNS = 10
+DRAW_COLUMN = 8
+NO_CONTEST_COLUMN = 9
+
+# Feature columns rebuilt from the record as of each bout, as record column
+# indexes, matching the `fights_results` columns.
+RECORD_FEATURES = {
+    "win_by_ko_tko": WIN * 4 + KO_TKO,
+    "win_by_sub": WIN * 4 + SUBMISSION,
+    "win_by_dec": WIN * 4 + DECISION,
+    "loss_by_ko_tko": LOSS * 4 + KO_TKO,
+    "loss_by_sub": LOSS * 4 + SUBMISSION,
+    "loss_by_dec": LOSS * 4 + DECISION,
+    "non_contest": NO_CONTEST_COLUMN,
+}
+
+DAYS_PER_YEAR = 365.25
+
+
+class WindowFeatures(typing.NamedTuple):
+    """Raw features of both fighters of every bout of one time window."""
+
+    first: np.ndarray
+    second: np.ndarray
+
+
+class WalkForwardFit(typing.NamedTuple):
+    """
+    How a model is refit before each scored window.
+
+    `weights` are kept as given when `learn_weights` is False (hand-set
+    weights); otherwise they are fitted with the other settings.
+    """
+
+    weights: np.ndarray
+    learn_weights: bool
+    epochs: int
+    learning_rate: float
+    l2: float
+    min_training_bouts: int
+
+
+class WindowResult(typing.NamedTuple):
+    """Predictions of the decided bouts of one time window."""
+
+    bouts: np.ndarray
+    probabilities: np.ndarray
+    outcomes: np.ndarray
+
+
+def record_column(outcome: np.ndarray, method: np.ndarray) -> np.ndarray:
+    """
+    Map bout outcomes and methods to record columns.
+
+    Args:
+        outcome (np.ndarray): WIN, LOSS, DRAW or NO_CONTEST per bout side.
+        method (np.ndarray): KO_TKO, SUBMISSION, DECISION or OTHER per bout.
+
+    Returns:
+        np.ndarray: Record column per bout side.
+    """
+    return np.select(
+        [outcome == DRAW, outcome == NO_CONTEST],
+        [DRAW_COLUMN, NO_CONTEST_COLUMN],
+        outcome * 4 + method,
+    )
+
+
+def _features(
+    names: typing.Sequence[str],
+    fighters: np.ndarray,
+    day: int,
+    record: np.ndarray,
+    last_bout: np.ndarray,
+    static: np.ndarray,
+    static_columns: typing.Sequence[str],
+    age_reference: np.ndarray,
+) -> np.ndarray:
+    """
+    Build the model features of some fighters as of a day, before its bouts.
+
+    Args:
+        names (Sequence[str]): Model feature names.
+        fighters (np.ndarray): Compact fighter indexes.
+        day (int): Day of the bouts, as days since the epoch.
+        record (np.ndarray): Record per fighter, shape (fighters, RECORD_COLUMNS).
+        last_bout (np.ndarray): Day of each fighter's last bout, -1 if none.
+        static (np.ndarray): Features that do not depend on the bouts.
+        static_columns (Sequence[str]): Names of the `static` columns.
+        age_reference (np.ndarray): Day each fighter's age was recorded.
+
+    Returns:
+        np.ndarray: Raw features, shape (len(fighters), len(names)); NaN for
+        features that cannot be rebuilt as of the day.
+    """
+    counts = record[fighters]
+    wins = counts[:, WIN * 4 : WIN * 4 + 4].sum(axis=1)
+    losses = counts[:, LOSS * 4 : LOSS * 4 + 4].sum(axis=1)
+    decided = wins + losses + counts[:, DRAW_COLUMN]
+    features = np.full((len(fighters), len(names)), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for column, name in enumerate(names):
+            if name in RECORD_FEATURES:
+                features[:, column] = counts[:, RECORD_FEATURES[name]]
+            elif name == "win_percentage":
+                features[:, column] = np.where(
+                    decided > 0, 100.0 * wins / decided, np.nan
+                )
+            elif name == "finish_rate":
+                finishes = counts[:, WIN * 4 + KO_TKO] + counts[:, WIN * 4 + SUBMISSION]
+                features[:, column] = np.where(wins > 0, finishes / wins, np.nan)
+            elif name == "days_since_last_fight":
+                last = last_bout[fighters]
+                features[:, column] = np.where(last >= 0, day - last, np.nan)
+            elif name == "age":
+                features[:, column] = (
+                    static[fighters, static_columns.index(name)]
+                    - (age_reference[fighters] - day) / DAYS_PER_YEAR
+                )
+            elif name in static_columns:
+                features[:, column] = static[fighters, static_columns.index(name)]
+    return features
+
+
+def replay_window(
+    arrays: typing.Dict[str, SharedArray],
+    static_columns: typing.Sequence[str],
+    feature_names: typing.Sequence[str],
+    start: int,
+    stop: int,
+) -> WindowFeatures:
+    """
+    Rebuild the features of the bouts of a time window as of each bout.
+
+    The record of every fighter as of the window start is rebuilt in one
+    vectorized pass over the earlier bouts, then the window is walked one
+    event day at a time: features are taken from the records as they stood
+    before that day and the records are updated afterwards, so no bout ever
+    sees its own result or a later one.
+
+    Args:
+        arrays (Dict[str, SharedArray]): Bout columns `day`, `first`, `second`,
+            `outcome`, `method` in chronological order, and the per-fighter
+            `static` features and `age_reference` days.
+        static_columns (Sequence[str]): Names of the `static` columns.
+        feature_names (Sequence[str]): Model feature names.
+        start (int): Index of the window's first bout; the first of its day.
+        stop (int): Index past the window's last bout; the first of a later day.
+
+    Returns:
+        WindowFeatures: Raw features of the first and second fighter of each
+        bout, shape (stop - start, len(feature_names)) each.
+    """
+    with attach(arrays) as shared:
+        return _replay(shared, static_columns, feature_names, start, stop)
+
+
+def _replay(
+    shared: typing.Dict[str, np.ndarray],
+    static_columns: typing.Sequence[str],
+    feature_names: typing.Sequence[str],
+    start: int,
+    stop: int,
+) -> WindowFeatures:
+    """Run `replay_window` on attached arrays."""
+    day, first, second = shared["day"], shared["first"], shared["second"]
+    outcome, method = shared["outcome"], shared["method"]
+    static, age_reference = shared["static"], shared["age_reference"]
+    fighters = len(static)
+
+    # the second fighter's outcome mirrors the first's: win <-> loss
+    mirrored = np.choose(outcome, [LOSS, WIN, DRAW, NO_CONTEST])
+    first_columns = record_column(outcome, method)
+    second_columns = record_column(mirrored, method)
+
+    record = np.zeros((fighters, RECORD_COLUMNS), dtype=np.int64)
+    np.add.at(record, (first[:start], first_columns[:start]), 1)
+    np.add.at(record, (second[:start], second_columns[:start]), 1)
+    last_bout = np.full(fighters, -1, dtype=np.int64)
+    np.maximum.at(last_bout, first[:start], day[:start])
+    np.maximum.at(last_bout, second[:start], day[:start])
+
+    first_features = np.empty((stop - start, len(feature_names)))
+    second_features = np.empty((stop - start, len(feature_names)))
+    days = day[start:stop]
+    edges = np.concatenate(([0], np.flatnonzero(np.diff(days)) + 1, [len(days)]))
+    for low, high in zip(edges[:-1], edges[1:]):
+        bouts = slice(start + low, start + high)
+        today = int(day[bouts.start])
+        sides = np.concatenate((first[bouts], second[bouts]))
+        features = _features(
+            feature_names,
+            sides,
+            today,
+            record,
+            last_bout,
+            static,
+            static_columns,
+            age_reference,
+        )
+        first_features[low:high] = features[: high - low]
+        second_features[low:high] = features[high - low :]
+
+        np.add.at(record, (first[bouts], first_columns[bouts]), 1)
+        np.add.at(record, (second[bouts], second_columns[bouts]), 1)
+        np.maximum.at(last_bout, sides, today)
+
+    return WindowFeatures(first_features, second_features)
+
+
+def _differences(
+    first: np.ndarray,
+    second: np.ndarray,
+    bouts: np.ndarray,
+    mean: np.ndarray,
+    scale: np.ndarray,
+) -> np.ndarray:
+    """
+    Standardized feature differences of some bouts.
+
+    Each side is standardized as `LogisticModel.standardize` does, so a
+    feature missing on one side is imputed with the mean on that side only.
+    """
+    return np.nan_to_num((first[bouts] - mean) / scale, nan=0.0) - np.nan_to_num(
+        (second[bouts] - mean) / scale, nan=0.0
+    )
+
+
+def score_window(
+    arrays: typing.Dict[str, SharedArray],
+    fit: WalkForwardFit,
+    start: int,
+    stop: int,
+) -> WindowResult | None:
+    """
+    Fit a model on the bouts before a window and predict the window's bouts.
+
+    The standardization is fitted on both fighters' features of every bout
+    before `start`, and the weights (unless hand-set) on its decided bouts.
+    Each bout is used once from each side with the label flipped, so the fit
+    has no intercept, like the served model: P(A beats B) = 1 - P(B beats A).
+
+    Args:
+        arrays (Dict[str, SharedArray]): `outcome` per bout and the
+            `first_features` and `second_features` built by `replay_window`.
+        fit (WalkForwardFit): Weights or how to fit them.
+        start (int): Index of the window's first bout; the first of its day.
+        stop (int): Index past the window's last bout.
+
+    Returns:
+        WindowResult | None: Bout index, P(first fighter wins) and 1/0 outcome
+        of every bout of the window won by either fighter; None if fewer than
+        `fit.min_training_bouts` decided bouts precede the window.
+    """
+    with attach(arrays) as shared:
+        outcome = shared["outcome"]
+        first_features, second_features = (
+            shared["first_features"],
+            shared["second_features"],
+        )
+        decided = np.flatnonzero(outcome[:start] <= LOSS)
+        if len(decided) < max(1, fit.min_training_bouts):
+            return None
+        mean, scale = fit_standardization(
+            np.concatenate((first_features[:start], second_features[:start]))
+        )
+
+        weights = fit.weights
+        if fit.learn_weights:
+            rows = _differences(first_features, second_features, decided, mean, scale)
+            won = (outcome[decided] == WIN).astype(np.float64)
+            # the mirrored rows keep the intercept at zero
+            weights, _, _ = fit_logistic(
+                np.concatenate((rows, -rows)),
+                np.concatenate((won, 1 - won)),
+                np.ones(2 * len(rows)),
+                fit.epochs,
+                fit.learning_rate,
+                fit.l2,
+            )
+
+        scored = start + np.flatnonzero(outcome[start:stop] <= LOSS)
+        return WindowResult(
+            scored,
+            sigmoid(
+                _differences(first_features, second_features, scored, mean, scale)
+                @ weights
+            ),
+            (outcome[scored] == WIN).astype(np.int8),
+        )
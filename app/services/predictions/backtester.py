@@ -0,0 +1,456 @@
+import multiprocessing
+import os
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import STREAM_CHUNK_SIZE
+from app.db.models import BaseStats, Bouts
+from app.services.predictions.backtest_replay import (
+    DECISION,
+    DRAW,
+    KO_TKO,
+    LOSS,
+    NO_CONTEST,
+    OTHER,
+    RECORD_FEATURES,
+    SUBMISSION,
+    WIN,
+    WalkForwardFit,
+    WindowFeatures,
+    WindowResult,
+    replay_window,
+    score_window,
+)
+from app.services.predictions.logistic_fit import (
+    DEFAULT_EPOCHS,
+    DEFAULT_L2,
+    DEFAULT_LEARNING_RATE,
+)
+from app.services.predictions.logistic_model import LogisticModel
+from app.services.predictions.shared_arrays import SharedArrays
+from app.tools.logger import logger
+
+BACKTEST_WORKERS: int = int(os.getenv("BACKTEST_WORKERS", str(os.cpu_count() or 1)))
+# Windows per worker; more windows balance uneven years better, fewer repeat
+# less of the catch-up pass over earlier bouts.
+WINDOWS_PER_WORKER = 4
+CALIBRATION_BINS = 10
+# Decided bouts a year needs before it to fit a model; earlier years only
+# build records and the training history.
+MIN_TRAINING_BOUTS = 500
+
+OUTCOME_CODES = {"win": WIN, "loss": LOSS, "draw": DRAW, "nc": NO_CONTEST}
+
+# Base stats taken from the fighters' current values; physical attributes
+# change little over a career and age is shifted to each bout date.
+STATIC_FEATURES = ("weight", "height", "reach", "age")
+# Features known as of any past bout; every other model feature (career
+# striking and grappling rates) only exists as a current value and is left
+# missing, i.e. imputed with the model mean.
+POINT_IN_TIME_FEATURES = (
+    *STATIC_FEATURES,
+    *RECORD_FEATURES,
+    "win_percentage",
+    "finish_rate",
+    "days_since_last_fight",
+)
+
+
+def method_code(method: str | None) -> int:
+    """
+    Classify a bout's method as KO/TKO, submission, decision or other.
+
+    Args:
+        method (str | None): Method as stored, e.g. "KO/TKO", "SUB" or "U-DEC".
+
+    Returns:
+        int: KO_TKO, SUBMISSION, DECISION or OTHER.
+    """
+    method = (method or "").upper()
+    if "SUB" in method:
+        return SUBMISSION
+    if "DEC" in method:
+        return DECISION
+    if "KO" in method:
+        return KO_TKO
+    return OTHER
+
+
+class BacktestData(typing.NamedTuple):
+    """
+    Bout history in chronological order and per-fighter static features.
+
+    Bout columns hold one value per bout; fighters are addressed by their
+    index in `fighter_ids`.
+    """
+
+    day: np.ndarray
+    first: np.ndarray
+    second: np.ndarray
+    outcome: np.ndarray
+    method: np.ndarray
+    static: np.ndarray
+    age_reference: np.ndarray
+    fighter_ids: np.ndarray
+
+
+async def load_backtest_data(db: AsyncSession) -> BacktestData:
+    """
+    Read every bout and the static features of the fighters involved.
+
+    Args:
+        db (AsyncSession): The SQLAlchemy asynchronous session.
+
+    Returns:
+        BacktestData: Bouts ordered by event date and bout ID.
+    """
+    result = await db.stream(
+        select(
+            Bouts.event_date,
+            Bouts.fighter_id,
+            Bouts.opponent_id,
+            Bouts.result,
+            Bouts.method,
+        )
+        .order_by(Bouts.event_date, Bouts.bout_id)
+        .execution_options(yield_per=STREAM_CHUNK_SIZE * 20)
+    )
+    dates, fighters, opponents, outcomes, methods = [], [], [], [], []
+    async for partition in result.partitions():
+        for event_date, fighter_id, opponent_id, outcome, method in partition:
+            dates.append(event_date)
+            fighters.append(fighter_id)
+            opponents.append(opponent_id)
+            outcomes.append(OUTCOME_CODES[outcome])
+            methods.append(method_code(method))
+
+    total = len(dates)
+    fighter_ids, compact = np.unique(
+        np.array(fighters + opponents, dtype=np.int64), return_inverse=True
+    )
+    static = np.full((len(fighter_ids), len(STATIC_FEATURES)), np.nan)
+    age_reference = np.zeros(len(fighter_ids), dtype=np.int64)
+    rows = await db.execute(
+        select(
+            BaseStats.fighter_id,
+            BaseStats.last_updated,
+            *(getattr(BaseStats, name) for name in STATIC_FEATURES),
+        ).where(BaseStats.fighter_id.in_(fighter_ids.tolist()))
+    )
+    for fighter_id, last_updated, *values in rows.all():
+        index = np.searchsorted(fighter_ids, fighter_id)
+        static[index] = [np.nan if value is None else value for value in values]
+        if last_updated is not None:
+            age_reference[index] = (last_updated - date(1970, 1, 1)).days
+
+    return BacktestData(
+        np.array(dates, dtype="datetime64[D]").astype(np.int64),
+        compact[:total].astype(np.int64),
+        compact[total:].astype(np.int64),
+        np.array(outcomes, dtype=np.int64),
+        np.array(methods, dtype=np.int64),
+        static,
+        age_reference,
+        fighter_ids,
+    )
+
+
+def split_windows(
+    days: np.ndarray, first: int, windows: int
+) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Split bouts into time windows of about equal size.
+
+    Window edges are moved back to the first bout of their day, so bouts of
+    one day always share a window.
+
+    Args:
+        days (np.ndarray): Event day per bout, ascending.
+        first (int): Index of the first bout to cover.
+        windows (int): Target number of windows.
+
+    Returns:
+        list[tuple[int, int]]: (start, stop) bout indexes per window.
+    """
+    targets = np.linspace(first, len(days), windows + 1).astype(np.int64)[1:-1]
+    edges = np.searchsorted(days, days[targets], side="left")
+    edges = np.unique(np.concatenate(([first], edges, [len(days)])))
+    return [
+        (int(start), int(stop))
+        for start, stop in zip(edges[:-1], edges[1:])
+        if stop > start
+    ]
+
+
+def split_years(days: np.ndarray, first: int) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Split bouts into calendar years.
+
+    Args:
+        days (np.ndarray): Event day per bout, ascending.
+        first (int): Index of the first bout to cover.
+
+    Returns:
+        list[tuple[int, int]]: (start, stop) bout indexes per year.
+    """
+    years = days[first:].astype("datetime64[D]").astype("datetime64[Y]")
+    edges = first + np.flatnonzero(np.diff(years.astype(np.int64))) + 1
+    edges = np.concatenate(([first], edges, [len(days)]))
+    return [
+        (int(start), int(stop))
+        for start, stop in zip(edges[:-1], edges[1:])
+        if stop > start
+    ]
+
+
+def prediction_metrics(
+    probabilities: np.ndarray, outcomes: np.ndarray, bins: int = CALIBRATION_BINS
+) -> typing.Dict[str, typing.Any]:
+    """
+    Score probabilistic predictions of decided bouts.
+
+    Args:
+        probabilities (np.ndarray): Predicted P(first fighter wins).
+        outcomes (np.ndarray): 1 if the first fighter won, 0 otherwise.
+        bins (int): Number of equal-width calibration bins.
+
+    Returns:
+        Dict[str, Any]: Bout count, log loss, Brier score, accuracy, the
+        scores of always predicting 50% and the calibration table.
+    """
+    if not len(outcomes):
+        return {"bouts": 0}
+    clipped = np.clip(probabilities, 1e-15, 1 - 1e-15)
+    bin_of = np.minimum((probabilities * bins).astype(np.int64), bins - 1)
+    counts = np.bincount(bin_of, minlength=bins)
+    predicted = np.bincount(bin_of, probabilities, minlength=bins)
+    observed = np.bincount(bin_of, outcomes, minlength=bins)
+    return {
+        "bouts": int(len(outcomes)),
+        "log_loss": float(
+            -np.mean(outcomes * np.log(clipped) + (1 - outcomes) * np.log1p(-clipped))
+        ),
+        "brier_score": float(np.mean((probabilities - outcomes) ** 2)),
+        "accuracy": float(np.mean((probabilities > 0.5) == outcomes)),
+        "baseline_log_loss": float(np.log(2)),
+        "baseline_brier_score": 0.25,
+        "calibration": [
+            {
+                "bin": f"{low / bins:.1f}-{(low + 1) / bins:.1f}",
+                "bouts": int(counts[low]),
+                "mean_predicted": float(predicted[low] / counts[low]),
+                "observed_win_rate": float(observed[low] / counts[low]),
+            }
+            for low in range(bins)
+            if counts[low]
+        ],
+    }
+
+
+class Backtester:
+    """
+    Walk-forward replay of the bout history against a model.
+
+    Bout and fighter arrays are placed in shared memory once and attached
+    by every worker process, so only window bounds and model parameters are
+    sent per task. The replay runs in two passes: every window rebuilds the
+    features of its bouts as of each bout (see `backtest_replay.replay_window`),
+    then the model is refitted on the bouts before each calendar year and
+    predicts that year's (see `backtest_replay.score_window`). Neither the
+    features nor the model parameters of a prediction depend on its bout or
+    later ones. Use as a context manager so the workers and shared memory are
+    released.
+    """
+
+    def __init__(self, data: BacktestData, workers: int = BACKTEST_WORKERS) -> None:
+        """
+        Initialize the backtester; shared memory and workers start on entry.
+
+        Args:
+            data (BacktestData): Bout history to replay.
+            workers (int): Number of worker processes.
+        """
+        self.data = data
+        self.workers = max(1, workers)
+        self._shared = SharedArrays()
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "Backtester":
+        """Copy the data into shared memory and start the workers."""
+        for key in ("day", "first", "second", "outcome", "method"):
+            self._shared.add(key, getattr(self.data, key))
+        self._shared.add("static", self.data.static)
+        self._shared.add("age_reference", self.data.age_reference)
+        # spawned rather than forked, as for the event simulator
+        self._pool = ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        """Stop the workers and free the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        self._shared.close()
+
+    def run(
+        self,
+        model: LogisticModel,
+        since: date | None = None,
+        learn_weights: bool = True,
+        epochs: int = DEFAULT_EPOCHS,
+        learning_rate: float = DEFAULT_LEARNING_RATE,
+        l2: float = DEFAULT_L2,
+        min_training_bouts: int = MIN_TRAINING_BOUTS,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Predict every bout from the history before it and score the predictions.
+
+        The model's feature set is evaluated, not its fitted parameters: a
+        served model was fitted on today's records, which include the results
+        of the bouts being scored. Before each time window the standardization
+        and, if `learn_weights`, the weights are fitted on earlier bouts only,
+        once per calendar year, so results do not depend on the worker count.
+
+        Args:
+            model (LogisticModel): Model whose features (and hand-set weights,
+                if not `learn_weights`) are evaluated.
+            since (date | None): First event date scored; earlier bouts only
+                build the fighters' records and the training history. Every
+                bout with enough history before it is scored if None.
+            learn_weights (bool): Fit the weights walk-forward; False keeps the
+                model's weights and only refits the standardization.
+            epochs (int): Maximum number of gradient steps per fit.
+            learning_rate (float): Step size.
+            l2 (float): L2 penalty on the weights.
+            min_training_bouts (int): Decided bouts needed before a year for it
+                to be scored.
+
+        Returns:
+            Dict[str, Any]: Model version, how it was refit, bout counts, the
+            overall metrics (log loss, Brier score, accuracy, calibration) and
+            the metrics per year.
+
+        Raises:
+            RuntimeError: If used outside of a `with` block.
+        """
+        if self._pool is None:
+            raise RuntimeError("Backtester must be used as a context manager")
+        start_time = time.perf_counter()
+        days = self.data.day
+        first = (
+            int(np.searchsorted(days, (since - date(1970, 1, 1)).days))
+            if since is not None
+            else 0
+        )
+        replay_windows = (
+            split_windows(days, 0, self.workers * WINDOWS_PER_WORKER)
+            if len(days)
+            else []
+        )
+        static_columns = list(STATIC_FEATURES)
+        futures = [
+            self._pool.submit(
+                replay_window,
+                self._shared.specs,
+                static_columns,
+                model.feature_names,
+                start,
+                stop,
+            )
+            for start, stop in replay_windows
+        ]
+        replayed: typing.List[WindowFeatures] = [future.result() for future in futures]
+        empty = np.empty((0, len(model.feature_names)))
+
+        fit = WalkForwardFit(
+            model.weights, learn_weights, epochs, learning_rate, l2, min_training_bouts
+        )
+        scored_windows = split_years(days, first) if first < len(days) else []
+        features = SharedArrays()
+        try:
+            features.add("outcome", self.data.outcome)
+            for side in WindowFeatures._fields:
+                features.add(
+                    f"{side}_features",
+                    np.concatenate(
+                        [getattr(window, side) for window in replayed] or [empty]
+                    ),
+                )
+            futures = [
+                self._pool.submit(score_window, features.specs, fit, start, stop)
+                for start, stop in scored_windows
+            ]
+            window_results = [future.result() for future in futures]
+        finally:
+            features.close()
+        results: typing.List[WindowResult] = [
+            result for result in window_results if result is not None
+        ]
+        warmup = sum(
+            stop - start
+            for (start, stop), result in zip(scored_windows, window_results)
+            if result is None
+        )
+
+        bouts = np.concatenate([r.bouts for r in results] or [np.empty(0, np.int64)])
+        probabilities = np.concatenate(
+            [r.probabilities for r in results] or [np.empty(0)]
+        )
+        outcomes = np.concatenate(
+            [r.outcomes for r in results] or [np.empty(0, np.int8)]
+        )
+        years = days[bouts].astype("datetime64[D]").astype("datetime64[Y]")
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            f"Backtested {model.version} on {len(outcomes)} bouts "
+            f"in {len(scored_windows)} yearly fits in {elapsed:.1f}s"
+        )
+        return {
+            "model_version": model.version,
+            "walk_forward": {
+                "refit": (
+                    ["standardization", "weights"]
+                    if learn_weights
+                    else ["standardization"]
+                ),
+                "hyperparameters": (
+                    {"epochs": epochs, "learning_rate": learning_rate, "l2": l2}
+                    if learn_weights
+                    else None
+                ),
+                "min_training_bouts": min_training_bouts,
+            },
+            "since": since.isoformat() if since is not None else None,
+            "bouts": len(days) - first,
+            "skipped_without_training_history": warmup,
+            "skipped_draws_and_no_contests": len(days) - first - warmup - len(outcomes),
+            "yearly_fits": len(scored_windows),
+            "seconds": round(elapsed, 3),
+            "point_in_time_features": [
+                name for name in model.feature_names if name in POINT_IN_TIME_FEATURES
+            ],
+            "imputed_features": [
+                name
+                for name in model.feature_names
+                if name not in POINT_IN_TIME_FEATURES
+            ],
+            "overall": prediction_metrics(probabilities, outcomes),
+            "by_year": {
+                str(year): {
+                    key: value
+                    for key, value in prediction_metrics(
+                        probabilities[years == year], outcomes[years == year]
+                    ).items()
+                    if key != "calibration"
+                }
+                for year in np.unique(years)
+            },
+        }
@@ -0,0 +1,273 @@
+import asyncio
+import multiprocessing
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from app.services.predictions.fight_predictor import FightPredictor, fight_predictor
+from app.services.predictions.logistic_model import sigmoid
+from app.services.predictions.simulation_trials import (
+    TRIAL_BATCH_SIZE,
+    simulate_bracket,
+    simulate_card,
+)
+from app.tools.exceptions.custom_api_exceptions import (
+    BadRequestException,
+    NotFoundException,
+)
+
+SIMULATION_WORKERS: int = int(os.getenv("SIMULATION_WORKERS", str(os.cpu_count() or 1)))
+
+FINISH_COLUMNS = ("win_by_ko_tko", "win_by_sub", "loss_by_ko_tko", "loss_by_sub")
+DECISION_COLUMNS = ("win_by_dec", "loss_by_dec")
+
+# Weight of the overall finish rate in each fighter's rate, in bouts; keeps
+# fighters with few recorded bouts close to the average.
+FINISH_RATE_PRIOR_BOUTS = 5
+
+
+class EventSimulator:
+    """
+    Monte Carlo simulation of brackets and event cards.
+
+    Trials are split into one shard per worker process, each with its own
+    random stream spawned from the request's seed, and each shard runs its
+    trials in vectorized batches (see `simulation_trials`). The event loop
+    only awaits the shards, so other requests are served meanwhile.
+    """
+
+    def __init__(
+        self,
+        predictor: FightPredictor = fight_predictor,
+        workers: int = SIMULATION_WORKERS,
+    ) -> None:
+        """
+        Initialize the simulator; the process pool starts on first use.
+
+        Args:
+            predictor (FightPredictor): Source of fighter scores and statistics.
+            workers (int): Number of worker processes.
+        """
+        self.predictor = predictor
+        self.workers = max(1, workers)
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it if needed."""
+        if self._pool is None:
+            # spawned rather than forked: the server process runs threads
+            self._pool = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    async def _run(
+        self,
+        kernel: typing.Callable[..., typing.Tuple[np.ndarray, ...]],
+        args: typing.Tuple[typing.Any, ...],
+        trials: int,
+        seed: int | None,
+    ) -> typing.Tuple[typing.Tuple[np.ndarray, ...], int]:
+        """
+        Run a trial kernel across the worker pool and add up the shards.
+
+        Args:
+            kernel (Callable): Function of `simulation_trials` to run.
+            args (tuple): Kernel arguments before the trial count and seed.
+            trials (int): Total number of trials.
+            seed (int | None): Root seed, random if None.
+
+        Returns:
+            tuple: (summed kernel counts, root seed used)
+        """
+        root = np.random.SeedSequence(seed)
+        shards = max(1, min(self.workers, -(-trials // TRIAL_BATCH_SIZE)))
+        sizes = [
+            trials // shards + (shard < trials % shards) for shard in range(shards)
+        ]
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, kernel, *args, size, stream)
+                for size, stream in zip(sizes, root.spawn(shards))
+            )
+        )
+        counts = type(results[0])(*(sum(arrays) for arrays in zip(*results)))
+        return counts, root.entropy
+
+    def _scores(self, fighter_ids: typing.Sequence[int]) -> np.ndarray:
+        """
+        Read the model scores of some fighters.
+
+        Raises:
+            NotFoundException: If any fighter is unknown.
+        """
+        scores = self.predictor.scores(fighter_ids)
+        missing = sorted(
+            {
+                fighter_id
+                for fighter_id, score in zip(fighter_ids, scores)
+                if np.isnan(score)
+            }
+        )
+        if missing:
+            raise NotFoundException(f"Fighters not found: {missing}")
+        return scores
+
+    def finish_rates(self, fighter_ids: typing.Sequence[int]) -> np.ndarray:
+        """
+        Estimate the share of each fighter's bouts that end in a finish.
+
+        Each fighter's KO/TKO and submission results are blended with the
+        overall rate (FINISH_RATE_PRIOR_BOUTS bouts worth of it).
+
+        Args:
+            fighter_ids (Sequence[int]): Known fighter IDs.
+
+        Returns:
+            np.ndarray: Finish rate per fighter.
+        """
+        matrix = self.predictor.matrix
+        finish_columns = [matrix.columns.index(name) for name in FINISH_COLUMNS]
+        decision_columns = [matrix.columns.index(name) for name in DECISION_COLUMNS]
+        active = matrix.active_rows()
+        overall_finishes = np.nansum(matrix.values[np.ix_(active, finish_columns)])
+        overall_decisions = np.nansum(matrix.values[np.ix_(active, decision_columns)])
+        total = overall_finishes + overall_decisions
+        prior = overall_finishes / total if total else 0.5
+
+        rows = matrix.rows(fighter_ids)
+        finishes = np.nansum(matrix.values[np.ix_(rows, finish_columns)], axis=1)
+        decisions = np.nansum(matrix.values[np.ix_(rows, decision_columns)], axis=1)
+        return (finishes + FINISH_RATE_PRIOR_BOUTS * prior) / (
+            finishes + decisions + FINISH_RATE_PRIOR_BOUTS
+        )
+
+    @staticmethod
+    def _finish_summary(
+        histogram: np.ndarray, trials: int
+    ) -> typing.Dict[str, typing.Any]:
+        """Summarize the distribution of the number of finishes per trial."""
+        distribution = histogram / trials
+        return {
+            "expected_finishes": float(distribution @ np.arange(len(distribution))),
+            "finishes_distribution": distribution.tolist(),
+        }
+
+    async def simulate_bracket(
+        self, fighter_ids: typing.Sequence[int], trials: int, seed: int | None = None
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Simulate a single-elimination bracket.
+
+        Args:
+            fighter_ids (Sequence[int]): Entrants in bracket order; a power of two.
+            trials (int): Number of trials.
+            seed (int | None): Root seed; results are reproducible for the same
+                seed and number of workers.
+
+        Returns:
+            Dict[str, Any]: Champion probability per entrant, the expected number
+            of finishes and its distribution, the seed and the model version.
+
+        Raises:
+            BadRequestException: If the entrants are not a power of two or repeat.
+            NotFoundException: If any fighter is unknown.
+        """
+        entrants = len(fighter_ids)
+        if entrants < 2 or entrants & (entrants - 1):
+            raise BadRequestException("A bracket needs a power of two entrants")
+        if len(set(fighter_ids)) != entrants:
+            raise BadRequestException("A fighter can only enter a bracket once")
+
+        scores = self._scores(fighter_ids)
+        counts, root_seed = await self._run(
+            simulate_bracket,
+            (scores, self.finish_rates(fighter_ids)),
+            trials,
+            seed,
+        )
+        return {
+            "trials": trials,
+            "seed": root_seed,
+            "model_version": self.predictor.model.version,
+            "fighters": sorted(
+                (
+                    {
+                        "fighter_id": fighter_id,
+                        "bracket_position": position + 1,
+                        "champion_probability": float(titles / trials),
+                    }
+                    for position, (fighter_id, titles) in enumerate(
+                        zip(fighter_ids, counts.champions)
+                    )
+                ),
+                key=lambda entrant: -entrant["champion_probability"],
+            ),
+            **self._finish_summary(counts.finish_histogram, trials),
+        }
+
+    async def simulate_card(
+        self,
+        bouts: typing.Sequence[typing.Tuple[int, int]],
+        trials: int,
+        seed: int | None = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Simulate the bouts of an event card.
+
+        Args:
+            bouts (Sequence[Tuple[int, int]]): (fighter_a, fighter_b) ID pairs.
+            trials (int): Number of trials.
+            seed (int | None): Root seed; results are reproducible for the same
+                seed and number of workers.
+
+        Returns:
+            Dict[str, Any]: Win and finish frequency per bout, the expected number
+            of finishes and its distribution, the seed and the model version.
+
+        Raises:
+            BadRequestException: If a fighter is matched against themselves.
+            NotFoundException: If any fighter is unknown.
+        """
+        if any(fighter_a == fighter_b for fighter_a, fighter_b in bouts):
+            raise BadRequestException("A fighter cannot be matched against themselves")
+
+        fighters_a = [fighter_a for fighter_a, _ in bouts]
+        fighters_b = [fighter_b for _, fighter_b in bouts]
+        scores = self._scores(fighters_a + fighters_b)
+        rates = self.finish_rates(fighters_a + fighters_b)
+        win_probabilities = sigmoid(scores[: len(bouts)] - scores[len(bouts) :])
+        finish_probabilities = 0.5 * (rates[: len(bouts)] + rates[len(bouts) :])
+        counts, root_seed = await self._run(
+            simulate_card, (win_probabilities, finish_probabilities), trials, seed
+        )
+        return {
+            "trials": trials,
+            "seed": root_seed,
+            "model_version": self.predictor.model.version,
+            "bouts": [
+                {
+                    "fighter_a": fighter_a,
+                    "fighter_b": fighter_b,
+                    "fighter_a_win_probability": float(wins / trials),
+                    "finish_probability": float(finishes / trials),
+                }
+                for (fighter_a, fighter_b), wins, finishes in zip(
+                    bouts, counts.wins, counts.finishes
+                )
+            ],
+            **self._finish_summary(counts.finish_histogram, trials),
+        }
+
+
+event_simulator = EventSimulator()
@@ -0,0 +1,180 @@
+import hashlib
+import typing
+from datetime import date
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import BaseStats, DerivedStats, ExtendedStats, FightsResults
+from app.services.fighters.fighter_utils import FighterUtils
+
+FEATURE_MODELS = (BaseStats, ExtendedStats, FightsResults, DerivedStats)
+
+# Depends on the current date, so computed when a row is written instead of
+# being stored in `fighter_derived_stats`.
+DAYS_SINCE_LAST_FIGHT = "days_since_last_fight"
+
+# Every numeric stats column; NULLs are stored as NaN.
+FEATURE_COLUMNS = (
+    *(
+        column.key
+        for model in FEATURE_MODELS
+        for column in model.__table__.columns
+        if column.key != "fighter_id" and column.type.python_type in (int, float)
+    ),
+    DAYS_SINCE_LAST_FIGHT,
+)
+
+INITIAL_CAPACITY = 1024
+
+
+class FeatureMatrix:
+    """
+    Fighter statistics as a dense NumPy matrix with one row per fighter.
+
+    Rows are addressed through a fighter_id -> row dictionary, so gathering the
+    features of any set of fighters is a dictionary lookup plus one fancy
+    index. Rows of deleted fighters are recycled by later inserts.
+
+    Attributes:
+        columns (tuple[str, ...]): Feature names, one per matrix column.
+        values (np.ndarray): float64 array of shape (capacity, len(columns)).
+        fighter_ids (np.ndarray): int64 fighter ID per row, -1 for unused rows.
+        weight_classes (list[str | None]): Weight class per row.
+        fingerprints (list[str | None]): Digest of each row's values; changes
+            whenever the fighter's features do and is equal across workers.
+        row_of (dict[int, int]): Row index per fighter ID.
+    """
+
+    def __init__(self, columns: typing.Sequence[str] = FEATURE_COLUMNS) -> None:
+        """
+        Initialize an empty matrix.
+
+        Args:
+            columns (Sequence[str]): Feature names.
+        """
+        self.columns = tuple(columns)
+        self.values = np.full((INITIAL_CAPACITY, len(self.columns)), np.nan)
+        self.fighter_ids = np.full(INITIAL_CAPACITY, -1, dtype=np.int64)
+        self.weight_classes: typing.List[str | None] = [None] * INITIAL_CAPACITY
+        self.fingerprints: typing.List[str | None] = [None] * INITIAL_CAPACITY
+        self.row_of: typing.Dict[int, int] = {}
+        self._free_rows: typing.List[int] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of fighters in the matrix."""
+        return len(self.row_of)
+
+    def _grow(self) -> None:
+        """Double the row capacity."""
+        capacity = len(self.fighter_ids)
+        self.values = np.vstack(
+            (self.values, np.full((capacity, len(self.columns)), np.nan))
+        )
+        self.fighter_ids = np.concatenate(
+            (self.fighter_ids, np.full(capacity, -1, dtype=np.int64))
+        )
+        self.weight_classes.extend([None] * capacity)
+        self.fingerprints.extend([None] * capacity)
+
+    def upsert(self, record: typing.Dict[str, typing.Any]) -> int:
+        """
+        Insert or overwrite the row of one fighter.
+
+        Args:
+            record (Dict[str, Any]): Flat fighter record (see `FighterUtils.get_flat_records`).
+
+        Returns:
+            int: Row index of the fighter.
+        """
+        fighter_id = record["fighter_id"]
+        row = self.row_of.get(fighter_id)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                if self._size == len(self.fighter_ids):
+                    self._grow()
+                row = self._size
+                self._size += 1
+            self.row_of[fighter_id] = row
+            self.fighter_ids[row] = fighter_id
+
+        last_fight_date = record.get("last_fight_date")
+        record = {
+            **record,
+            DAYS_SINCE_LAST_FIGHT: (
+                (date.today() - last_fight_date).days
+                if isinstance(last_fight_date, date)
+                else None
+            ),
+        }
+        self.values[row] = [
+            np.nan if record.get(column) is None else record[column]
+            for column in self.columns
+        ]
+        self.weight_classes[row] = record.get("weight_class")
+        self.fingerprints[row] = hashlib.blake2b(
+            self.values[row].tobytes(), digest_size=8
+        ).hexdigest()
+        return row
+
+    def remove(self, fighter_id: int) -> None:
+        """
+        Drop a fighter, keeping its row for reuse.
+
+        Args:
+            fighter_id (int): Fighter ID.
+        """
+        row = self.row_of.pop(fighter_id, None)
+        if row is not None:
+            self.values[row] = np.nan
+            self.fighter_ids[row] = -1
+            self.weight_classes[row] = None
+            self.fingerprints[row] = None
+            self._free_rows.append(row)
+
+    def rows(self, fighter_ids: typing.Iterable[int]) -> np.ndarray:
+        """
+        Map fighter IDs to row indexes.
+
+        Args:
+            fighter_ids (Iterable[int]): Fighter IDs.
+
+        Returns:
+            np.ndarray: int64 row index per ID, -1 for unknown fighters.
+        """
+        return np.fromiter(
+            (self.row_of.get(fighter_id, -1) for fighter_id in fighter_ids),
+            dtype=np.int64,
+        )
+
+    def active_rows(self) -> np.ndarray:
+        """
+        Return the indexes of rows that hold a fighter.
+
+        Returns:
+            np.ndarray: int64 row indexes in ascending order.
+        """
+        return np.flatnonzero(self.fighter_ids[: self._size] >= 0)
+
+    @classmethod
+    async def load(
+        cls, db: AsyncSession, columns: typing.Sequence[str] = FEATURE_COLUMNS
+    ) -> "FeatureMatrix":
+        """
+        Build the matrix from PostgreSQL with one streamed query.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+            columns (Sequence[str]): Feature names.
+
+        Returns:
+            FeatureMatrix: Matrix holding every fighter.
+        """
+        matrix = cls(columns)
+        async for chunk in FighterUtils(db).stream_flat_records():
+            for record in chunk:
+                matrix.upsert(record)
+        return matrix
@@ -0,0 +1,305 @@
+import asyncio
+import json
+import os
+import time
+import typing
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import STREAM_CHUNK_SIZE
+from app.services.fighters.fighter_utils import FighterUtils
+from app.services.predictions.feature_matrix import FeatureMatrix
+from app.services.predictions.logistic_model import LogisticModel
+from app.services.predictions.model_artifacts import model_store
+from app.tools.exceptions.custom_api_exceptions import (
+    BadRequestException,
+    NotFoundException,
+)
+from app.tools.logger import logger
+
+# Workers only see the writes they handle themselves, so the matrix is
+# reloaded from PostgreSQL once it is older than this.
+PREDICTION_MAX_AGE_SECONDS: int = int(os.getenv("PREDICTION_MAX_AGE_SECONDS", "300"))
+
+
+class FightPredictor:
+    """
+    In-memory fight outcome predictor.
+
+    Holds the feature matrix of every fighter and the active model, so a
+    prediction is two dictionary lookups and one small vectorized pass with
+    no database access. The matrix is loaded on startup, kept current by
+    `FighterUpdater` and reloaded after PREDICTION_MAX_AGE_SECONDS.
+
+    Attributes:
+        matrix (FeatureMatrix | None): Fighter features, None until loaded.
+        model (LogisticModel | None): Active model, None until loaded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty predictor."""
+        self.matrix: FeatureMatrix | None = None
+        self.model: LogisticModel | None = None
+        self._feature_columns: np.ndarray | None = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _activate(self, matrix: FeatureMatrix, model: LogisticModel) -> None:
+        """
+        Swap in a matrix and model together.
+
+        Args:
+            matrix (FeatureMatrix): Fighter features.
+            model (LogisticModel): Model whose features all exist in the matrix.
+        """
+        self._feature_columns = np.array(
+            [matrix.columns.index(name) for name in model.feature_names],
+            dtype=np.int64,
+        )
+        self.matrix, self.model = matrix, model
+        self._loaded_at = time.monotonic()
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """
+        Reload the feature matrix from PostgreSQL and pick the model.
+
+        The trained model artifact is used when one is active and its features
+        exist in the matrix, the default model otherwise.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+
+        Returns:
+            int: Number of fighters loaded.
+        """
+        matrix = await FeatureMatrix.load(db)
+        model = model_store.load()
+        if model is None or not set(model.feature_names) <= set(matrix.columns):
+            if model is not None:
+                logger.warning(
+                    f"Model {model.version} uses unknown features, "
+                    "falling back to the default model"
+                )
+            model = LogisticModel.default(matrix)
+        self._activate(matrix, model)
+        logger.info(f"Loaded prediction features for {len(matrix)} fighters")
+        return len(matrix)
+
+    async def ensure_ready(self, db: AsyncSession) -> None:
+        """
+        Load the matrix if it is missing or older than PREDICTION_MAX_AGE_SECONDS.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+        """
+        if self._is_fresh():
+            return
+        async with self._lock:
+            if not self._is_fresh():
+                await self.rebuild(db)
+
+    def _is_fresh(self) -> bool:
+        """Return True if a matrix is loaded and not older than the maximum age."""
+        return (
+            self.matrix is not None
+            and time.monotonic() - self._loaded_at < PREDICTION_MAX_AGE_SECONDS
+        )
+
+    def update(
+        self,
+        removed: typing.Iterable[typing.Dict[str, typing.Any]],
+        added: typing.Iterable[typing.Dict[str, typing.Any]],
+    ) -> None:
+        """
+        Apply a committed fighter write to the feature matrix.
+
+        Args:
+            removed (Iterable[Dict[str, Any]]): Flat records before the write (updated or deleted fighters).
+            added (Iterable[Dict[str, Any]]): Flat records after the write (inserted or updated fighters).
+        """
+        if self.matrix is None:
+            return
+        for record in removed:
+            self.matrix.remove(record["fighter_id"])
+        for record in added:
+            self.matrix.upsert(record)
+
+    def predict_rows(self, rows_a: np.ndarray, rows_b: np.ndarray) -> np.ndarray:
+        """
+        Score matchups given as matrix row indexes.
+
+        Args:
+            rows_a (np.ndarray): Row indexes of the A fighters.
+            rows_b (np.ndarray): Row indexes of the B fighters.
+
+        Returns:
+            np.ndarray: P(A beats B) per pair.
+        """
+        values = self.matrix.values
+        return self.model.predict_proba(
+            values[np.ix_(rows_a, self._feature_columns)],
+            values[np.ix_(rows_b, self._feature_columns)],
+        )
+
+    def scores(self, fighter_ids: typing.Sequence[int]) -> np.ndarray:
+        """
+        Compute the model score of some fighters.
+
+        Args:
+            fighter_ids (Sequence[int]): Fighter IDs.
+
+        Returns:
+            np.ndarray: Score per fighter, NaN for unknown fighters.
+        """
+        rows = self.matrix.rows(fighter_ids)
+        known = rows >= 0
+        scores = np.full(len(rows), np.nan)
+        scores[known] = self.model.scores(
+            self.matrix.values[np.ix_(rows[known], self._feature_columns)]
+        )
+        return scores
+
+    def predict(self, fighter_a: int, fighter_b: int) -> typing.Dict[str, typing.Any]:
+        """
+        Predict the outcome of one fight.
+
+        Args:
+            fighter_a (int): ID of the first fighter.
+            fighter_b (int): ID of the second fighter.
+
+        Returns:
+            Dict[str, Any]: Both IDs, each fighter's win probability and the model version.
+
+        Raises:
+            BadRequestException: If both IDs are the same fighter.
+            NotFoundException: If either fighter does not exist.
+        """
+        if fighter_a == fighter_b:
+            raise BadRequestException("A fighter cannot be matched against themselves")
+        rows = self.matrix.rows((fighter_a, fighter_b))
+        missing = [
+            fighter_id
+            for fighter_id, row in zip((fighter_a, fighter_b), rows)
+            if row < 0
+        ]
+        if missing:
+            raise NotFoundException(f"Fighters not found: {missing}")
+
+        probability = float(self.predict_rows(rows[:1], rows[1:])[0])
+        return self._prediction(fighter_a, fighter_b, probability)
+
+    def _prediction(
+        self, fighter_a: int, fighter_b: int, probability: float
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Format one prediction.
+
+        Args:
+            fighter_a (int): ID of the first fighter.
+            fighter_b (int): ID of the second fighter.
+            probability (float): P(fighter A wins).
+
+        Returns:
+            Dict[str, Any]: Both IDs, each fighter's win probability and the model version.
+        """
+        return {
+            "fighter_a": fighter_a,
+            "fighter_b": fighter_b,
+            "fighter_a_win_probability": probability,
+            "fighter_b_win_probability": 1.0 - probability,
+            "model_version": self.model.version,
+        }
+
+    async def refresh(
+        self, db: AsyncSession, fighter_ids: typing.Iterable[int]
+    ) -> None:
+        """
+        Reload the rows of some fighters from PostgreSQL in one query.
+
+        Picks up writes handled by other workers before a batch is scored.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+            fighter_ids (Iterable[int]): Fighters to reload.
+        """
+        fighter_ids = set(fighter_ids)
+        records = await FighterUtils(db).get_flat_records(fighter_ids)
+        found = {record["fighter_id"] for record in records}
+        self.update(
+            [{"fighter_id": fighter_id} for fighter_id in fighter_ids - found], records
+        )
+
+    def predict_pairs(
+        self, pairs: typing.Sequence[typing.Tuple[int, int]]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Predict many fights in one vectorized pass.
+
+        Invalid pairs get an `error` entry instead of failing the batch.
+
+        Args:
+            pairs (Sequence[Tuple[int, int]]): (fighter_a, fighter_b) ID pairs.
+
+        Returns:
+            list[dict]: One prediction or error per pair, in input order, each with its `index`.
+        """
+        fighters_a = np.array([pair[0] for pair in pairs], dtype=np.int64)
+        fighters_b = np.array([pair[1] for pair in pairs], dtype=np.int64)
+        rows_a = self.matrix.rows(fighters_a.tolist())
+        rows_b = self.matrix.rows(fighters_b.tolist())
+        valid = (rows_a >= 0) & (rows_b >= 0) & (fighters_a != fighters_b)
+        probabilities = np.full(len(pairs), np.nan)
+        probabilities[valid] = self.predict_rows(rows_a[valid], rows_b[valid])
+
+        results = []
+        for index, (fighter_a, fighter_b) in enumerate(pairs):
+            if valid[index]:
+                result = self._prediction(
+                    fighter_a, fighter_b, float(probabilities[index])
+                )
+            else:
+                missing = [
+                    fighter_id
+                    for fighter_id, row in (
+                        (fighter_a, rows_a[index]),
+                        (fighter_b, rows_b[index]),
+                    )
+                    if row < 0
+                ]
+                result = {
+                    "fighter_a": fighter_a,
+                    "fighter_b": fighter_b,
+                    "error": (
+                        f"Fighters not found: {missing}"
+                        if missing
+                        else "A fighter cannot be matched against themselves"
+                    ),
+                }
+            results.append({"index": index, **result})
+        return results
+
+    async def stream_predictions(
+        self,
+        pairs: typing.Sequence[typing.Tuple[int, int]],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> typing.AsyncIterator[str]:
+        """
+        Predict many fights and serialize them as newline-delimited JSON.
+
+        Args:
+            pairs (Sequence[Tuple[int, int]]): (fighter_a, fighter_b) ID pairs.
+            chunk_size (int): Number of results serialized per chunk.
+
+        Yields:
+            str: NDJSON fragment with up to `chunk_size` results.
+        """
+        results = self.predict_pairs(pairs)
+        for start in range(0, len(results), chunk_size):
+            yield "".join(
+                f"{json.dumps(result)}\n"
+                for result in results[start : start + chunk_size]
+            )
+
+
+fight_predictor = FightPredictor()
@@ -0,0 +1,127 @@
+import typing
+import warnings
+
+import numpy as np
+
+# Logistic regression math shared by the API, offline training and the
+# worker processes of the tuner and backtester; only NumPy is imported so
+# spawned workers can use it without loading the web app.
+
+DEFAULT_EPOCHS = 2000
+DEFAULT_LEARNING_RATE = 0.5
+DEFAULT_L2 = 1e-3
+DEFAULT_TOLERANCE = 1e-9
+
+
+def sigmoid(logits: np.ndarray) -> np.ndarray:
+    """
+    Numerically stable logistic function.
+
+    Args:
+        logits (np.ndarray): Log-odds.
+
+    Returns:
+        np.ndarray: Probabilities.
+    """
+    return np.exp(-np.logaddexp(0.0, -logits))
+
+
+def fit_standardization(values: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute per-column mean and standard deviation, ignoring missing values.
+
+    Args:
+        values (np.ndarray): Raw features, shape (n, features), NaN for missing.
+
+    Returns:
+        tuple: (mean, scale); empty columns get mean 0 and constant ones scale 1.
+    """
+    # columns without any value yield NaN (and a warning), handled below
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean = np.nanmean(values, axis=0)
+        scale = np.nanstd(values, axis=0)
+    mean = np.nan_to_num(mean, nan=0.0)
+    scale = np.where(np.isnan(scale) | (scale == 0), 1.0, scale)
+    return mean, scale
+
+
+def log_loss(
+    features: np.ndarray,
+    wins: np.ndarray,
+    fights: np.ndarray,
+    weights: np.ndarray,
+    bias: float,
+) -> float:
+    """
+    Mean log loss per fight of a binomial logistic model.
+
+    Args:
+        features (np.ndarray): Standardized features, shape (n, features).
+        wins (np.ndarray): Wins per fighter.
+        fights (np.ndarray): Decided fights per fighter.
+        weights (np.ndarray): Feature weights.
+        bias (float): Intercept.
+
+    Returns:
+        float: Log loss averaged over all fights.
+    """
+    logits = features @ weights + bias
+    # log(1 + e^-x) and log(1 + e^x), computed without overflow
+    loss = wins * np.logaddexp(0.0, -logits) + (fights - wins) * np.logaddexp(
+        0.0, logits
+    )
+    return float(loss.sum() / fights.sum())
+
+
+def fit_logistic(
+    features: np.ndarray,
+    wins: np.ndarray,
+    fights: np.ndarray,
+    epochs: int = DEFAULT_EPOCHS,
+    learning_rate: float = DEFAULT_LEARNING_RATE,
+    l2: float = DEFAULT_L2,
+    tolerance: float = DEFAULT_TOLERANCE,
+    weights: np.ndarray | None = None,
+    bias: float = 0.0,
+) -> typing.Tuple[np.ndarray, float, int]:
+    """
+    Fit a binomial logistic regression with full-batch gradient descent.
+
+    Each fighter contributes `wins` successes out of `fights` trials, so the
+    model learns the log-odds of winning a fight from the fighter's own
+    features. The intercept absorbs the average win rate; the weights are
+    what the predictor uses on feature differences.
+
+    Args:
+        features (np.ndarray): Standardized features, shape (n, features).
+        wins (np.ndarray): Wins per fighter.
+        fights (np.ndarray): Decided fights per fighter.
+        epochs (int): Maximum number of gradient steps.
+        learning_rate (float): Step size.
+        l2 (float): L2 penalty on the weights (not the intercept).
+        tolerance (float): Stop once the loss improves by less than this.
+        weights (np.ndarray | None): Starting weights, zeros if None; lets a
+            fit be resumed.
+        bias (float): Starting intercept.
+
+    Returns:
+        tuple: (weights, intercept, number of steps taken)
+    """
+    weights = (
+        np.zeros(features.shape[1]) if weights is None else np.array(weights, float)
+    )
+    total = fights.sum()
+    previous = np.inf
+    epoch = 0
+    for epoch in range(1, epochs + 1):
+        residual = (fights * sigmoid(features @ weights + bias) - wins) / total
+        weights -= learning_rate * (features.T @ residual + l2 * weights)
+        bias -= learning_rate * residual.sum()
+        loss = log_loss(features, wins, fights, weights, bias) + 0.5 * l2 * float(
+            weights @ weights
+        )
+        if previous - loss < tolerance:
+            break
+        previous = loss
+    return weights, bias, epoch
@@ -0,0 +1,142 @@
+import hashlib
+import typing
+
+import numpy as np
+
+from app.services.predictions.feature_matrix import FeatureMatrix
+from app.services.predictions.logistic_fit import fit_standardization, sigmoid
+
+DEFAULT_MODEL_VERSION = "default"
+
+# Weights of the default model on standardized feature differences, used until
+# a trained model is available. Positive weights favour the higher value.
+DEFAULT_WEIGHTS = {
+    "reach": 0.15,
+    "height": 0.05,
+    "age": -0.2,
+    "slpm": 0.3,
+    "str_acc": 0.25,
+    "sapm": -0.3,
+    "str_def": 0.25,
+    "td_avg": 0.2,
+    "td_acc": 0.15,
+    "td_def": 0.2,
+    "sub_avg": 0.1,
+    "win_by_ko_tko": 0.2,
+    "loss_by_ko_tko": -0.2,
+    "win_by_sub": 0.15,
+    "loss_by_sub": -0.15,
+    "win_by_dec": 0.1,
+    "loss_by_dec": -0.1,
+}
+
+
+class LogisticModel:
+    """
+    Logistic model of P(fighter A beats fighter B) on feature differences.
+
+    Both fighters' features are standardized, missing values become the
+    column mean (0 after standardization), and the log-odds are the weighted
+    difference of the two vectors. Without a bias term the model is
+    antisymmetric: P(A beats B) = 1 - P(B beats A).
+
+    Attributes:
+        feature_names (tuple[str, ...]): Features the weights apply to, in order.
+        mean (np.ndarray): Per-feature mean used for standardization.
+        scale (np.ndarray): Per-feature standard deviation used for standardization.
+        weights (np.ndarray): Per-feature weights.
+        version (str): Model identifier reported with predictions.
+    """
+
+    def __init__(
+        self,
+        feature_names: typing.Sequence[str],
+        mean: np.ndarray,
+        scale: np.ndarray,
+        weights: np.ndarray,
+        version: str,
+    ) -> None:
+        """
+        Initialize the model.
+
+        Args:
+            feature_names (Sequence[str]): Features the weights apply to.
+            mean (np.ndarray): Per-feature mean.
+            scale (np.ndarray): Per-feature standard deviation, non-zero.
+            weights (np.ndarray): Per-feature weights.
+            version (str): Model identifier.
+        """
+        self.feature_names = tuple(feature_names)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.version = version
+
+    def standardize(self, features: np.ndarray) -> np.ndarray:
+        """
+        Standardize raw features, imputing missing values with the mean.
+
+        Args:
+            features (np.ndarray): Raw features, shape (..., len(feature_names)).
+
+        Returns:
+            np.ndarray: Standardized features with NaN replaced by 0.
+        """
+        return np.nan_to_num((features - self.mean) / self.scale, nan=0.0)
+
+    def predict_proba(
+        self, features_a: np.ndarray, features_b: np.ndarray
+    ) -> np.ndarray:
+        """
+        Score fighter A against fighter B for every row.
+
+        Args:
+            features_a (np.ndarray): Raw features of the A fighters, shape (n, features).
+            features_b (np.ndarray): Raw features of the B fighters, shape (n, features).
+
+        Returns:
+            np.ndarray: P(A beats B) per row, shape (n,).
+        """
+        return sigmoid(self.scores(features_a) - self.scores(features_b))
+
+    def scores(self, features: np.ndarray) -> np.ndarray:
+        """
+        Compute each fighter's strength on the log-odds scale.
+
+        P(A beats B) is `sigmoid(score_A - score_B)`, so scores of a group of
+        fighters are enough to derive every pairwise probability.
+
+        Args:
+            features (np.ndarray): Raw features, shape (n, features).
+
+        Returns:
+            np.ndarray: Score per row, shape (n,).
+        """
+        return self.standardize(features) @ self.weights
+
+    @classmethod
+    def default(cls, matrix: FeatureMatrix) -> "LogisticModel":
+        """
+        Build the hand-weighted default model, standardized on the current fighters.
+
+        Args:
+            matrix (FeatureMatrix): Feature matrix to compute the mean and scale from.
+
+        Returns:
+            LogisticModel: Default model over DEFAULT_WEIGHTS.
+        """
+        names = [name for name in DEFAULT_WEIGHTS if name in matrix.columns]
+        columns = [matrix.columns.index(name) for name in names]
+        mean, scale = fit_standardization(
+            matrix.values[np.ix_(matrix.active_rows(), columns)]
+        )
+        weights = np.array([DEFAULT_WEIGHTS[name] for name in names])
+        # the standardization depends on the data, so it is part of the version
+        digest = hashlib.sha1(np.concatenate((mean, scale, weights)).tobytes())
+        return cls(
+            names,
+            mean,
+            scale,
+            weights,
+            f"{DEFAULT_MODEL_VERSION}-{digest.hexdigest()[:8]}",
+        )
@@ -0,0 +1,411 @@
+import hashlib
+import json
+import os
+import re
+import typing
+import uuid
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import BaseStats, ExtendedStats, FightsResults
+from app.db.models.fighters import Fighters
+from app.services.fighters.fighter_utils import STATS_FROM
+from app.services.predictions.fight_predictor import FightPredictor
+from app.services.predictions.logistic_model import sigmoid
+from app.tools.exceptions.custom_api_exceptions import NotFoundException
+from app.tools.logger import logger
+
+MATCHUP_MATRIX_DIR = Path(os.getenv("MATCHUP_MATRIX_DIR", "data/matchups"))
+
+# Rows computed or copied per step; bounds the temporary arrays to ROW_CHUNK x N.
+ROW_CHUNK = 512
+
+# Latest change to any of the fighter's tables.
+LAST_UPDATED = func.greatest(
+    Fighters.last_updated,
+    BaseStats.last_updated,
+    ExtendedStats.last_updated,
+    FightsResults.last_updated,
+)
+
+
+def _file_stem(weight_class: str) -> str:
+    """
+    Build a file name stem for a weight class.
+
+    Args:
+        weight_class (str): Weight class name.
+
+    Returns:
+        str: Readable slug plus a short hash keeping distinct names apart.
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", weight_class.lower()).strip("-")
+    return f"{slug}-{hashlib.sha1(weight_class.encode()).hexdigest()[:8]}"
+
+
+def _read_metadata(path: Path) -> typing.Dict[str, typing.Any] | None:
+    """
+    Read the metadata file of a matchup matrix.
+
+    Args:
+        path (Path): Metadata file path.
+
+    Returns:
+        Dict[str, Any] | None: Metadata, None if the file does not exist.
+    """
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+
+
+class MatchupMatrixBuilder:
+    """
+    Computes the pairwise win-probability matrix of every weight class.
+
+    Each matrix is a float32 `.npy` file where entry [i, j] is P(fighter i
+    beats fighter j), with a JSON file holding the fighter IDs of the rows,
+    their `last_updated` dates and the model version. On rebuild, entries of
+    fighters unchanged since the previous build are copied over, and only the
+    rows and columns of new or updated fighters are recomputed. Files are
+    replaced atomically, so readers always see a complete matrix.
+    """
+
+    def __init__(self, db: AsyncSession, directory: Path = MATCHUP_MATRIX_DIR) -> None:
+        """
+        Initialize the builder.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+            directory (Path): Directory holding the matrices.
+        """
+        self.db = db
+        self.directory = directory
+
+    async def _load_weight_classes(
+        self,
+    ) -> typing.Dict[str, typing.Tuple[typing.List[int], typing.List[str | None]]]:
+        """
+        Read every fighter's weight class and last update date.
+
+        Returns:
+            Dict[str, Tuple[list, list]]: (fighter IDs, ISO last_updated dates) per weight class.
+        """
+        result = await self.db.execute(
+            select(Fighters.fighter_id, Fighters.weight_class, LAST_UPDATED)
+            .select_from(STATS_FROM)
+            .where(Fighters.weight_class.is_not(None))
+            .order_by(Fighters.weight_class, Fighters.fighter_id)
+        )
+        classes = defaultdict(lambda: ([], []))
+        for fighter_id, weight_class, last_updated in result.all():
+            ids, dates = classes[weight_class]
+            ids.append(fighter_id)
+            dates.append(last_updated.isoformat() if last_updated else None)
+        return classes
+
+    async def build(self, full: bool = False) -> typing.Dict[str, int]:
+        """
+        Bring the matrix of every weight class up to date.
+
+        Args:
+            full (bool): Recompute every entry instead of only changed fighters.
+
+        Returns:
+            Dict[str, int]: Number of recomputed rows per weight class.
+        """
+        predictor = FightPredictor()
+        await predictor.rebuild(self.db)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        recomputed = {}
+        classes = await self._load_weight_classes()
+        for weight_class, (fighter_ids, last_updated) in classes.items():
+            recomputed[weight_class] = self._build_weight_class(
+                weight_class, fighter_ids, last_updated, predictor, full
+            )
+
+        current = {f"{_file_stem(weight_class)}.json" for weight_class in classes}
+        for path in self.directory.glob("*.json"):
+            if path.name not in current:
+                self._remove(path)
+        return recomputed
+
+    def _build_weight_class(
+        self,
+        weight_class: str,
+        fighter_ids: typing.List[int],
+        last_updated: typing.List[str | None],
+        predictor: FightPredictor,
+        full: bool,
+    ) -> int:
+        """
+        Write the matrix of one weight class.
+
+        Args:
+            weight_class (str): Weight class name.
+            fighter_ids (list[int]): Fighters of the class, in row order.
+            last_updated (list[str | None]): ISO date of each fighter's last change.
+            predictor (FightPredictor): Loaded predictor providing the scores.
+            full (bool): Ignore the previous matrix.
+
+        Returns:
+            int: Number of recomputed rows.
+        """
+        stem = _file_stem(weight_class)
+        metadata_path = self.directory / f"{stem}.json"
+        previous = _read_metadata(metadata_path)
+        size = len(fighter_ids)
+        scores = predictor.scores(fighter_ids)
+
+        matrix_file = f"{stem}-{uuid.uuid4().hex[:12]}.npy"
+        matrix = np.lib.format.open_memmap(
+            self.directory / matrix_file,
+            mode="w+",
+            dtype=np.float32,
+            shape=(size, size),
+        )
+        stale = np.ones(size, dtype=bool)
+        if (
+            previous is not None
+            and not full
+            and previous["model_version"] == predictor.model.version
+        ):
+            kept_new, kept_old = self._unchanged_rows(
+                previous, fighter_ids, last_updated
+            )
+            if kept_new:
+                old_matrix = np.load(
+                    self.directory / previous["matrix_file"], mmap_mode="r"
+                )
+                for start in range(0, len(kept_new), ROW_CHUNK):
+                    matrix[np.ix_(kept_new[start : start + ROW_CHUNK], kept_new)] = (
+                        old_matrix[
+                            np.ix_(kept_old[start : start + ROW_CHUNK], kept_old)
+                        ]
+                    )
+                stale[kept_new] = False
+
+        stale_rows = np.flatnonzero(stale)
+        for start in range(0, len(stale_rows), ROW_CHUNK):
+            rows = stale_rows[start : start + ROW_CHUNK]
+            block = sigmoid(scores[rows, None] - scores[None, :]).astype(np.float32)
+            matrix[rows, :] = block
+            matrix[:, rows] = 1 - block.T
+        matrix.flush()
+        del matrix
+
+        metadata = {
+            "weight_class": weight_class,
+            "model_version": predictor.model.version,
+            "built_on": date.today().isoformat(),
+            "matrix_file": matrix_file,
+            "fighter_ids": fighter_ids,
+            "last_updated": last_updated,
+        }
+        temporary_path = metadata_path.with_suffix(".json.tmp")
+        temporary_path.write_text(json.dumps(metadata))
+        os.replace(temporary_path, metadata_path)
+        if previous is not None:
+            (self.directory / previous["matrix_file"]).unlink(missing_ok=True)
+
+        logger.info(
+            f"Matchup matrix {weight_class}: {size} fighters, "
+            f"{len(stale_rows)} rows recomputed"
+        )
+        return len(stale_rows)
+
+    @staticmethod
+    def _unchanged_rows(
+        previous: typing.Dict[str, typing.Any],
+        fighter_ids: typing.List[int],
+        last_updated: typing.List[str | None],
+    ) -> typing.Tuple[typing.List[int], typing.List[int]]:
+        """
+        Match fighters whose rows in the previous matrix are still valid.
+
+        `last_updated` only has day precision, so fighters changed on the day
+        of the previous build are treated as changed.
+
+        Args:
+            previous (Dict[str, Any]): Metadata of the previous matrix.
+            fighter_ids (list[int]): Fighters of the new matrix, in row order.
+            last_updated (list[str | None]): ISO date of each fighter's last change.
+
+        Returns:
+            tuple: (row indexes in the new matrix, matching row indexes in the previous one)
+        """
+        previous_rows = {
+            fighter_id: (row, updated)
+            for row, (fighter_id, updated) in enumerate(
+                zip(previous["fighter_ids"], previous["last_updated"])
+            )
+        }
+        kept_new, kept_old = [], []
+        for row, (fighter_id, updated) in enumerate(zip(fighter_ids, last_updated)):
+            old_row, old_updated = previous_rows.get(fighter_id, (None, None))
+            if (
+                old_row is not None
+                and old_updated == updated
+                and (updated is None or updated < previous["built_on"])
+            ):
+                kept_new.append(row)
+                kept_old.append(old_row)
+        return kept_new, kept_old
+
+    def _remove(self, metadata_path: Path) -> None:
+        """
+        Delete the matrix of a weight class that no longer has fighters.
+
+        Args:
+            metadata_path (Path): Metadata file of the matrix.
+        """
+        metadata = _read_metadata(metadata_path)
+        metadata_path.unlink(missing_ok=True)
+        if metadata is not None:
+            (self.directory / metadata["matrix_file"]).unlink(missing_ok=True)
+
+
+class MatchupMatrixStore:
+    """
+    Read-only access to the matchup matrices written by `MatchupMatrixBuilder`.
+
+    Matrices are memory-mapped, so every worker shares the same page cache
+    and a lookup reads one entry or one row. A matrix is reopened when its
+    metadata file changes.
+    """
+
+    def __init__(self, directory: Path = MATCHUP_MATRIX_DIR) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            directory (Path): Directory holding the matrices.
+        """
+        self.directory = directory
+        self._entries: typing.Dict[str, typing.Tuple[int, dict, np.ndarray, dict]] = {}
+
+    def _get(
+        self, weight_class: str
+    ) -> typing.Tuple[typing.Dict[int, int], np.ndarray, typing.Dict[str, typing.Any]]:
+        """
+        Open or reuse the matrix of a weight class.
+
+        Args:
+            weight_class (str): Weight class name.
+
+        Returns:
+            tuple: (row index per fighter ID, memory-mapped matrix, metadata)
+
+        Raises:
+            NotFoundException: If no matrix was built for the weight class.
+        """
+        metadata_path = self.directory / f"{_file_stem(weight_class)}.json"
+        # retried once in case a rebuild replaces the files while they are opened
+        for attempt in range(2):
+            try:
+                modified = metadata_path.stat().st_mtime_ns
+                cached = self._entries.get(weight_class)
+                if cached is not None and cached[0] == modified:
+                    return cached[1], cached[2], cached[3]
+                metadata = json.loads(metadata_path.read_text())
+                matrix = np.load(
+                    self.directory / metadata["matrix_file"], mmap_mode="r"
+                )
+            except FileNotFoundError:
+                if attempt:
+                    raise NotFoundException(
+                        f"No matchup matrix for weight class {weight_class}"
+                    )
+                continue
+            index = {
+                fighter_id: row
+                for row, fighter_id in enumerate(metadata["fighter_ids"])
+            }
+            self._entries[weight_class] = (modified, index, matrix, metadata)
+            return index, matrix, metadata
+
+    @staticmethod
+    def _row(index: typing.Dict[int, int], fighter_id: int, weight_class: str) -> int:
+        """
+        Find the row of a fighter.
+
+        Raises:
+            NotFoundException: If the fighter is not in the matrix.
+        """
+        row = index.get(fighter_id)
+        if row is None:
+            raise NotFoundException(
+                f"Fighter {fighter_id} not found in the {weight_class} matchup matrix"
+            )
+        return row
+
+    def get_probability(
+        self, weight_class: str, fighter_a: int, fighter_b: int
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Read the precomputed prediction of one fight.
+
+        Args:
+            weight_class (str): Weight class of both fighters.
+            fighter_a (int): ID of the first fighter.
+            fighter_b (int): ID of the second fighter.
+
+        Returns:
+            Dict[str, Any]: Both IDs, each fighter's win probability and the model version.
+        """
+        index, matrix, metadata = self._get(weight_class)
+        probability = float(
+            matrix[
+                self._row(index, fighter_a, weight_class),
+                self._row(index, fighter_b, weight_class),
+            ]
+        )
+        return {
+            "fighter_a": fighter_a,
+            "fighter_b": fighter_b,
+            "fighter_a_win_probability": probability,
+            "fighter_b_win_probability": 1.0 - probability,
+            "model_version": metadata["model_version"],
+        }
+
+    def get_row(
+        self, weight_class: str, fighter_id: int
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Read a fighter's win probability against every fighter of the weight class.
+
+        Args:
+            weight_class (str): Weight class of the fighter.
+            fighter_id (int): Fighter ID.
+
+        Returns:
+            Dict[str, Any]: Fighter ID, model version and opponents sorted by
+            the fighter's win probability, highest first.
+        """
+        index, matrix, metadata = self._get(weight_class)
+        row = self._row(index, fighter_id, weight_class)
+        probabilities = np.asarray(matrix[row])
+        order = np.argsort(-probabilities, kind="stable")
+        opponents = np.asarray(metadata["fighter_ids"])
+        return {
+            "fighter_id": fighter_id,
+            "weight_class": weight_class,
+            "model_version": metadata["model_version"],
+            "opponents": [
+                {
+                    "fighter_id": int(opponents[i]),
+                    "win_probability": float(probabilities[i]),
+                }
+                for i in order
+                if i != row
+            ],
+        }
+
+
+matchup_store = MatchupMatrixStore()
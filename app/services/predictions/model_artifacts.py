@@ -0,0 +1,148 @@
+import json
+import os
+import typing
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from app.services.predictions.logistic_model import LogisticModel
+from app.tools.logger import logger
+
+MODEL_DIR = Path(os.getenv("MODEL_DIR", "data/models"))
+
+# Name of the file pointing at the version the API serves.
+CURRENT_FILE = "CURRENT"
+PARAMETERS_FILE = "parameters.npy"
+METADATA_FILE = "metadata.json"
+
+
+def save_model(
+    model: LogisticModel,
+    metadata: typing.Dict[str, typing.Any],
+    directory: Path = MODEL_DIR,
+    activate: bool = True,
+) -> Path:
+    """
+    Write a model as a versioned artifact.
+
+    The parameters are one float64 `.npy` array of shape (3, features) holding
+    the mean, scale and weights, readable with a memory map and without
+    unpickling. Feature names and training details go to a JSON file.
+
+    Args:
+        model (LogisticModel): Model to save; its version names the artifact.
+        metadata (Dict[str, Any]): Training details stored with the model.
+        directory (Path): Root directory of the artifacts.
+        activate (bool): Point CURRENT at the new version.
+
+    Returns:
+        Path: Directory of the artifact.
+    """
+    path = directory / model.version
+    path.mkdir(parents=True, exist_ok=False)
+    np.save(path / PARAMETERS_FILE, np.stack((model.mean, model.scale, model.weights)))
+    (path / METADATA_FILE).write_text(
+        json.dumps(
+            {
+                **metadata,
+                "version": model.version,
+                "feature_names": list(model.feature_names),
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            },
+            indent=2,
+        )
+    )
+    if activate:
+        activate_model(model.version, directory)
+    return path
+
+
+def activate_model(version: str, directory: Path = MODEL_DIR) -> None:
+    """
+    Make a saved version the one served by the API.
+
+    Args:
+        version (str): Artifact version.
+        directory (Path): Root directory of the artifacts.
+
+    Raises:
+        FileNotFoundError: If the version does not exist.
+    """
+    if not (directory / version / PARAMETERS_FILE).exists():
+        raise FileNotFoundError(f"Model artifact not found: {version}")
+    temporary_path = directory / f"{CURRENT_FILE}.tmp"
+    temporary_path.write_text(version)
+    os.replace(temporary_path, directory / CURRENT_FILE)
+
+
+def load_metadata(
+    version: str, directory: Path = MODEL_DIR
+) -> typing.Dict[str, typing.Any]:
+    """
+    Read the training details saved with a model.
+
+    Args:
+        version (str): Artifact version.
+        directory (Path): Root directory of the artifacts.
+
+    Returns:
+        Dict[str, Any]: Metadata written by `save_model`.
+
+    Raises:
+        FileNotFoundError: If the version does not exist.
+    """
+    return json.loads((directory / version / METADATA_FILE).read_text())
+
+
+class ModelArtifactStore:
+    """
+    Loads the active model artifact on demand.
+
+    Parameters are memory-mapped read-only, so every worker serving the same
+    version shares its pages. The loaded model is reused until CURRENT points
+    at another version.
+    """
+
+    def __init__(self, directory: Path = MODEL_DIR) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            directory (Path): Root directory of the artifacts.
+        """
+        self.directory = directory
+        self._model: LogisticModel | None = None
+
+    def load(self) -> LogisticModel | None:
+        """
+        Return the active trained model.
+
+        Returns:
+            LogisticModel | None: The model CURRENT points at, None if there is
+            none or it cannot be read.
+        """
+        try:
+            version = (self.directory / CURRENT_FILE).read_text().strip()
+            if self._model is not None and self._model.version == version:
+                return self._model
+            path = self.directory / version
+            metadata = load_metadata(version, self.directory)
+            parameters = np.load(
+                path / PARAMETERS_FILE, mmap_mode="r", allow_pickle=False
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Model artifact could not be loaded: {e}")
+            return None
+
+        mean, scale, weights = parameters
+        self._model = LogisticModel(
+            metadata["feature_names"], mean, scale, weights, metadata["version"]
+        )
+        logger.info(f"Loaded model artifact {version}")
+        return self._model
+
+
+model_store = ModelArtifactStore()
@@ -0,0 +1,222 @@
+import hashlib
+import typing
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app.db.models import FightsResults
+from app.services.predictions.feature_matrix import FEATURE_COLUMNS, FeatureMatrix
+from app.services.predictions.logistic_fit import (
+    DEFAULT_EPOCHS,
+    DEFAULT_L2,
+    DEFAULT_LEARNING_RATE,
+    DEFAULT_TOLERANCE,
+    fit_logistic,
+    log_loss,
+)
+from app.services.predictions.logistic_model import LogisticModel, fit_standardization
+
+WIN_COLUMNS = ("win_by_ko_tko", "win_by_sub", "win_by_dec")
+LOSS_COLUMNS = ("loss_by_ko_tko", "loss_by_sub", "loss_by_dec")
+
+# Fight results are the training labels, so they cannot be features, and
+# neither can the derived stats computed from the win/loss record.
+LABEL_DERIVED_FEATURES = ("win_percentage", "finish_rate")
+TRAINING_FEATURES = tuple(
+    name
+    for name in FEATURE_COLUMNS
+    if name not in FightsResults.__table__.columns
+    and name not in LABEL_DERIVED_FEATURES
+)
+
+DEFAULT_VALIDATION_FRACTION = 0.2
+
+
+class TrainingSet(typing.NamedTuple):
+    """Fighters with at least one decided fight."""
+
+    features: np.ndarray
+    wins: np.ndarray
+    fights: np.ndarray
+
+
+def training_set(
+    matrix: FeatureMatrix, feature_names: typing.Sequence[str] = TRAINING_FEATURES
+) -> TrainingSet:
+    """
+    Extract the features and win/loss counts of every fighter with a record.
+
+    Args:
+        matrix (FeatureMatrix): Fighter features, including the fight results.
+        feature_names (Sequence[str]): Columns used as features.
+
+    Returns:
+        TrainingSet: Raw features (NaN for missing), wins and decided fights per fighter.
+    """
+    rows = matrix.active_rows()
+    index = {name: i for i, name in enumerate(matrix.columns)}
+    results = np.nan_to_num(matrix.values[rows])
+    wins = results[:, [index[name] for name in WIN_COLUMNS]].sum(axis=1)
+    losses = results[:, [index[name] for name in LOSS_COLUMNS]].sum(axis=1)
+    fights = wins + losses
+    decided = rows[fights > 0]
+    return TrainingSet(
+        matrix.values[np.ix_(decided, [index[name] for name in feature_names])],
+        wins[fights > 0],
+        fights[fights > 0],
+    )
+
+
+def trained_model(
+    feature_names: typing.Sequence[str],
+    mean: np.ndarray,
+    scale: np.ndarray,
+    weights: np.ndarray,
+) -> LogisticModel:
+    """
+    Wrap fitted parameters in a model named after the time and parameters.
+
+    Args:
+        feature_names (Sequence[str]): Features the weights apply to.
+        mean (np.ndarray): Per-feature mean.
+        scale (np.ndarray): Per-feature standard deviation.
+        weights (np.ndarray): Per-feature weights.
+
+    Returns:
+        LogisticModel: Model with a `logistic-<timestamp>-<digest>` version.
+    """
+    digest = hashlib.sha1(np.concatenate((mean, scale, weights)).tobytes())
+    return LogisticModel(
+        feature_names,
+        mean,
+        scale,
+        weights,
+        f"logistic-{datetime.now(timezone.utc):%Y%m%d%H%M%S}-{digest.hexdigest()[:8]}",
+    )
+
+
+def split_fighters(
+    count: int, validation_fraction: float, seed: int
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Split training set rows at random into training and validation rows.
+
+    Args:
+        count (int): Number of rows.
+        validation_fraction (float): Share of rows held out.
+        seed (int): Seed of the split.
+
+    Returns:
+        tuple: (training rows, validation rows)
+    """
+    order = np.random.default_rng(seed).permutation(count)
+    validation_size = int(count * validation_fraction)
+    return order[validation_size:], order[:validation_size]
+
+
+def _metrics(
+    features: np.ndarray,
+    wins: np.ndarray,
+    fights: np.ndarray,
+    weights: np.ndarray,
+    bias: float,
+) -> typing.Dict[str, typing.Any]:
+    """
+    Evaluate a fitted model against the constant win-rate baseline.
+
+    Args:
+        features (np.ndarray): Standardized features, shape (n, features).
+        wins (np.ndarray): Wins per fighter.
+        fights (np.ndarray): Decided fights per fighter.
+        weights (np.ndarray): Feature weights.
+        bias (float): Intercept.
+
+    Returns:
+        Dict[str, Any]: Fighter and fight counts, log loss and baseline log loss.
+    """
+    if not len(wins):
+        return {"fighters": 0}
+    win_rate = np.clip(wins.sum() / fights.sum(), 1e-6, 1 - 1e-6)
+    return {
+        "fighters": int(len(wins)),
+        "fights": int(fights.sum()),
+        "log_loss": log_loss(features, wins, fights, weights, bias),
+        "baseline_log_loss": log_loss(
+            features,
+            wins,
+            fights,
+            np.zeros_like(weights),
+            np.log(win_rate / (1 - win_rate)),
+        ),
+    }
+
+
+def train_model(
+    matrix: FeatureMatrix,
+    epochs: int = DEFAULT_EPOCHS,
+    learning_rate: float = DEFAULT_LEARNING_RATE,
+    l2: float = DEFAULT_L2,
+    validation_fraction: float = DEFAULT_VALIDATION_FRACTION,
+    seed: int = 0,
+) -> typing.Tuple[LogisticModel, typing.Dict[str, typing.Any]]:
+    """
+    Train a fight outcome model on every fighter's record.
+
+    Fighters are split at random into training and validation sets; the
+    standardization is computed on the training set only.
+
+    Args:
+        matrix (FeatureMatrix): Fighter features, including the fight results.
+        epochs (int): Maximum number of gradient steps.
+        learning_rate (float): Step size.
+        l2 (float): L2 penalty on the weights.
+        validation_fraction (float): Share of fighters held out.
+        seed (int): Seed of the train/validation split.
+
+    Returns:
+        tuple: (trained model, metadata with the hyperparameters and metrics)
+
+    Raises:
+        ValueError: If no fighter has a decided fight.
+    """
+    data = training_set(matrix)
+    if not len(data.wins):
+        raise ValueError("No fighter has a decided fight to train on")
+
+    train, validation = split_fighters(len(data.wins), validation_fraction, seed)
+
+    mean, scale = fit_standardization(data.features[train])
+    features = LogisticModel(
+        TRAINING_FEATURES, mean, scale, np.zeros(len(mean)), ""
+    ).standardize(data.features)
+    weights, bias, steps = fit_logistic(
+        features[train],
+        data.wins[train],
+        data.fights[train],
+        epochs,
+        learning_rate,
+        l2,
+    )
+    model = trained_model(TRAINING_FEATURES, mean, scale, weights)
+
+    return model, {
+        "hyperparameters": {
+            "epochs": epochs,
+            "learning_rate": learning_rate,
+            "l2": l2,
+            "validation_fraction": validation_fraction,
+            "seed": seed,
+        },
+        "steps": steps,
+        "intercept": bias,
+        "train": _metrics(
+            features[train], data.wins[train], data.fights[train], weights, bias
+        ),
+        "validation": _metrics(
+            features[validation],
+            data.wins[validation],
+            data.fights[validation],
+            weights,
+            bias,
+        ),
+    }
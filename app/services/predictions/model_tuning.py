@@ -0,0 +1,448 @@
+import math
+import multiprocessing
+import os
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from app.db.models import BaseStats, DerivedStats, ExtendedStats
+from app.services.predictions.feature_matrix import DAYS_SINCE_LAST_FIGHT
+from app.services.predictions.logistic_fit import DEFAULT_EPOCHS, log_loss
+from app.services.predictions.logistic_model import LogisticModel, fit_standardization
+from app.services.predictions.model_training import (
+    DEFAULT_VALIDATION_FRACTION,
+    TRAINING_FEATURES,
+    TrainingSet,
+    trained_model,
+)
+from app.services.predictions.shared_arrays import SharedArrays
+from app.services.predictions.tuning_trials import (
+    EVALUATION_INTERVAL,
+    CandidateState,
+    serving_microseconds,
+    train_candidate,
+)
+from app.tools.logger import logger
+
+TUNING_WORKERS: int = int(os.getenv("TUNING_WORKERS", str(os.cpu_count() or 1)))
+
+STRATEGIES = ("grid", "random", "halving")
+# Candidates drawn by the random and successive halving strategies.
+DEFAULT_TUNING_CANDIDATES = 27
+# Successive halving keeps the best 1/HALVING_RATE candidates at each rung and
+# multiplies their epoch budget by HALVING_RATE.
+HALVING_RATE = 3
+# Share of fighters kept out of the search; the leaderboard reports the test
+# loss on them, as the validation loss picks the candidates and stops them.
+DEFAULT_TEST_FRACTION = 0.1
+
+GRID_LEARNING_RATES = (0.05, 0.2, 0.5, 1.0)
+GRID_L2_PENALTIES = (0.0, 1e-4, 1e-3, 1e-2)
+# Log-uniform ranges of the random strategies.
+LEARNING_RATE_RANGE = (0.01, 2.0)
+L2_PENALTY_RANGE = (1e-6, 1e-1)
+
+# Feature subsets tried by every strategy; smaller sets are cheaper to serve.
+FEATURE_SETS = {
+    "all": TRAINING_FEATURES,
+    "physical": tuple(
+        name
+        for name in TRAINING_FEATURES
+        if name in BaseStats.__table__.columns or name == DAYS_SINCE_LAST_FIGHT
+    ),
+    "performance": tuple(
+        name
+        for name in TRAINING_FEATURES
+        if name in ExtendedStats.__table__.columns
+        or name in DerivedStats.__table__.columns
+    ),
+}
+
+
+class Candidate(typing.NamedTuple):
+    """One hyperparameter configuration."""
+
+    learning_rate: float
+    l2: float
+    feature_set: str
+
+
+class CandidateResult(typing.NamedTuple):
+    """Final progress of a candidate and why it stopped."""
+
+    candidate: Candidate
+    state: CandidateState
+    status: str
+
+
+def grid_candidates() -> typing.List[Candidate]:
+    """Return every combination of the grid values and feature sets."""
+    return [
+        Candidate(learning_rate, l2, feature_set)
+        for feature_set in FEATURE_SETS
+        for learning_rate in GRID_LEARNING_RATES
+        for l2 in GRID_L2_PENALTIES
+    ]
+
+
+def random_candidates(count: int, rng: np.random.Generator) -> typing.List[Candidate]:
+    """
+    Draw candidates with log-uniform learning rates and L2 penalties.
+
+    Args:
+        count (int): Number of candidates.
+        rng (np.random.Generator): Random generator.
+
+    Returns:
+        list[Candidate]: Drawn candidates.
+    """
+    learning_rates = np.exp(rng.uniform(*np.log(LEARNING_RATE_RANGE), count))
+    penalties = np.exp(rng.uniform(*np.log(L2_PENALTY_RANGE), count))
+    feature_sets = rng.choice(list(FEATURE_SETS), count)
+    return [
+        Candidate(float(learning_rate), float(l2), str(feature_set))
+        for learning_rate, l2, feature_set in zip(
+            learning_rates, penalties, feature_sets
+        )
+    ]
+
+
+class ModelTuner:
+    """
+    Hyperparameter search for the fight outcome model.
+
+    The training matrix is standardized once (on the training fighters, as
+    `train_model` does) and placed in shared memory; worker processes attach
+    to it and only receive the feature columns and hyperparameters of each
+    candidate. Candidates stop early once their validation loss stalls, and
+    the successive halving strategy also drops the worst candidates at each
+    epoch budget. The validation loss is therefore a selection score; test
+    fighters are never seen by the search and give the reported loss. Use as
+    a context manager so the workers and shared memory are released.
+    """
+
+    def __init__(
+        self,
+        data: TrainingSet,
+        validation_fraction: float = DEFAULT_VALIDATION_FRACTION,
+        seed: int = 0,
+        workers: int = TUNING_WORKERS,
+        test_fraction: float = DEFAULT_TEST_FRACTION,
+    ) -> None:
+        """
+        Standardize the training set; shared memory and workers start on entry.
+
+        Args:
+            data (TrainingSet): Features and records of every fighter with a decided fight.
+            validation_fraction (float): Share of fighters used to select candidates.
+            seed (int): Seed of the train/validation/test split and random candidates.
+            workers (int): Number of worker processes.
+            test_fraction (float): Share of fighters held out of the search.
+
+        Raises:
+            ValueError: If the split leaves no training, validation or test fighter.
+        """
+        order = np.random.default_rng(seed).permutation(len(data.wins))
+        test_size = int(len(order) * test_fraction)
+        validation_size = int(len(order) * validation_fraction)
+        self.test = order[:test_size]
+        self.validation = order[test_size : test_size + validation_size]
+        self.train = order[test_size + validation_size :]
+        if not len(self.train) or not len(self.validation) or not len(self.test):
+            raise ValueError("Tuning needs training, validation and test fighters")
+        self.data = data
+        self.validation_fraction = validation_fraction
+        self.test_fraction = test_fraction
+        self.seed = seed
+        self.workers = max(1, workers)
+        self.mean, self.scale = fit_standardization(data.features[self.train])
+        self.features = LogisticModel(
+            TRAINING_FEATURES, self.mean, self.scale, np.zeros(len(self.mean)), ""
+        ).standardize(data.features)
+        self._shared = SharedArrays()
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "ModelTuner":
+        """Copy the training matrix into shared memory and start the workers."""
+        self._shared.add("features", self.features)
+        self._shared.add("wins", self.data.wins)
+        self._shared.add("fights", self.data.fights)
+        self._shared.add("train", self.train)
+        self._shared.add("validation", self.validation)
+        # spawned rather than forked, as for the event simulator
+        self._pool = ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        """Stop the workers and free the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        self._shared.close()
+
+    @staticmethod
+    def _columns(feature_set: str) -> typing.List[int]:
+        """Return the training matrix columns of a feature set."""
+        return [TRAINING_FEATURES.index(name) for name in FEATURE_SETS[feature_set]]
+
+    def _train(
+        self,
+        candidates: typing.Sequence[Candidate],
+        states: typing.Sequence[CandidateState | None],
+        epochs: int,
+    ) -> typing.List[CandidateState]:
+        """
+        Train candidates in parallel up to an epoch budget.
+
+        Raises:
+            RuntimeError: If used outside of a `with` block.
+        """
+        if self._pool is None:
+            raise RuntimeError("ModelTuner must be used as a context manager")
+        futures = [
+            self._pool.submit(
+                train_candidate,
+                self._shared.specs,
+                self._columns(candidate.feature_set),
+                candidate.learning_rate,
+                candidate.l2,
+                epochs,
+                state,
+            )
+            for candidate, state in zip(candidates, states)
+        ]
+        return [future.result() for future in futures]
+
+    def search(
+        self,
+        strategy: str,
+        candidates: int = DEFAULT_TUNING_CANDIDATES,
+        epochs: int = DEFAULT_EPOCHS,
+    ) -> typing.List[CandidateResult]:
+        """
+        Evaluate hyperparameter candidates.
+
+        Args:
+            strategy (str): "grid" (every grid combination), "random"
+                (`candidates` random draws trained to `epochs`) or "halving"
+                (`candidates` random draws, successive halving up to `epochs`).
+            candidates (int): Number of random candidates.
+            epochs (int): Maximum number of gradient steps per candidate.
+
+        Returns:
+            list[CandidateResult]: One result per candidate, in drawing order.
+
+        Raises:
+            ValueError: If the strategy is unknown.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown tuning strategy: {strategy}")
+        drawn = (
+            grid_candidates()
+            if strategy == "grid"
+            else random_candidates(candidates, np.random.default_rng(self.seed))
+        )
+        if strategy != "halving":
+            states = self._train(drawn, [None] * len(drawn), epochs)
+            return [
+                CandidateResult(candidate, state, state.status or "max_epochs")
+                for candidate, state in zip(drawn, states)
+            ]
+
+        # number of pruning rounds: 27 candidates are cut to 9, then 3
+        rungs = 0
+        while HALVING_RATE ** (rungs + 1) < len(drawn):
+            rungs += 1
+        states: typing.List[CandidateState | None] = [None] * len(drawn)
+        statuses: typing.Dict[int, str] = {}
+        active = list(range(len(drawn)))
+        for rung in range(rungs + 1):
+            budget = max(EVALUATION_INTERVAL, epochs // HALVING_RATE ** (rungs - rung))
+            trainable = [
+                index
+                for index in active
+                if states[index] is None or states[index].status is None
+            ]
+            trained = self._train(
+                [drawn[index] for index in trainable],
+                [states[index] for index in trainable],
+                budget,
+            )
+            for index, state in zip(trainable, trained):
+                states[index] = state
+            logger.info(
+                f"Rung {rung + 1}/{rungs + 1}: trained {len(trainable)} candidates "
+                f"to {budget} epochs"
+            )
+            if rung == rungs:
+                break
+            ranked = sorted(active, key=lambda index: states[index].best_loss)
+            keep = math.ceil(len(active) / HALVING_RATE)
+            for index in ranked[keep:]:
+                statuses[index] = f"pruned_at_rung_{rung + 1}"
+            active = ranked[:keep]
+
+        return [
+            CandidateResult(
+                candidate,
+                state,
+                statuses.get(index) or state.status or "max_epochs",
+            )
+            for index, (candidate, state) in enumerate(zip(drawn, states))
+        ]
+
+    def baseline_log_loss(self) -> float:
+        """Test log loss of predicting the training win rate for everyone."""
+        wins, fights = self.data.wins, self.data.fights
+        win_rate = np.clip(
+            wins[self.train].sum() / fights[self.train].sum(), 1e-6, 1 - 1e-6
+        )
+        return log_loss(
+            self.features[self.test],
+            wins[self.test],
+            fights[self.test],
+            np.zeros(self.features.shape[1]),
+            float(np.log(win_rate / (1 - win_rate))),
+        )
+
+    def test_log_loss(self, result: CandidateResult) -> float | None:
+        """
+        Log loss of a candidate's best parameters on the held-out test fighters.
+
+        Args:
+            result (CandidateResult): A candidate returned by `search`.
+
+        Returns:
+            float | None: Test log loss, None if the candidate diverged at once.
+        """
+        state = result.state
+        if not np.isfinite(state.best_loss):
+            return None
+        columns = self._columns(result.candidate.feature_set)
+        return log_loss(
+            self.features[np.ix_(self.test, columns)],
+            self.data.wins[self.test],
+            self.data.fights[self.test],
+            state.best_weights,
+            state.best_bias,
+        )
+
+    def leaderboard(
+        self, results: typing.Sequence[CandidateResult]
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Rank candidates by validation loss, with their test loss and time costs.
+
+        The validation loss chose the candidates and their stopping epoch, so
+        it is reported as `selection_log_loss`; `test_log_loss` is the unbiased
+        estimate. Serving time is measured here, one candidate at a time, so it
+        is not skewed by the parallel training.
+
+        Args:
+            results (Sequence[CandidateResult]): Output of `search`.
+
+        Returns:
+            list[dict]: One entry per candidate, best first; `candidate_index`
+            is the candidate's position in `results`.
+        """
+        validation_features = self.features[self.validation]
+        entries = []
+        for index, result in enumerate(results):
+            candidate, state = result.candidate, result.state
+            columns = self._columns(candidate.feature_set)
+            entries.append(
+                {
+                    "candidate_index": index,
+                    "learning_rate": candidate.learning_rate,
+                    "l2": candidate.l2,
+                    "feature_set": candidate.feature_set,
+                    "features": len(columns),
+                    "status": result.status,
+                    "epochs": state.epochs,
+                    "best_epochs": state.best_epochs,
+                    "selection_log_loss": (
+                        state.best_loss if np.isfinite(state.best_loss) else None
+                    ),
+                    "test_log_loss": self.test_log_loss(result),
+                    "train_seconds": round(state.seconds, 4),
+                    "serving_microseconds_per_1000": round(
+                        serving_microseconds(
+                            validation_features[:, columns], state.best_weights
+                        ),
+                        2,
+                    ),
+                }
+            )
+        entries.sort(
+            key=lambda entry: (
+                entry["selection_log_loss"] is None,
+                entry["selection_log_loss"],
+                entry["serving_microseconds_per_1000"],
+            )
+        )
+        for rank, entry in enumerate(entries, start=1):
+            entry["rank"] = rank
+        return entries
+
+    def model(self, result: CandidateResult) -> LogisticModel:
+        """
+        Build the servable model of a candidate from its best parameters.
+
+        Args:
+            result (CandidateResult): A candidate returned by `search`.
+
+        Returns:
+            LogisticModel: Model over the candidate's feature set.
+        """
+        columns = self._columns(result.candidate.feature_set)
+        return trained_model(
+            FEATURE_SETS[result.candidate.feature_set],
+            self.mean[columns],
+            self.scale[columns],
+            result.state.best_weights,
+        )
+
+    def run(
+        self,
+        strategy: str,
+        candidates: int = DEFAULT_TUNING_CANDIDATES,
+        epochs: int = DEFAULT_EPOCHS,
+    ) -> typing.Tuple[typing.Dict[str, typing.Any], CandidateResult]:
+        """
+        Search and report, as the tuning command does.
+
+        Args:
+            strategy (str): Search strategy, see `search`.
+            candidates (int): Number of random candidates.
+            epochs (int): Maximum number of gradient steps per candidate.
+
+        Returns:
+            tuple: (report with the settings and the leaderboard, best candidate,
+            the one ranked first on the leaderboard)
+        """
+        start = time.perf_counter()
+        results = self.search(strategy, candidates, epochs)
+        elapsed = time.perf_counter() - start
+        report = {
+            "strategy": strategy,
+            "candidates": len(results),
+            "max_epochs": epochs,
+            "validation_fraction": self.validation_fraction,
+            "test_fraction": self.test_fraction,
+            "seed": self.seed,
+            "workers": self.workers,
+            "seconds": round(elapsed, 3),
+            "total_epochs": sum(result.state.epochs for result in results),
+            "baseline_log_loss": self.baseline_log_loss(),
+            "leaderboard": self.leaderboard(results),
+        }
+        best = results[report["leaderboard"][0]["candidate_index"]]
+        logger.info(
+            f"Evaluated {len(results)} candidates ({report['total_epochs']} epochs) "
+            f"in {elapsed:.1f}s"
+        )
+        return report, best
@@ -0,0 +1,214 @@
+import asyncio
+import bisect
+import os
+import time
+import typing
+
+from app.services.predictions.fight_predictor import FightPredictor, fight_predictor
+from app.tools.exceptions.custom_api_exceptions import (
+    BadRequestException,
+    NotFoundException,
+)
+
+# Longest a prediction waits for other requests to share its batch.
+PREDICTION_BATCH_MAX_LATENCY_MS: float = float(
+    os.getenv("PREDICTION_BATCH_MAX_LATENCY_MS", "2")
+)
+# A batch is scored as soon as it holds this many predictions.
+PREDICTION_BATCH_MAX_SIZE: int = int(os.getenv("PREDICTION_BATCH_MAX_SIZE", "256"))
+
+# Upper bounds of the queueing delay histogram buckets, in milliseconds.
+DELAY_BUCKETS_MS = (0.5, 1.0, 2.0, 5.0, 10.0, 25.0, 50.0)
+
+
+class BatcherStats:
+    """
+    Counters describing micro-batching.
+
+    Attributes:
+        requests (int): Predictions scored through the batcher.
+        batches (int): Batches scored.
+        max_batch_size (int): Largest batch scored.
+        batch_sizes (dict[int, int]): Number of batches per power-of-two size bucket.
+        delay_total_ms (float): Sum of the queueing delays.
+        max_delay_ms (float): Longest queueing delay.
+        delays (list[int]): Number of requests per DELAY_BUCKETS_MS bucket, plus one
+            for longer delays.
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.requests = 0
+        self.batches = 0
+        self.max_batch_size = 0
+        self.batch_sizes: typing.Dict[int, int] = {}
+        self.delay_total_ms = 0.0
+        self.max_delay_ms = 0.0
+        self.delays = [0] * (len(DELAY_BUCKETS_MS) + 1)
+
+    def record(self, batch_size: int, delays_ms: typing.Iterable[float]) -> None:
+        """
+        Record one scored batch.
+
+        Args:
+            batch_size (int): Number of predictions in the batch.
+            delays_ms (Iterable[float]): Queueing delay of each prediction.
+        """
+        self.batches += 1
+        self.requests += batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        bucket = 1 << (batch_size - 1).bit_length()
+        self.batch_sizes[bucket] = self.batch_sizes.get(bucket, 0) + 1
+        for delay in delays_ms:
+            self.delay_total_ms += delay
+            self.max_delay_ms = max(self.max_delay_ms, delay)
+            self.delays[bisect.bisect_left(DELAY_BUCKETS_MS, delay)] += 1
+
+
+class PredictionBatcher:
+    """
+    Groups concurrent single-fight predictions into vectorized batches.
+
+    The first prediction of a batch starts a timer of `max_latency_ms`; the
+    predictions arriving meanwhile join it, and the batch is scored with one
+    `FightPredictor.predict_pairs` call when the timer fires or `max_batch_size`
+    predictions are waiting. Everything runs on the event loop, so no locking
+    is needed.
+    """
+
+    def __init__(
+        self,
+        predictor: FightPredictor = fight_predictor,
+        max_latency_ms: float = PREDICTION_BATCH_MAX_LATENCY_MS,
+        max_batch_size: int = PREDICTION_BATCH_MAX_SIZE,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            predictor (FightPredictor): Predictor scoring the batches.
+            max_latency_ms (float): Longest wait for a batch to fill; 0 disables batching.
+            max_batch_size (int): Batch size that triggers scoring immediately.
+        """
+        self.predictor = predictor
+        self.max_latency = max_latency_ms / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self.stats = BatcherStats()
+        self._pending: typing.List[
+            typing.Tuple[typing.Tuple[int, int], asyncio.Future, float]
+        ] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def predict(
+        self, fighter_a: int, fighter_b: int
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Predict one fight as part of the next batch.
+
+        Args:
+            fighter_a (int): ID of the first fighter.
+            fighter_b (int): ID of the second fighter.
+
+        Returns:
+            Dict[str, Any]: Both IDs, each fighter's win probability and the model version.
+
+        Raises:
+            BadRequestException: If both IDs are the same fighter.
+            NotFoundException: If either fighter does not exist.
+        """
+        if self.max_latency <= 0 or self.max_batch_size == 1:
+            return self.predictor.predict(fighter_a, fighter_b)
+
+        # rejected before queueing so batches only hold valid pairs
+        if fighter_a == fighter_b:
+            raise BadRequestException("A fighter cannot be matched against themselves")
+        missing = [
+            fighter_id
+            for fighter_id, row in zip(
+                (fighter_a, fighter_b),
+                self.predictor.matrix.rows((fighter_a, fighter_b)),
+            )
+            if row < 0
+        ]
+        if missing:
+            raise NotFoundException(f"Fighters not found: {missing}")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((fighter_a, fighter_b), future, time.perf_counter()))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Score every waiting prediction and resolve their futures."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        started = time.perf_counter()
+        try:
+            results = self.predictor.predict_pairs([pair for pair, _, _ in batch])
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future, _), result in zip(batch, results):
+            if future.done():
+                # the caller went away, e.g. the client disconnected
+                continue
+            result.pop("index")
+            if "error" in result:
+                # a fighter was removed after its prediction was queued
+                future.set_exception(NotFoundException(result["error"]))
+            else:
+                future.set_result(result)
+        self.stats.record(
+            len(batch),
+            ((started - enqueued) * 1000 for _, _, enqueued in batch),
+        )
+
+    def get_stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return the batching settings and counters.
+
+        Returns:
+            Dict[str, Any]: Batch size and queueing delay statistics.
+        """
+        stats = self.stats
+        return {
+            "max_latency_ms": self.max_latency * 1000,
+            "max_batch_size": self.max_batch_size,
+            "requests": stats.requests,
+            "batches": stats.batches,
+            "mean_batch_size": (
+                round(stats.requests / stats.batches, 2) if stats.batches else None
+            ),
+            "max_batch_size_seen": stats.max_batch_size,
+            "batch_size_buckets": {
+                f"<={bucket}": count
+                for bucket, count in sorted(stats.batch_sizes.items())
+            },
+            "mean_queue_delay_ms": (
+                round(stats.delay_total_ms / stats.requests, 3)
+                if stats.requests
+                else None
+            ),
+            "max_queue_delay_ms": round(stats.max_delay_ms, 3),
+            "queue_delay_buckets_ms": {
+                **{
+                    f"<={bound:g}": count
+                    for bound, count in zip(DELAY_BUCKETS_MS, stats.delays)
+                },
+                f">{DELAY_BUCKETS_MS[-1]:g}": stats.delays[-1],
+            },
+        }
+
+
+prediction_batcher = PredictionBatcher()
@@ -0,0 +1,264 @@
+import os
+import typing
+from collections import OrderedDict
+
+from app.db.redis_client import REDIS_URL, get_redis
+from app.services.predictions.fight_predictor import FightPredictor, fight_predictor
+from app.tools.logger import logger
+
+# Predictions kept in each worker's in-process LRU; 0 disables it.
+PREDICTION_CACHE_SIZE: int = int(os.getenv("PREDICTION_CACHE_SIZE", "10000"))
+# Lifetime of predictions shared between workers through Redis; 0 disables the
+# shared tier. Only used when REDIS_URL is configured.
+PREDICTION_CACHE_TTL_SECONDS: int = int(
+    os.getenv("PREDICTION_CACHE_TTL_SECONDS", "3600")
+)
+PREDICTION_CACHE_PREFIX = "prediction"
+
+# (lower fighter ID, higher fighter ID, model version, fingerprint of each)
+CacheKey = typing.Tuple[int, int, str, str, str]
+
+
+class PredictionCacheStats:
+    """
+    Counters describing prediction cache effectiveness.
+
+    Attributes:
+        hits (int): Predictions answered from the in-process LRU.
+        shared_hits (int): Predictions answered from Redis.
+        misses (int): Predictions that had to be scored.
+        invalidations (int): Entries dropped after a fighter write or model change.
+        evictions (int): Entries dropped to stay within the LRU size.
+        errors (int): Redis failures, each treated as a miss.
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.errors = 0
+
+
+class PredictionCache:
+    """
+    Two-tier cache of single-fight predictions.
+
+    Entries are keyed on the fighter pair, the model version and the
+    `FeatureMatrix` fingerprint of both fighters, so an entry can only be read
+    back while neither fighter's stats nor the model have changed. The pair is
+    stored in ascending ID order and flipped on the way out, so (A, B) and
+    (B, A) share an entry. Writes handled by `FighterUpdater` drop the
+    fighter's entries right away; the shared Redis tier relies on the
+    fingerprints and its TTL instead.
+    """
+
+    def __init__(
+        self,
+        predictor: FightPredictor = fight_predictor,
+        max_size: int = PREDICTION_CACHE_SIZE,
+        ttl: int = PREDICTION_CACHE_TTL_SECONDS if REDIS_URL else 0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            predictor (FightPredictor): Source of fingerprints and model version.
+            max_size (int): Entries kept in the in-process LRU; 0 disables it.
+            ttl (int): Time to live of Redis entries, in seconds; 0 disables Redis.
+        """
+        self.predictor = predictor
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = PredictionCacheStats()
+        self._entries: "OrderedDict[CacheKey, float]" = OrderedDict()
+        self._keys_of: typing.Dict[int, typing.Set[CacheKey]] = {}
+        self._model_version: str | None = None
+
+    def _key(self, fighter_a: int, fighter_b: int) -> CacheKey | None:
+        """
+        Build the cache key of a fight.
+
+        Args:
+            fighter_a (int): ID of the first fighter.
+            fighter_b (int): ID of the second fighter.
+
+        Returns:
+            CacheKey | None: Key in ascending ID order, or None when the fight
+            cannot be predicted (same fighter twice or an unknown fighter).
+        """
+        if fighter_a == fighter_b:
+            return None
+        low, high = sorted((fighter_a, fighter_b))
+        matrix = self.predictor.matrix
+        rows = matrix.rows((low, high))
+        if (rows < 0).any():
+            return None
+        return (
+            low,
+            high,
+            self.predictor.model.version,
+            matrix.fingerprints[rows[0]],
+            matrix.fingerprints[rows[1]],
+        )
+
+    @staticmethod
+    def _redis_key(key: CacheKey) -> str:
+        """Return the Redis key of a cache entry."""
+        return f"{PREDICTION_CACHE_PREFIX}:" + ":".join(map(str, key))
+
+    def _check_model(self) -> None:
+        """Drop every entry once a different model is active."""
+        version = self.predictor.model.version
+        if version != self._model_version:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._keys_of.clear()
+            self._model_version = version
+
+    def _remember(self, key: CacheKey, probability: float) -> None:
+        """Store an entry in the LRU, evicting the least recently used ones."""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = probability
+        self._entries.move_to_end(key)
+        for fighter_id in key[:2]:
+            self._keys_of.setdefault(fighter_id, set()).add(key)
+        while len(self._entries) > self.max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self._forget(evicted)
+            self.stats.evictions += 1
+
+    def _forget(self, key: CacheKey) -> None:
+        """Remove an entry from the per-fighter index."""
+        for fighter_id in key[:2]:
+            keys = self._keys_of.get(fighter_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_of[fighter_id]
+
+    async def _shared_get(self, key: CacheKey) -> float | None:
+        """Look up an entry in Redis, None on a miss or failure."""
+        try:
+            payload = await get_redis().get(self._redis_key(key))
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Prediction cache lookup failed: {e}")
+            return None
+        return None if payload is None else float(payload)
+
+    async def _shared_set(self, key: CacheKey, probability: float) -> None:
+        """Store an entry in Redis."""
+        try:
+            await get_redis().set(self._redis_key(key), repr(probability), ex=self.ttl)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning(f"Prediction cache store failed: {e}")
+
+    async def get_or_predict(
+        self,
+        fighter_a: int,
+        fighter_b: int,
+        predict: typing.Callable[
+            [int, int], typing.Awaitable[typing.Dict[str, typing.Any]]
+        ],
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Return a cached prediction, scoring and storing it on a miss.
+
+        Args:
+            fighter_a (int): ID of the first fighter.
+            fighter_b (int): ID of the second fighter.
+            predict (Callable[[int, int], Awaitable[Dict[str, Any]]]): Scores a
+                fight on a miss, e.g. `PredictionBatcher.predict`.
+
+        Returns:
+            Dict[str, Any]: Both IDs, each fighter's win probability and the model version.
+
+        Raises:
+            BadRequestException: If both IDs are the same fighter.
+            NotFoundException: If either fighter does not exist.
+        """
+        self._check_model()
+        key = self._key(fighter_a, fighter_b)
+        if key is None:
+            # let the predictor raise the appropriate error
+            return await predict(fighter_a, fighter_b)
+
+        probability = self._entries.get(key)
+        if probability is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        elif self.ttl > 0 and (probability := await self._shared_get(key)) is not None:
+            self.stats.shared_hits += 1
+            self._remember(key, probability)
+        else:
+            self.stats.misses += 1
+            result = await predict(key[0], key[1])
+            probability = result["fighter_a_win_probability"]
+            # the model or either fighter may have changed while scoring
+            if result["model_version"] == key[2] and self._key(*key[:2]) == key:
+                self._remember(key, probability)
+                if self.ttl > 0:
+                    await self._shared_set(key, probability)
+
+        if fighter_a != key[0]:
+            probability = 1.0 - probability
+        return {
+            "fighter_a": fighter_a,
+            "fighter_b": fighter_b,
+            "fighter_a_win_probability": probability,
+            "fighter_b_win_probability": 1.0 - probability,
+            "model_version": key[2],
+        }
+
+    def invalidate(self, fighter_ids: typing.Iterable[int]) -> int:
+        """
+        Drop the in-process entries of the given fighters.
+
+        Args:
+            fighter_ids (Iterable[int]): Fighters whose stats changed or who were removed.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        removed = 0
+        for fighter_id in set(fighter_ids):
+            for key in self._keys_of.pop(fighter_id, ()):
+                if self._entries.pop(key, None) is not None:
+                    removed += 1
+                self._forget(key)
+        self.stats.invalidations += removed
+        return removed
+
+    def get_stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return the cache settings and counters.
+
+        Returns:
+            Dict[str, Any]: Size, hit, miss, invalidation, eviction and error counts.
+        """
+        stats = self.stats
+        lookups = stats.hits + stats.shared_hits + stats.misses
+        return {
+            "max_size": self.max_size,
+            "size": len(self._entries),
+            "shared_ttl_seconds": self.ttl,
+            "hits": stats.hits,
+            "shared_hits": stats.shared_hits,
+            "misses": stats.misses,
+            "hit_ratio": (
+                round((stats.hits + stats.shared_hits) / lookups, 4)
+                if lookups
+                else None
+            ),
+            "invalidations": stats.invalidations,
+            "evictions": stats.evictions,
+            "errors": stats.errors,
+        }
+
+
+prediction_cache = PredictionCache()
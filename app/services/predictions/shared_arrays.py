@@ -0,0 +1,89 @@
+import contextlib
+import typing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# NumPy arrays shared with worker processes without copying. Only NumPy is
+# imported here, so spawned workers can attach without loading the web app.
+
+
+class SharedArray(typing.NamedTuple):
+    """Location of a NumPy array in a shared memory block."""
+
+    name: str
+    shape: typing.Tuple[int, ...]
+    dtype: str
+
+
+class SharedArrays:
+    """
+    Owner of a set of arrays copied into shared memory.
+
+    The `specs` are small and picklable, so they are what is sent to the
+    workers, which map the arrays with `attach`. `close` frees the blocks
+    once no worker needs them.
+
+    Attributes:
+        specs (dict[str, SharedArray]): Location of each array by key.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty set."""
+        self.specs: typing.Dict[str, SharedArray] = {}
+        self._blocks: typing.List[shared_memory.SharedMemory] = []
+
+    def add(self, key: str, values: np.ndarray) -> None:
+        """
+        Copy an array into a new shared memory block.
+
+        Args:
+            key (str): Name the workers look the array up by.
+            values (np.ndarray): Array to share.
+        """
+        values = np.ascontiguousarray(values)
+        block = shared_memory.SharedMemory(create=True, size=max(1, values.nbytes))
+        np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+        self._blocks.append(block)
+        self.specs[key] = SharedArray(block.name, values.shape, values.dtype.str)
+
+    def close(self) -> None:
+        """Release and remove every block."""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks, self.specs = [], {}
+
+
+@contextlib.contextmanager
+def attach(
+    specs: typing.Dict[str, SharedArray],
+) -> typing.Iterator[typing.Dict[str, np.ndarray]]:
+    """
+    Map shared arrays as read-only NumPy arrays for the duration of a block.
+
+    The arrays must not be used after the block; copy anything returned.
+
+    Args:
+        specs (Dict[str, SharedArray]): Arrays to map, from `SharedArrays.specs`.
+
+    Yields:
+        Dict[str, np.ndarray]: Array by key.
+    """
+    blocks, views = [], {}
+    try:
+        for key, spec in specs.items():
+            block = shared_memory.SharedMemory(name=spec.name)
+            blocks.append(block)
+            view = np.ndarray(spec.shape, dtype=spec.dtype, buffer=block.buf)
+            view.flags.writeable = False
+            views[key] = view
+        yield views
+    finally:
+        # the views must be gone before their blocks can be closed
+        views.clear()
+        for block in blocks:
+            # still mapped if an exception traceback holds a view; the block
+            # is then released with the traceback
+            with contextlib.suppress(BufferError):
+                block.close()
@@ -0,0 +1,338 @@
+import os
+import typing
+
+import numpy as np
+
+from app.db.models import BaseStats, ExtendedStats
+from app.services.predictions.feature_matrix import FEATURE_COLUMNS, FeatureMatrix
+from app.services.predictions.logistic_model import fit_standardization
+from app.tools.exceptions.custom_api_exceptions import NotFoundException
+from app.tools.logger import logger
+
+SIMILARITY_MODELS = (BaseStats, ExtendedStats)
+
+# Style features: base and extended stats, not fight results.
+SIMILARITY_COLUMNS = tuple(
+    name
+    for name in FEATURE_COLUMNS
+    if any(name in model.__table__.columns for model in SIMILARITY_MODELS)
+)
+
+# Rosters up to this size are searched exhaustively; larger ones through an
+# inverted-file index of k-means clusters.
+SIMILARITY_BRUTE_FORCE_MAX: int = int(os.getenv("SIMILARITY_BRUTE_FORCE_MAX", "20000"))
+# Nearest clusters searched per query in the inverted-file index.
+SIMILARITY_PROBES: int = int(os.getenv("SIMILARITY_PROBES", "8"))
+
+KMEANS_ITERATIONS = 10
+# Rows compared with the centroids per step while clustering.
+KMEANS_CHUNK = 8192
+
+
+def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """
+    Assign vectors to their nearest centroid.
+
+    Args:
+        vectors (np.ndarray): float32 vectors, shape (n, d).
+        centroids (np.ndarray): float32 centroids, shape (clusters, d).
+
+    Returns:
+        np.ndarray: int64 centroid index per vector.
+    """
+    centroid_norms = np.einsum("ij,ij->i", centroids, centroids)
+    assignment = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), KMEANS_CHUNK):
+        chunk = vectors[start : start + KMEANS_CHUNK]
+        # |v - c|^2 without the |v|^2 term, which is the same for every centroid
+        distances = centroid_norms - 2.0 * (chunk @ centroids.T)
+        assignment[start : start + KMEANS_CHUNK] = distances.argmin(axis=1)
+    return assignment
+
+
+def kmeans(
+    vectors: np.ndarray, clusters: int, iterations: int = KMEANS_ITERATIONS
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Cluster vectors with Lloyd's algorithm from random initial centroids.
+
+    Args:
+        vectors (np.ndarray): float32 vectors, shape (n, d).
+        clusters (int): Number of clusters, at most n.
+        iterations (int): Number of assignment/update rounds.
+
+    Returns:
+        tuple: (centroids, assignment per vector)
+    """
+    rng = np.random.default_rng(0)
+    centroids = vectors[rng.choice(len(vectors), clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _nearest_centroids(vectors, centroids)
+        counts = np.bincount(assignment, minlength=clusters)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, vectors)
+        # empty clusters keep their previous centroid
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, None]
+    return centroids, _nearest_centroids(vectors, centroids)
+
+
+class SimilarityIndex:
+    """
+    In-memory nearest-neighbour index of fighters' standardized style stats.
+
+    Vectors are the SIMILARITY_COLUMNS of the prediction `FeatureMatrix`,
+    standardized with the roster's mean and deviation, with missing values at
+    the mean. Rows are aligned with the matrix rows. Up to
+    SIMILARITY_BRUTE_FORCE_MAX fighters a query is one matrix-vector product
+    over every candidate; above it, fighters are grouped into k-means clusters
+    and a query only scans the clusters nearest to it (see `_candidates`).
+
+    The index is rebuilt whenever the predictor loads a new matrix and kept
+    current between reloads by `FighterUpdater`.
+    """
+
+    def __init__(self, columns: typing.Sequence[str] = SIMILARITY_COLUMNS) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            columns (Sequence[str]): Feature names compared.
+        """
+        self.columns = tuple(columns)
+        self._source: FeatureMatrix | None = None
+        self._column_indexes = np.empty(0, dtype=np.int64)
+        self._mean = np.zeros(len(self.columns))
+        self._scale = np.ones(len(self.columns))
+        self.vectors = np.zeros((0, len(self.columns)), dtype=np.float32)
+        self._sq_norms = np.zeros(0, dtype=np.float32)
+        self._indexed = np.zeros(0, dtype=bool)
+        self._row_of: typing.Dict[int, int] = {}
+        self._weight_class_of: typing.Dict[int, str | None] = {}
+        self._weight_class_rows: typing.Dict[str | None, typing.Set[int]] = {}
+        self.centroids: np.ndarray | None = None
+        self._cluster_of = np.zeros(0, dtype=np.int64)
+        self._cluster_rows: typing.List[typing.Set[int]] = []
+
+    def __len__(self) -> int:
+        """Return the number of indexed fighters."""
+        return len(self._row_of)
+
+    def _standardize(self, values: np.ndarray) -> np.ndarray:
+        """Standardize raw features, with missing values at the mean (0)."""
+        return np.nan_to_num((values - self._mean) / self._scale, nan=0.0).astype(
+            np.float32
+        )
+
+    def _ensure_capacity(self) -> None:
+        """Grow the row arrays to the capacity of the source matrix."""
+        capacity = len(self._source.fighter_ids)
+        extra = capacity - len(self.vectors)
+        if extra <= 0:
+            return
+        self.vectors = np.vstack(
+            (self.vectors, np.zeros((extra, len(self.columns)), dtype=np.float32))
+        )
+        self._sq_norms = np.concatenate(
+            (self._sq_norms, np.zeros(extra, dtype=np.float32))
+        )
+        self._indexed = np.concatenate((self._indexed, np.zeros(extra, dtype=bool)))
+        self._cluster_of = np.concatenate(
+            (self._cluster_of, np.full(extra, -1, dtype=np.int64))
+        )
+
+    def build(self, matrix: FeatureMatrix) -> None:
+        """
+        Index every fighter of a feature matrix.
+
+        Args:
+            matrix (FeatureMatrix): Prediction features of the roster.
+        """
+        self._source = matrix
+        self._column_indexes = np.array(
+            [matrix.columns.index(name) for name in self.columns], dtype=np.int64
+        )
+        rows = matrix.active_rows()
+        values = matrix.values[np.ix_(rows, self._column_indexes)]
+        self._mean, self._scale = fit_standardization(values)
+
+        self.vectors = np.zeros((0, len(self.columns)), dtype=np.float32)
+        self._sq_norms = np.zeros(0, dtype=np.float32)
+        self._indexed = np.zeros(0, dtype=bool)
+        self._cluster_of = np.zeros(0, dtype=np.int64)
+        self._ensure_capacity()
+        vectors = self._standardize(values)
+        self.vectors[rows] = vectors
+        self._sq_norms[rows] = np.einsum("ij,ij->i", vectors, vectors)
+        self._indexed[rows] = True
+        self._row_of = {int(matrix.fighter_ids[row]): int(row) for row in rows}
+        self._weight_class_of = {}
+        self._weight_class_rows = {}
+        for row in rows.tolist():
+            self._add_to_weight_class(row, matrix.weight_classes[row])
+
+        self.centroids = None
+        self._cluster_rows = []
+        if len(rows) > SIMILARITY_BRUTE_FORCE_MAX:
+            clusters = int(np.sqrt(len(rows)))
+            self.centroids, assignment = kmeans(vectors, clusters)
+            self._cluster_of[rows] = assignment
+            self._cluster_rows = [set() for _ in range(clusters)]
+            for row, cluster in zip(rows.tolist(), assignment.tolist()):
+                self._cluster_rows[cluster].add(row)
+        search = "exhaustive" if self.centroids is None else f"{clusters} clusters"
+        logger.info(f"Indexed {len(rows)} fighters for similarity search ({search})")
+
+    def sync(self, matrix: FeatureMatrix) -> None:
+        """
+        Rebuild the index if the predictor has loaded a different matrix.
+
+        Args:
+            matrix (FeatureMatrix): Current prediction features.
+        """
+        if matrix is not self._source:
+            self.build(matrix)
+
+    def _add_to_weight_class(self, row: int, weight_class: str | None) -> None:
+        """Record the weight class of an indexed row."""
+        self._weight_class_of[row] = weight_class
+        self._weight_class_rows.setdefault(weight_class, set()).add(row)
+
+    def _drop(self, fighter_id: int) -> None:
+        """Remove a fighter from the index, if present."""
+        row = self._row_of.pop(fighter_id, None)
+        if row is None:
+            return
+        self._indexed[row] = False
+        self._weight_class_rows[self._weight_class_of.pop(row)].discard(row)
+        if self.centroids is not None:
+            self._cluster_rows[self._cluster_of[row]].discard(row)
+            self._cluster_of[row] = -1
+
+    def _insert(self, fighter_id: int, row: int) -> None:
+        """Index the current matrix row of a fighter."""
+        vector = self._standardize(self._source.values[row, self._column_indexes])
+        self.vectors[row] = vector
+        self._sq_norms[row] = vector @ vector
+        self._indexed[row] = True
+        self._row_of[fighter_id] = row
+        self._add_to_weight_class(row, self._source.weight_classes[row])
+        if self.centroids is not None:
+            cluster = int(_nearest_centroids(vector[None, :], self.centroids)[0])
+            self._cluster_of[row] = cluster
+            self._cluster_rows[cluster].add(row)
+
+    def update(
+        self,
+        removed: typing.Iterable[typing.Dict[str, typing.Any]],
+        added: typing.Iterable[typing.Dict[str, typing.Any]],
+    ) -> None:
+        """
+        Re-index fighters after a committed write, once the matrix is updated.
+
+        The standardization and the clusters are kept until the next rebuild.
+
+        Args:
+            removed (Iterable[Dict[str, Any]]): Flat records before the write (updated or deleted fighters).
+            added (Iterable[Dict[str, Any]]): Flat records after the write (inserted or updated fighters).
+        """
+        if self._source is None:
+            return
+        for record in removed:
+            self._drop(record["fighter_id"])
+        self._ensure_capacity()
+        for record in added:
+            row = self._source.row_of.get(record["fighter_id"])
+            if row is not None:
+                self._drop(record["fighter_id"])
+                self._insert(record["fighter_id"], row)
+
+    def _candidates(
+        self, query: np.ndarray, weight_class: str | None, restrict: bool, k: int
+    ) -> np.ndarray:
+        """
+        Select the rows compared with a query vector.
+
+        A weight class of at most SIMILARITY_BRUTE_FORCE_MAX fighters is
+        searched exhaustively. Otherwise the SIMILARITY_PROBES clusters nearest
+        to the query are scanned, and further clusters in order of distance
+        until they hold `k` fighters besides the query fighter (of the weight
+        class, when restricted), so a filter never returns fewer than `k`
+        fighters while enough exist.
+
+        Args:
+            query (np.ndarray): Standardized query vector.
+            weight_class (str | None): Weight class of the query fighter.
+            restrict (bool): Only keep fighters of `weight_class`.
+            k (int): Number of neighbours requested.
+
+        Returns:
+            np.ndarray: int64 row indexes.
+        """
+        allowed = self._weight_class_rows.get(weight_class, set()) if restrict else None
+        if allowed is not None and (
+            self.centroids is None or len(allowed) <= SIMILARITY_BRUTE_FORCE_MAX
+        ):
+            return np.fromiter(allowed, dtype=np.int64, count=len(allowed))
+        if self.centroids is None:
+            return np.flatnonzero(self._indexed)
+
+        distances = np.einsum("ij,ij->i", self.centroids, self.centroids) - 2.0 * (
+            self.centroids @ query
+        )
+        rows: typing.Set[int] = set()
+        for probed, cluster in enumerate(np.argsort(distances), start=1):
+            members = self._cluster_rows[cluster]
+            rows |= members if allowed is None else members & allowed
+            # one extra for the query fighter itself
+            if probed >= SIMILARITY_PROBES and len(rows) > k:
+                break
+        return np.fromiter(rows, dtype=np.int64, count=len(rows))
+
+    def nearest(
+        self, fighter_id: int, k: int, same_weight_class: bool = False
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Find the fighters whose style stats are closest to a fighter's.
+
+        The query fighter is read from the current matrix row, so it reflects
+        writes made after the index was built.
+
+        Args:
+            fighter_id (int): Fighter ID.
+            k (int): Number of neighbours to return.
+            same_weight_class (bool): Only return fighters of the same weight class.
+
+        Returns:
+            list[dict]: `fighter_id`, `weight_class` and Euclidean `distance`
+            in standard deviations, closest first.
+
+        Raises:
+            NotFoundException: If the fighter does not exist.
+        """
+        row = self._source.row_of.get(fighter_id) if self._source else None
+        if row is None:
+            raise NotFoundException(f"Fighter {fighter_id} not found")
+        query = self._standardize(self._source.values[row, self._column_indexes])
+        weight_class = self._source.weight_classes[row]
+
+        rows = self._candidates(query, weight_class, same_weight_class, k)
+        rows = rows[self._source.fighter_ids[rows] != fighter_id]
+        distances = (
+            self._sq_norms[rows] - 2.0 * (self.vectors[rows] @ query) + query @ query
+        )
+        if len(rows) > k:
+            top = np.argpartition(distances, k)[:k]
+            rows, distances = rows[top], distances[top]
+        order = np.argsort(distances, kind="stable")
+        return [
+            {
+                "fighter_id": int(self._source.fighter_ids[row]),
+                "weight_class": self._source.weight_classes[row],
+                "distance": float(np.sqrt(max(distance, 0.0))),
+            }
+            for row, distance in zip(rows[order], distances[order])
+        ]
+
+
+similarity_index = SimilarityIndex()
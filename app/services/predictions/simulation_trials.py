@@ -0,0 +1,112 @@
+import typing
+
+import numpy as np
+
+# Monte Carlo kernels run inside the simulation worker processes. Only NumPy is
+# imported here, so spawned workers start without loading the web app or the
+# database layer.
+
+# Trials simulated per vectorized step; bounds the temporary arrays.
+TRIAL_BATCH_SIZE = 20_000
+
+
+class CardCounts(typing.NamedTuple):
+    """Tallies of an event card simulation."""
+
+    wins: np.ndarray
+    finishes: np.ndarray
+    finish_histogram: np.ndarray
+
+
+class BracketCounts(typing.NamedTuple):
+    """Tallies of a bracket simulation."""
+
+    champions: np.ndarray
+    finish_histogram: np.ndarray
+
+
+def _batches(trials: int, batch_size: int) -> typing.Iterator[int]:
+    """Yield batch sizes adding up to `trials`."""
+    for start in range(0, trials, batch_size):
+        yield min(batch_size, trials - start)
+
+
+def simulate_card(
+    win_probabilities: np.ndarray,
+    finish_probabilities: np.ndarray,
+    trials: int,
+    seed: np.random.SeedSequence,
+    batch_size: int = TRIAL_BATCH_SIZE,
+) -> CardCounts:
+    """
+    Simulate independent bouts of an event card.
+
+    Args:
+        win_probabilities (np.ndarray): P(first fighter wins) per bout.
+        finish_probabilities (np.ndarray): P(bout ends before the judges) per bout.
+        trials (int): Number of trials.
+        seed (np.random.SeedSequence): Seed of this shard's random stream.
+        batch_size (int): Trials simulated per vectorized step.
+
+    Returns:
+        CardCounts: Wins of the first fighter and finishes per bout, and the
+        number of trials per total number of finishes (0 to bouts).
+    """
+    rng = np.random.default_rng(seed)
+    bouts = len(win_probabilities)
+    wins = np.zeros(bouts, dtype=np.int64)
+    finishes = np.zeros(bouts, dtype=np.int64)
+    histogram = np.zeros(bouts + 1, dtype=np.int64)
+    for size in _batches(trials, batch_size):
+        won = rng.random((size, bouts)) < win_probabilities
+        finished = rng.random((size, bouts)) < finish_probabilities
+        wins += won.sum(axis=0)
+        finishes += finished.sum(axis=0)
+        histogram += np.bincount(finished.sum(axis=1), minlength=bouts + 1)
+    return CardCounts(wins, finishes, histogram)
+
+
+def simulate_bracket(
+    scores: np.ndarray,
+    finish_rates: np.ndarray,
+    trials: int,
+    seed: np.random.SeedSequence,
+    batch_size: int = TRIAL_BATCH_SIZE,
+) -> BracketCounts:
+    """
+    Simulate a single-elimination bracket.
+
+    Entrants are paired in order (1 vs 2, 3 vs 4, ...) and winners advance
+    in the same order. P(A beats B) is `sigmoid(score_A - score_B)` and a
+    bout is finished with the mean finish rate of its two fighters.
+
+    Args:
+        scores (np.ndarray): Model score per entrant, in bracket order; length a power of two.
+        finish_rates (np.ndarray): Share of each entrant's bouts ending in a finish.
+        trials (int): Number of trials.
+        seed (np.random.SeedSequence): Seed of this shard's random stream.
+        batch_size (int): Trials simulated per vectorized step.
+
+    Returns:
+        BracketCounts: Titles won per entrant and the number of trials per
+        total number of finishes (0 to entrants - 1).
+    """
+    rng = np.random.default_rng(seed)
+    entrants = len(scores)
+    champions = np.zeros(entrants, dtype=np.int64)
+    histogram = np.zeros(entrants, dtype=np.int64)
+    for size in _batches(trials, batch_size):
+        # entrant index of every fighter still in, one row per trial
+        alive = np.broadcast_to(np.arange(entrants), (size, entrants))
+        finished = np.zeros(size, dtype=np.int64)
+        while alive.shape[1] > 1:
+            first, second = alive[:, 0::2], alive[:, 1::2]
+            logits = scores[first] - scores[second]
+            # u < sigmoid(logits), without an extra array for the probabilities
+            won = rng.random(first.shape) * (1.0 + np.exp(-logits)) < 1.0
+            alive = np.where(won, first, second)
+            finish = 0.5 * (finish_rates[first] + finish_rates[second])
+            finished += (rng.random(first.shape) < finish).sum(axis=1)
+        champions += np.bincount(alive[:, 0], minlength=entrants)
+        histogram += np.bincount(finished, minlength=entrants)
+    return BracketCounts(champions, histogram)
@@ -0,0 +1,130 @@
+import os
+import typing
+
+import numpy as np
+
+DEFAULT_RATING = 1500.0
+DEFAULT_DEVIATION = 350.0
+DEFAULT_VOLATILITY = 0.06
+
+# System constant constraining volatility changes (0.3 to 1.2 in the paper).
+RATING_TAU: float = float(os.getenv("RATING_TAU", "0.5"))
+
+# Conversion factor between the Glicko and Glicko-2 scales.
+GLICKO2_SCALE = 173.7178
+CONVERGENCE_TOLERANCE = 1e-6
+
+# Score of `fighter_id` per bout result; no contests are not rated.
+RESULT_SCORES = {"win": 1.0, "loss": 0.0, "draw": 0.5}
+
+
+class Ratings(typing.NamedTuple):
+    """Glicko-2 state of one or more fighters on the Glicko scale."""
+
+    rating: np.ndarray
+    deviation: np.ndarray
+    volatility: np.ndarray
+
+
+def _g(phi: np.ndarray) -> np.ndarray:
+    return 1.0 / np.sqrt(1.0 + 3.0 * phi**2 / np.pi**2)
+
+
+def _new_volatility(
+    delta: np.ndarray,
+    phi: np.ndarray,
+    variance: np.ndarray,
+    volatility: np.ndarray,
+    tau: float,
+) -> np.ndarray:
+    """
+    Solve for the new volatility with the Illinois algorithm (Glickman, step 5).
+
+    Args:
+        delta (np.ndarray): Estimated rating improvement.
+        phi (np.ndarray): Rating deviation on the Glicko-2 scale.
+        variance (np.ndarray): Estimated variance of the rating from the bout.
+        volatility (np.ndarray): Current volatility.
+        tau (float): System constant.
+
+    Returns:
+        np.ndarray: New volatility per fighter.
+    """
+    a = np.log(volatility**2)
+    spread = delta**2 - phi**2 - variance
+
+    def f(x: np.ndarray) -> np.ndarray:
+        ex = np.exp(x)
+        return (
+            ex * (spread - ex) / (2.0 * (phi**2 + variance + ex) ** 2)
+            - (x - a) / tau**2
+        )
+
+    lower = a.copy()
+    upper = np.log(np.where(spread > 0, spread, 1.0))
+    bracket = spread <= 0
+    k = np.ones_like(a)
+    while True:
+        # step down until f changes sign, only for fighters without a bracket yet
+        searching = bracket & (f(a - k * tau) < 0)
+        if not searching.any():
+            break
+        k[searching] += 1
+    upper = np.where(bracket, a - k * tau, upper)
+
+    f_lower, f_upper = f(lower), f(upper)
+    active = np.abs(upper - lower) > CONVERGENCE_TOLERANCE
+    while active.any():
+        # converged entries may divide by zero; their result is discarded
+        with np.errstate(divide="ignore", invalid="ignore"):
+            new = lower + (lower - upper) * f_lower / (f_upper - f_lower)
+        f_new = f(new)
+        swap = active & (f_new * f_upper <= 0)
+        halve = active & ~swap
+        lower = np.where(swap, upper, lower)
+        f_lower = np.where(swap, f_upper, np.where(halve, f_lower / 2.0, f_lower))
+        upper = np.where(active, new, upper)
+        f_upper = np.where(active, f_new, f_upper)
+        active &= np.abs(upper - lower) > CONVERGENCE_TOLERANCE
+    return np.exp(lower / 2.0)
+
+
+def update(
+    player: Ratings,
+    opponent: Ratings,
+    score: np.ndarray,
+    tau: float = RATING_TAU,
+) -> Ratings:
+    """
+    Apply one bout to each player, treating the bout as a rating period.
+
+    Every argument is an array with one entry per player, so any number of
+    independent bouts is rated in one vectorized call.
+
+    Args:
+        player (Ratings): Ratings of the players before the bout.
+        opponent (Ratings): Ratings of their opponents before the bout.
+        score (np.ndarray): 1 for a win, 0.5 for a draw and 0 for a loss.
+        tau (float): System constant.
+
+    Returns:
+        Ratings: Ratings of the players after the bout.
+    """
+    mu = (player.rating - DEFAULT_RATING) / GLICKO2_SCALE
+    phi = player.deviation / GLICKO2_SCALE
+    opponent_mu = (opponent.rating - DEFAULT_RATING) / GLICKO2_SCALE
+    g = _g(opponent.deviation / GLICKO2_SCALE)
+
+    expected = 1.0 / (1.0 + np.exp(-g * (mu - opponent_mu)))
+    variance = 1.0 / (g**2 * expected * (1.0 - expected))
+    delta = variance * g * (score - expected)
+
+    volatility = _new_volatility(delta, phi, variance, player.volatility, tau)
+    phi_star = np.sqrt(phi**2 + volatility**2)
+    new_phi = 1.0 / np.sqrt(1.0 / phi_star**2 + 1.0 / variance)
+    new_mu = mu + new_phi**2 * g * (score - expected)
+    return Ratings(
+        new_mu * GLICKO2_SCALE + DEFAULT_RATING,
+        new_phi * GLICKO2_SCALE,
+        volatility,
+    )
@@ -0,0 +1,374 @@
+import time
+import typing
+from datetime import date
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants import STREAM_CHUNK_SIZE
+from app.db.models import Bouts, FighterRatings
+from app.db.models.fighters import Fighters
+from app.services.bouts.bout_history import BoutHistory
+from app.services.ratings import glicko2
+from app.services.ratings.glicko2 import (
+    DEFAULT_DEVIATION,
+    DEFAULT_RATING,
+    DEFAULT_VOLATILITY,
+    RESULT_SCORES,
+    Ratings,
+)
+from app.tools.exceptions.custom_api_exceptions import (
+    BadRequestException,
+    NotFoundException,
+)
+from app.tools.logger import logger
+
+RATING_COLUMNS = (
+    FighterRatings.rating,
+    FighterRatings.rating_deviation,
+    FighterRatings.volatility,
+    FighterRatings.bouts,
+    FighterRatings.last_bout_date,
+)
+
+
+def _default_rating(fighter_id: int) -> typing.Dict[str, typing.Any]:
+    """Return the rating row of a fighter without rated bouts."""
+    return {
+        "fighter_id": fighter_id,
+        "rating": DEFAULT_RATING,
+        "rating_deviation": DEFAULT_DEVIATION,
+        "volatility": DEFAULT_VOLATILITY,
+        "bouts": 0,
+        "last_bout_date": None,
+    }
+
+
+def schedule_layers(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Group chronologically ordered bouts into layers of independent bouts.
+
+    A bout's layer is one past the latest layer either fighter appeared in,
+    so no fighter appears twice in a layer and every bout comes after the
+    earlier bouts of both its fighters. Rating the layers in order gives the
+    same result as rating the bouts one by one.
+
+    Args:
+        first (np.ndarray): Compact index of the first fighter of each bout.
+        second (np.ndarray): Compact index of the second fighter of each bout.
+
+    Returns:
+        np.ndarray: Layer number per bout.
+    """
+    last_layer = [0] * (int(max(first.max(), second.max())) + 1)
+    layers = np.empty(len(first), dtype=np.int64)
+    for bout, (a, b) in enumerate(zip(first.tolist(), second.tolist())):
+        layer = max(last_layer[a], last_layer[b]) + 1
+        last_layer[a] = last_layer[b] = layers[bout] = layer
+    return layers
+
+
+class RatingEngine:
+    """
+    Glicko-2 ratings driven by the bouts table.
+
+    `record_bout` stores a bout and updates the two fighters' ratings in
+    place, touching two rating rows. `replay` recomputes every rating from the
+    full bout history in one pass, e.g. after importing or correcting bouts.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            db (AsyncSession): The SQLAlchemy asynchronous session.
+        """
+        self.db = db
+
+    async def _get_ratings(
+        self, fighter_ids: typing.Sequence[int]
+    ) -> typing.Dict[int, typing.Dict[str, typing.Any]]:
+        """
+        Read the ratings of some fighters, defaults for fighters without a row.
+
+        Args:
+            fighter_ids (Sequence[int]): Fighter IDs.
+
+        Returns:
+            Dict[int, Dict[str, Any]]: Rating row per fighter ID.
+        """
+        result = await self.db.execute(
+            select(FighterRatings.fighter_id, *RATING_COLUMNS).where(
+                FighterRatings.fighter_id.in_(fighter_ids)
+            )
+        )
+        ratings = {
+            fighter_id: _default_rating(fighter_id) for fighter_id in fighter_ids
+        }
+        for row in result.mappings().all():
+            ratings[row["fighter_id"]] = dict(row)
+        return ratings
+
+    async def record_bout(
+        self,
+        fighter_id: int,
+        opponent_id: int,
+        result: str,
+        event_date: date,
+        method: str | None = None,
+        round: int | None = None,
+        time_seconds: int | None = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Store a bout and update both fighters' ratings.
+
+        The bout is rated as happening after every bout already recorded;
+        `replay` re-rates the history in event date order when bouts are
+        recorded out of order.
+
+        Args:
+            fighter_id (int): ID of the first fighter.
+            opponent_id (int): ID of the second fighter.
+            result (str): Outcome for `fighter_id`: "win", "loss", "draw" or "nc".
+            event_date (date): Date of the bout.
+            method (str | None): How the bout ended.
+            round (int | None): Round the bout ended in.
+            time_seconds (int | None): Time elapsed in the final round, in seconds.
+
+        Returns:
+            Dict[str, Any]: The bout ID and both fighters' ratings after the bout.
+
+        Raises:
+            BadRequestException: If both IDs are the same or the result is unknown.
+            NotFoundException: If either fighter does not exist.
+        """
+        if fighter_id == opponent_id:
+            raise BadRequestException("A fighter cannot fight themselves")
+        if result not in RESULT_SCORES and result != "nc":
+            raise BadRequestException(f"Invalid bout result: {result}")
+
+        # serializes rating updates of the same fighters; ordered to avoid deadlocks
+        ids = sorted((fighter_id, opponent_id))
+        found = await self.db.execute(
+            select(Fighters.fighter_id)
+            .where(Fighters.fighter_id.in_(ids))
+            .order_by(Fighters.fighter_id)
+            .with_for_update(key_share=True)
+        )
+        missing = set(ids) - set(found.scalars().all())
+        if missing:
+            raise NotFoundException(f"Fighters not found: {sorted(missing)}")
+
+        history = BoutHistory(self.db)
+        await history.ensure_partitions([event_date.year])
+        bout_id = (
+            await self.db.execute(
+                insert(Bouts)
+                .values(
+                    event_date=event_date,
+                    fighter_id=fighter_id,
+                    opponent_id=opponent_id,
+                    result=result,
+                    method=method,
+                    round=round,
+                    time_seconds=time_seconds,
+                )
+                .returning(Bouts.bout_id)
+            )
+        ).scalar_one()
+        await history.update_spans(
+            {
+                fighter_id: (event_date, event_date),
+                opponent_id: (event_date, event_date),
+            }
+        )
+
+        ratings = await self._get_ratings(ids)
+        if result in RESULT_SCORES:
+            players = [ratings[fighter_id], ratings[opponent_id]]
+            state = Ratings(
+                *(
+                    np.array([player[column] for player in players])
+                    for column in ("rating", "rating_deviation", "volatility")
+                )
+            )
+            opponents = Ratings(*(values[::-1] for values in state))
+            score = RESULT_SCORES[result]
+            new = glicko2.update(state, opponents, np.array([score, 1.0 - score]))
+            for i, player in enumerate(players):
+                player.update(
+                    rating=float(new.rating[i]),
+                    rating_deviation=float(new.deviation[i]),
+                    volatility=float(new.volatility[i]),
+                    bouts=player["bouts"] + 1,
+                    last_bout_date=max(
+                        filter(None, (player["last_bout_date"], event_date))
+                    ),
+                )
+            stmt = insert(FighterRatings).values(players)
+            await self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[FighterRatings.fighter_id],
+                    set_={
+                        column.key: getattr(stmt.excluded, column.key)
+                        for column in RATING_COLUMNS
+                    },
+                )
+            )
+        await self.db.commit()
+        return {
+            "bout_id": bout_id,
+            "ratings": [ratings[fighter_id], ratings[opponent_id]],
+        }
+
+    async def _load_bouts(self) -> typing.Dict[str, np.ndarray]:
+        """
+        Read every rated bout in rating order.
+
+        Returns:
+            Dict[str, np.ndarray]: Columns `event_date` (datetime64[D]),
+            `fighter_id`, `opponent_id` and `score`.
+        """
+        result = await self.db.stream(
+            select(Bouts.event_date, Bouts.fighter_id, Bouts.opponent_id, Bouts.result)
+            .where(Bouts.result.in_(list(RESULT_SCORES)))
+            .order_by(Bouts.event_date, Bouts.bout_id)
+            .execution_options(yield_per=STREAM_CHUNK_SIZE * 20)
+        )
+        dates, fighters, opponents, scores = [], [], [], []
+        async for partition in result.partitions():
+            for event_date, fighter_id, opponent_id, outcome in partition:
+                dates.append(event_date)
+                fighters.append(fighter_id)
+                opponents.append(opponent_id)
+                scores.append(RESULT_SCORES[outcome])
+        return {
+            "event_date": np.array(dates, dtype="datetime64[D]"),
+            "fighter_id": np.array(fighters, dtype=np.int64),
+            "opponent_id": np.array(opponents, dtype=np.int64),
+            "score": np.array(scores, dtype=np.float64),
+        }
+
+    async def replay(self) -> int:
+        """
+        Recompute every rating from the bout history and replace the table.
+
+        Bouts are grouped into layers of independent bouts (see
+        `schedule_layers`) and each layer is rated in one vectorized update.
+
+        Returns:
+            int: Number of rated fighters.
+        """
+        start = time.perf_counter()
+        bouts = await self._load_bouts()
+        total = len(bouts["score"])
+        fighter_ids, compact = np.unique(
+            np.concatenate((bouts["fighter_id"], bouts["opponent_id"])),
+            return_inverse=True,
+        )
+        count = len(fighter_ids)
+        first, second = compact[:total], compact[total:]
+
+        state = Ratings(
+            np.full(count, DEFAULT_RATING),
+            np.full(count, DEFAULT_DEVIATION),
+            np.full(count, DEFAULT_VOLATILITY),
+        )
+        rated_bouts = np.zeros(count, dtype=np.int64)
+        last_bout = np.full(count, np.datetime64("NaT"), dtype="datetime64[D]")
+
+        if total:
+            layers = schedule_layers(first, second)
+            order = np.argsort(layers, kind="stable")
+            boundaries = np.flatnonzero(np.diff(layers[order])) + 1
+            for batch in np.split(order, boundaries):
+                players = np.concatenate((first[batch], second[batch]))
+                opponents = np.concatenate((second[batch], first[batch]))
+                scores = np.concatenate(
+                    (bouts["score"][batch], 1.0 - bouts["score"][batch])
+                )
+                new = glicko2.update(
+                    Ratings(*(values[players] for values in state)),
+                    Ratings(*(values[opponents] for values in state)),
+                    scores,
+                )
+                for values, updated in zip(state, new):
+                    values[players] = updated
+                rated_bouts[players] += 1
+                last_bout[players] = np.tile(bouts["event_date"][batch], 2)
+
+        await self.db.execute(delete(FighterRatings))
+        connection = await (await self.db.connection()).get_raw_connection()
+        await connection.driver_connection.copy_records_to_table(
+            FighterRatings.__tablename__,
+            records=zip(
+                fighter_ids.tolist(),
+                state.rating.tolist(),
+                state.deviation.tolist(),
+                state.volatility.tolist(),
+                rated_bouts.tolist(),
+                last_bout.tolist(),
+            ),
+            columns=["fighter_id", *(column.key for column in RATING_COLUMNS)],
+        )
+        await self.db.commit()
+        logger.info(
+            f"Replayed {total} bouts for {count} fighters "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+        return count
+
+    async def get_rating(self, fighter_id: int) -> typing.Dict[str, typing.Any]:
+        """
+        Read a fighter's rating.
+
+        Args:
+            fighter_id (int): Fighter ID.
+
+        Returns:
+            Dict[str, Any]: Rating row, the default rating if the fighter has no rated bout.
+
+        Raises:
+            NotFoundException: If the fighter does not exist.
+        """
+        found = await self.db.execute(
+            select(Fighters.fighter_id).where(Fighters.fighter_id == fighter_id)
+        )
+        if found.scalar_one_or_none() is None:
+            raise NotFoundException(f"Fighter {fighter_id} not found")
+        return (await self._get_ratings([fighter_id]))[fighter_id]
+
+    async def get_leaderboard(
+        self, offset: int, limit: int, weight_class: str | None = None
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Read fighters ordered by rating, highest first.
+
+        The query walks `ix_fighter_ratings_rating` backwards and stops after
+        `offset + limit` matching fighters, so no sort of the table is needed.
+        Fighters without a rated bout are not ranked.
+
+        Args:
+            offset (int): Rank of the first fighter to return (0-based).
+            limit (int): Maximum number of fighters to return.
+            weight_class (str | None): Optional weight class to restrict the ranking to.
+
+        Returns:
+            list[dict]: Fighter names, weight class and rating rows in rank order.
+        """
+        stmt = select(
+            Fighters.fighter_id,
+            Fighters.name,
+            Fighters.surname,
+            Fighters.weight_class,
+            *RATING_COLUMNS,
+        ).join(FighterRatings, FighterRatings.fighter_id == Fighters.fighter_id)
+        if weight_class is not None:
+            stmt = stmt.where(Fighters.weight_class == weight_class)
+        result = await self.db.execute(
+            stmt.order_by(FighterRatings.rating.desc()).offset(offset).limit(limit)
+        )
+        return [dict(row) for row in result.mappings().all()]
@@ -1,8 +1,11 @@
 import typing
 from datetime import datetime
 
+from fastapi.responses import StreamingResponse
 from fastapi.templating import Jinja2Templates
 
+STREAM_FLUSH_SIZE = 16 * 1024
+
 
 def short_date(value: datetime) -> str:
     """Format a datetime object to a short date string (DD.MM.YYYY).
@@ -41,3 +44,61 @@ templates.env.globals.update(
 
 templates.env.filters["short_date"] = short_date
 templates.env.filters["clean_str"] = clean_str
+
+# Async overlay sharing loader, globals and filters; used for streamed rendering.
+stream_env = templates.env.overlay(enable_async=True)
+
+
+async def _buffered_chunks(
+    chunks: typing.AsyncIterator[str], flush_size: int
+) -> typing.AsyncIterator[str]:
+    """Coalesce small rendered fragments into chunks of roughly `flush_size` characters.
+
+    The first fragment (the document head) is flushed immediately so the client
+    receives bytes before the first database row is fetched.
+
+    Args:
+        chunks (AsyncIterator[str]): Fragments produced by Jinja's async generation.
+        flush_size (int): Minimum buffered size before a chunk is sent.
+
+    Yields:
+        str: Buffered HTML chunk.
+    """
+    buffer: typing.List[str] = []
+    size = 0
+    first = True
+    async for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if first or size >= flush_size:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+            first = False
+    if buffer:
+        yield "".join(buffer)
+
+
+def stream_template_response(
+    name: str,
+    context: typing.Dict[str, typing.Any],
+    flush_size: int = STREAM_FLUSH_SIZE,
+) -> StreamingResponse:
+    """Render a template incrementally and stream it as chunked HTML.
+
+    Context values may be async iterables (e.g. row iterators from `FighterUtils`);
+    the template consumes them lazily while the response is being sent.
+
+    Args:
+        name (str): Template file name.
+        context (Dict[str, Any]): Template context, must contain "request".
+        flush_size (int, optional): Approximate size of each streamed chunk.
+
+    Returns:
+        StreamingResponse: Response streaming the rendered HTML.
+    """
+    template = stream_env.get_template(name)
+    return StreamingResponse(
+        _buffered_chunks(template.generate_async(context), flush_size),
+        media_type="text/html",
+    )
@@ -3,9 +3,11 @@ from fastapi.responses import JSONResponse
 
 from app.tools import logger
 from app.tools.exceptions.custom_api_exceptions import (
+    BadRequestException,
     ForbiddenException,
     InternalServerError,
     NotFoundException,
+    ServiceUnavailableException,
     UnauthorizedException,
 )
 
@@ -46,6 +48,30 @@ def register_exception_handlers(app: FastAPI) -> None:
             },
         )
 
+    @app.exception_handler(BadRequestException)
+    async def bad_request_handler(
+        request: Request, exc: BadRequestException
+    ) -> JSONResponse:
+        """
+        Handle `BadRequestException`.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            exc (BadRequestException): The raised exception.
+
+        Returns:
+            JSONResponse: JSON response with status 400 and error details.
+        """
+        logger.warning(f"Bad request: {exc.detail} | {request.url}")
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "error": "bad_request",
+                "detail": exc.detail,
+                "path": str(request.url),
+            },
+        )
+
     @app.exception_handler(ForbiddenException)
     async def forbidden_handler(
         request: Request, exc: ForbiddenException
@@ -117,6 +143,31 @@ def register_exception_handlers(app: FastAPI) -> None:
             },
         )
 
+    @app.exception_handler(ServiceUnavailableException)
+    async def service_unavailable_handler(
+        request: Request, exc: ServiceUnavailableException
+    ) -> JSONResponse:
+        """
+        Handle `ServiceUnavailableException`.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            exc (ServiceUnavailableException): The raised exception.
+
+        Returns:
+            JSONResponse: JSON response with status 503, error details and a Retry-After header.
+        """
+        logger.warning(f"Service unavailable: {exc.detail} | {request.url}")
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "error": "service_unavailable",
+                "detail": exc.detail,
+                "path": str(request.url),
+            },
+            headers={"Retry-After": "1"},
+        )
+
     @app.exception_handler(Exception)
     async def global_handler(request: Request, exc: Exception) -> JSONResponse:
         """
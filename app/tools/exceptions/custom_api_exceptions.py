@@ -57,3 +57,29 @@ class InternalServerError(HTTPException):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=detail,
         )
+
+
+class BadRequestException(HTTPException):
+    """Exception raised when the request contains invalid parameters."""
+
+    def __init__(self, detail: str = "Invalid request parameters") -> None:
+        """
+        Initialize a BadRequestException.
+
+        Args:
+            detail (str, optional): Custom error message. Defaults to "Invalid request parameters".
+        """
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class ServiceUnavailableException(HTTPException):
+    """Exception raised when the server is too busy to handle the request."""
+
+    def __init__(self, detail: str = "Service temporarily unavailable") -> None:
+        """
+        Initialize a ServiceUnavailableException.
+
+        Args:
+            detail (str, optional): Custom error message. Defaults to "Service temporarily unavailable".
+        """
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
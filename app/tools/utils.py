@@ -1,9 +1,15 @@
+import base64
+import binascii
+import json
 import typing
 from functools import wraps
 
 from pydantic import BaseModel, create_model
 
-from app.tools.exceptions.custom_api_exceptions import NotFoundException
+from app.tools.exceptions.custom_api_exceptions import (
+    BadRequestException,
+    NotFoundException,
+)
 from app.tools.logger import logger
 
 
@@ -63,3 +69,84 @@ def create_filter_schema(schema: typing.Type[BaseModel]) -> typing.Type[BaseMode
             if field not in ("fighter_id", "last_updated")
         },
     )
+
+
+def encode_cursor(position: typing.Dict[str, typing.Any]) -> str:
+    """
+    Encode a pagination position into an opaque, URL-safe cursor token.
+
+    Args:
+        position (Dict[str, Any]): JSON-serializable position (e.g. last seen fighter_id).
+
+    Returns:
+        str: Cursor token safe to pass back as a query parameter.
+    """
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> typing.Dict[str, typing.Any]:
+    """
+    Decode a cursor token produced by `encode_cursor`.
+
+    Args:
+        token (str): Cursor token received from the client.
+
+    Returns:
+        Dict[str, Any]: The decoded pagination position.
+
+    Raises:
+        BadRequestException: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise BadRequestException("Invalid pagination cursor") from e
+
+    if not isinstance(position, dict):
+        raise BadRequestException("Invalid pagination cursor")
+    return position
+
+
+def decode_after_id(cursor: str | None) -> int | None:
+    """
+    Extract the last seen fighter ID from a keyset pagination cursor.
+
+    Args:
+        cursor (str | None): Cursor token, None for the first page.
+
+    Returns:
+        int | None: Fighter ID to continue after, None for the first page.
+
+    Raises:
+        BadRequestException: If the token is malformed.
+    """
+    if not cursor:
+        return None
+    after_id = decode_cursor(cursor).get("after")
+    if not isinstance(after_id, int):
+        raise BadRequestException("Invalid pagination cursor")
+    return after_id
+
+
+def decode_offset(cursor: str | None, default: int = 0) -> int:
+    """
+    Extract the rank offset from a leaderboard pagination cursor.
+
+    Args:
+        cursor (str | None): Cursor token, None for the first page.
+        default (int): Offset used when no cursor is given.
+
+    Returns:
+        int: Rank of the first record on the page.
+
+    Raises:
+        BadRequestException: If the token is malformed.
+    """
+    if not cursor:
+        return default
+    offset = decode_cursor(cursor).get("offset")
+    if not isinstance(offset, int) or offset < 0:
+        raise BadRequestException("Invalid pagination cursor")
+    return offset
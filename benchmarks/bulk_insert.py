@@ -0,0 +1,108 @@
+"""Compare per-object ORM inserts with the bulk writer used by `/multiple`.
+
+Both paths insert the same synthetic extended fighters inside a transaction
+that is rolled back afterwards, so the database is left unchanged. Requires a
+database reachable through DATABASE_URL with the schema migrated.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bulk_insert.py --rows 50000
+"""
+
+import argparse
+import asyncio
+import time
+import typing
+import uuid
+
+from app.db.database import SessionLocal, engine
+from app.db.models.fighters import Fighters
+from app.schemas.extended_fighter import ExtendedFighterFilter
+from app.services.fighters.fighter_bulk_writer import FighterBulkWriter
+from app.services.fighters.fighter_utils import FighterUtils
+
+IS_EXTENDED = True
+
+
+def make_fighters(rows: int) -> typing.List[ExtendedFighterFilter]:
+    """Build synthetic fighters with unique names.
+
+    Args:
+        rows (int): Number of fighters.
+
+    Returns:
+        list[ExtendedFighterFilter]: Request items.
+    """
+    run = uuid.uuid4().hex[:8]
+    return [
+        ExtendedFighterFilter(
+            name=f"bench{run}",
+            nickname=str(i),
+            surname="bulk",
+            country="Poland",
+            weight_class="Lightweight",
+            wins=i % 30,
+            loss=i % 10,
+            base_stats={"age": 20 + i % 20, "height": 180.0},
+            extended_stats={"slpm": 3.5, "str_acc": 0.45},
+            fights_results={"win_by_ko_tko": i % 7},
+        )
+        for i in range(rows)
+    ]
+
+
+async def orm_insert(fighters: typing.List[ExtendedFighterFilter]) -> None:
+    """Insert fighters the way `add_multiple_fighters` used to, then roll back.
+
+    Args:
+        fighters (list[ExtendedFighterFilter]): Request items.
+    """
+    async with SessionLocal() as db:
+        objects = []
+        for fighter in fighters:
+            data = fighter.model_dump(exclude_none=True)
+            FighterUtils.convert_stats_dicts_to_models(data)
+            objects.append(Fighters(**data))
+        db.add_all(objects)
+        await db.flush()
+        await db.rollback()
+
+
+async def bulk_insert(fighters: typing.List[ExtendedFighterFilter]) -> None:
+    """Insert fighters through `FighterBulkWriter`, then roll back.
+
+    Args:
+        fighters (list[ExtendedFighterFilter]): Request items.
+    """
+    async with SessionLocal() as db:
+        results, _ = await FighterBulkWriter(db, IS_EXTENDED).insert_fighters(fighters)
+        assert all(result["success"] for result in results)
+        await db.rollback()
+
+
+async def main(rows: int) -> None:
+    """Benchmark both paths and print a comparison table.
+
+    Args:
+        rows (int): Number of fighters per insert.
+    """
+    fighters = make_fighters(rows)
+    results = []
+    for name, insert in (("orm", orm_insert), ("bulk", bulk_insert)):
+        start = time.perf_counter()
+        await insert(fighters)
+        elapsed = time.perf_counter() - start
+        results.append((name, elapsed, rows / elapsed))
+    await engine.dispose()
+
+    header = f"{'path':<6}{'seconds':>10}{'rows/sec':>14}"
+    print(header)
+    print("-" * len(header))
+    for name, elapsed, rate in results:
+        print(f"{name:<6}{elapsed:>10.2f}{rate:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
@@ -0,0 +1,125 @@
+"""Compare the ORM and the database-built JSON read paths for extended fighters.
+
+Both paths produce the same JSON array for one keyset page: the ORM path runs
+`EXTENDED_STMT`, validates every row with Pydantic and serializes it, while the
+JSON path returns text built by `json_build_object`/`json_agg`. Requires a
+populated database reachable through DATABASE_URL.
+
+Usage:
+    PYTHONPATH=. python benchmarks/extended_read_paths.py --page-size 500 --repeat 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+import typing
+
+from pydantic import TypeAdapter
+
+from app.db.database import SessionLocal, engine
+from app.schemas import ExtendedFighter
+from app.services.fighters.fighter_getter import FighterGetter
+from app.services.fighters.fighter_json_reader import FighterJsonReader
+
+IS_EXTENDED = True
+
+fighters_adapter = TypeAdapter(typing.List[ExtendedFighter])
+
+
+async def orm_page(page_size: int) -> bytes:
+    """Read one page through the ORM path and serialize it.
+
+    Args:
+        page_size (int): Number of fighters to read.
+
+    Returns:
+        bytes: JSON array payload.
+    """
+    async with SessionLocal() as db:
+        page, _ = await FighterGetter(db, IS_EXTENDED)._get_records_page(
+            [], None, page_size
+        )
+    return fighters_adapter.dump_json(page)
+
+
+async def json_page(page_size: int) -> str:
+    """Read one page through the database-built JSON path.
+
+    Args:
+        page_size (int): Number of fighters to read.
+
+    Returns:
+        str: JSON array payload.
+    """
+    async with SessionLocal() as db:
+        payload, _ = await FighterJsonReader(db, IS_EXTENDED).get_fighters_page_json(
+            None, page_size
+        )
+    return payload
+
+
+async def run_path(
+    name: str,
+    read: typing.Callable[[int], typing.Awaitable[str | bytes]],
+    page_size: int,
+    repeat: int,
+) -> typing.Dict[str, typing.Any]:
+    """Run one path repeatedly, measuring throughput and allocations separately.
+
+    Args:
+        name (str): Path label.
+        read (Callable): Coroutine function reading one page.
+        page_size (int): Number of fighters per page.
+        repeat (int): Number of timed iterations.
+
+    Returns:
+        Dict[str, Any]: Rows/sec and peak Python allocations for one page.
+    """
+    # warm up the connection pool and statement caches, and count rows per page
+    rows_per_page = len(json.loads(await read(page_size)))
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await read(page_size)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    await read(page_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "path": name,
+        "rows_per_sec": round(rows_per_page * repeat / elapsed, 1),
+        "peak_alloc_kb": round(peak / 1024, 1),
+    }
+
+
+async def main(page_size: int, repeat: int) -> None:
+    """Benchmark both paths and print a comparison table.
+
+    Args:
+        page_size (int): Number of fighters per page.
+        repeat (int): Number of timed iterations per path.
+    """
+    results = [
+        await run_path("orm", orm_page, page_size, repeat),
+        await run_path("json", json_page, page_size, repeat),
+    ]
+    await engine.dispose()
+
+    header = f"{'path':<6}{'rows/sec':>14}{'peak alloc KB':>16}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['path']:<6}{r['rows_per_sec']:>14}{r['peak_alloc_kb']:>16}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.page_size, args.repeat))
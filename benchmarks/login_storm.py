@@ -0,0 +1,206 @@
+"""Measure read latency while a storm of logins is being verified.
+
+A minimal app serves a login route and a cheap read route. The login route
+verifies a bcrypt password either on the event loop, as `AuthService` used to,
+or through `PasswordHasher`. Concurrent clients log in continuously while
+readers poll the read route, and the read latency percentiles show how much
+the logins stall the worker. No database is required.
+
+Usage:
+    PYTHONPATH=. python benchmarks/login_storm.py --logins 32 --seconds 5
+"""
+
+import argparse
+import asyncio
+import time
+import typing
+
+import httpx
+import numpy as np
+from fastapi import FastAPI
+from passlib.context import CryptContext
+
+from app.services.password_hasher import PasswordHasher
+from app.tools.exception_handlers import register_exception_handlers
+
+MODES = ("idle", "inline", "pooled")
+PASSWORD = "benchmark-password"
+
+
+def build_app(
+    mode: str, context: CryptContext, hashed: str, hasher: PasswordHasher
+) -> FastAPI:
+    """Build an app whose login route verifies passwords the given way.
+
+    Args:
+        mode (str): "inline" to verify on the event loop, otherwise through `hasher`.
+        context (CryptContext): Passlib context used by the inline path.
+        hashed (str): Hash every login is checked against.
+        hasher (PasswordHasher): Hasher used by the pooled path.
+
+    Returns:
+        FastAPI: ASGI application under test.
+    """
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.post("/login")
+    async def login() -> typing.Dict[str, bool]:
+        if mode == "inline":
+            return {"ok": context.verify(PASSWORD, hashed)}
+        return {"ok": await hasher.verify(PASSWORD, hashed)}
+
+    @app.get("/read")
+    async def read() -> typing.Dict[str, int]:
+        return {"fighter_id": 1, "wins": 20, "loss": 5}
+
+    return app
+
+
+async def measure(
+    mode: str,
+    logins: int,
+    readers: int,
+    seconds: float,
+    read_interval_ms: float,
+    context: CryptContext,
+    hashed: str,
+    hasher: PasswordHasher,
+) -> typing.Dict[str, typing.Any]:
+    """Run the login storm and the readers together and collect latencies.
+
+    Args:
+        mode (str): "idle" (no logins), "inline" or "pooled".
+        logins (int): Concurrent clients logging in.
+        readers (int): Concurrent clients polling the read route.
+        seconds (float): Length of the run.
+        read_interval_ms (float): Pause between two reads of one reader.
+        context (CryptContext): Passlib context used by the inline path.
+        hashed (str): Hash every login is checked against.
+        hasher (PasswordHasher): Hasher used by the pooled path.
+
+    Returns:
+        Dict[str, Any]: Read latency percentiles, logins completed and rejected.
+    """
+    app = build_app(mode, context, hashed, hasher)
+    transport = httpx.ASGITransport(app=app)
+    latencies: typing.List[float] = []
+    counts = {"logins": 0, "rejected": 0}
+    deadline = time.perf_counter() + seconds
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def log_in() -> None:
+            while time.perf_counter() < deadline:
+                response = await client.post("/login")
+                if response.status_code == 503:
+                    counts["rejected"] += 1
+                    await asyncio.sleep(float(response.headers["Retry-After"]))
+                else:
+                    counts["logins"] += 1
+
+        async def read() -> None:
+            # reads follow a fixed schedule and are timed from when they were
+            # due, so reads held up by a blocked event loop count as slow
+            # instead of not being sent
+            due = time.perf_counter()
+            while due < deadline:
+                await asyncio.sleep(max(0.0, due - time.perf_counter()))
+                await client.get("/read")
+                latencies.append((time.perf_counter() - due) * 1000)
+                due += read_interval_ms / 1000
+
+        storm = logins if mode != "idle" else 0
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(read() for _ in range(readers)), *(log_in() for _ in range(storm))
+        )
+        elapsed = time.perf_counter() - start
+
+    p50, p99 = np.percentile(latencies, [50, 99])
+    return {
+        "mode": mode,
+        "reads": len(latencies),
+        "p50_ms": round(float(p50), 2),
+        "p99_ms": round(float(p99), 2),
+        "max_ms": round(max(latencies), 2),
+        "logins_per_sec": round(counts["logins"] / elapsed, 1),
+        "rejected": counts["rejected"],
+    }
+
+
+async def main(
+    logins: int,
+    readers: int,
+    seconds: float,
+    read_interval_ms: float,
+    rounds: int,
+    workers: int,
+    max_queue: int,
+) -> None:
+    """Benchmark every mode and print a comparison table.
+
+    Args:
+        logins (int): Concurrent clients logging in.
+        readers (int): Concurrent clients polling the read route.
+        seconds (float): Length of each run.
+        read_interval_ms (float): Pause between two reads of one reader.
+        rounds (int): bcrypt cost factor.
+        workers (int): Hashing threads of the pooled path.
+        max_queue (int): Logins allowed to wait for a hashing thread.
+    """
+    context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+    hashed = context.hash(PASSWORD)
+    results = []
+    for mode in MODES:
+        hasher = PasswordHasher(workers, max_queue, context)
+        results.append(
+            await measure(
+                mode,
+                logins,
+                readers,
+                seconds,
+                read_interval_ms,
+                context,
+                hashed,
+                hasher,
+            )
+        )
+        hasher.shutdown()
+
+    header = (
+        f"{'mode':<8}{'reads':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+        f"{'logins/s':>10}{'rejected':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['mode']:<8}{r['reads']:>8}{r['p50_ms']:>10}{r['p99_ms']:>10}"
+            f"{r['max_ms']:>10}{r['logins_per_sec']:>10}{r['rejected']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--read-interval-ms", type=float, default=5.0)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-queue", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            args.logins,
+            args.readers,
+            args.seconds,
+            args.read_interval_ms,
+            args.rounds,
+            args.workers,
+            args.max_queue,
+        )
+    )
@@ -0,0 +1,239 @@
+"""Compare buffered and streamed rendering of the fighter list page.
+
+Each (mode, size) case runs in a fresh subprocess so peak RSS is not polluted
+by earlier cases. Fighters are synthetic, so no database is required.
+
+Usage:
+    PYTHONPATH=. python benchmarks/stream_templates.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+import typing
+from datetime import date
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
+
+from app.schemas import ExtendedFighter
+from app.templates import stream_template_response, templates
+
+MODES = ("buffered", "streamed")
+
+
+def make_fighter(fighter_id: int) -> ExtendedFighter:
+    """Build a synthetic extended fighter with every section populated.
+
+    Args:
+        fighter_id (int): ID assigned to the fighter.
+
+    Returns:
+        ExtendedFighter: Validated fighter schema instance.
+    """
+    today = date.today()
+    return ExtendedFighter(
+        fighter_id=fighter_id,
+        name=f"Name{fighter_id}",
+        nickname=f"Nick{fighter_id}",
+        surname=f"Surname{fighter_id}",
+        country="Poland",
+        weight_class="Light Heavyweight",
+        wins=20,
+        loss=5,
+        draw=0,
+        current_streak=3,
+        last_fight_date=today,
+        last_updated=today,
+        base_stats={
+            "fighter_id": fighter_id,
+            "weight": 93.0,
+            "height": 193.0,
+            "reach": 208.0,
+            "age": 33,
+            "last_updated": today,
+        },
+        extended_stats={
+            "fighter_id": fighter_id,
+            "stance": "Orthodox",
+            "slpm": 4.1,
+            "str_acc": 48.0,
+            "sapm": 3.2,
+            "str_def": 55.0,
+            "td_avg": 1.2,
+            "td_acc": 40.0,
+            "td_def": 70.0,
+            "sub_avg": 0.5,
+            "last_updated": today,
+        },
+        fights_results={
+            "fighter_id": fighter_id,
+            "win_by_ko_tko": 10,
+            "loss_by_ko_tko": 1,
+            "win_by_sub": 5,
+            "loss_by_sub": 2,
+            "win_by_dec": 5,
+            "loss_by_dec": 2,
+            "non_contest": 0,
+            "last_updated": today,
+        },
+    )
+
+
+async def iter_fighters(size: int) -> typing.AsyncIterator[ExtendedFighter]:
+    """Yield synthetic fighters lazily, mimicking `FighterUtils.iter_records`.
+
+    Args:
+        size (int): Number of fighters to yield.
+
+    Yields:
+        ExtendedFighter: Next synthetic fighter.
+    """
+    for fighter_id in range(1, size + 1):
+        if fighter_id % 500 == 0:
+            await asyncio.sleep(0)
+        yield make_fighter(fighter_id)
+
+
+def build_app(size: int) -> Starlette:
+    """Build a minimal app exposing both rendering paths.
+
+    Args:
+        size (int): Number of fighters rendered per request.
+
+    Returns:
+        Starlette: ASGI application under test.
+    """
+
+    async def buffered(request: Request):
+        fighters = [make_fighter(fighter_id) for fighter_id in range(1, size + 1)]
+        return templates.TemplateResponse(
+            "fighter_list.html", {"request": request, "fighters": fighters}
+        )
+
+    async def streamed(request: Request):
+        return stream_template_response(
+            "fighter_list_stream.html",
+            {"request": request, "fighters": iter_fighters(size)},
+        )
+
+    return Starlette(
+        routes=[
+            Route("/buffered", buffered),
+            Route("/streamed", streamed),
+            Mount("/static", StaticFiles(directory="app/static"), name="static"),
+        ]
+    )
+
+
+async def measure(mode: str, size: int) -> typing.Dict[str, typing.Any]:
+    """Issue one ASGI request and time the first and last body chunks.
+
+    Args:
+        mode (str): Either "buffered" or "streamed".
+        size (int): Number of fighters rendered.
+
+    Returns:
+        Dict[str, Any]: Timings, response size and peak RSS of this process.
+    """
+    app = build_app(size)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": f"/{mode}",
+        "raw_path": f"/{mode}".encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"benchmark")],
+        "server": ("benchmark", 80),
+        "client": ("127.0.0.1", 0),
+    }
+    stats = {"ttfb": None, "bytes": 0}
+    request_sent = False
+    finished = asyncio.Event()
+
+    async def receive() -> typing.Dict[str, typing.Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: typing.Dict[str, typing.Any]) -> None:
+        if message["type"] == "http.response.body" and message.get("body"):
+            if stats["ttfb"] is None:
+                stats["ttfb"] = time.perf_counter() - start
+            stats["bytes"] += len(message["body"])
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    total = time.perf_counter() - start
+    finished.set()
+
+    return {
+        "mode": mode,
+        "size": size,
+        "ttfb_ms": round(stats["ttfb"] * 1000, 2),
+        "total_ms": round(total * 1000, 2),
+        "body_mb": round(stats["bytes"] / 1024 / 1024, 2),
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+    }
+
+
+def run_case(mode: str, size: int) -> typing.Dict[str, typing.Any]:
+    """Run a single case in a child interpreter and parse its JSON result.
+
+    Args:
+        mode (str): Either "buffered" or "streamed".
+        size (int): Number of fighters rendered.
+
+    Returns:
+        Dict[str, Any]: Measurement reported by the child process.
+    """
+    output = subprocess.run(
+        [sys.executable, __file__, "--case", mode, str(size)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Parse arguments and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--case", nargs=2, metavar=("MODE", "SIZE"))
+    args = parser.parse_args()
+
+    if args.case:
+        mode, size = args.case
+        print(json.dumps(asyncio.run(measure(mode, int(size)))))
+        return
+
+    header = f"{'mode':<10}{'size':>8}{'ttfb ms':>12}{'total ms':>12}{'body MB':>10}{'peak RSS MB':>14}"
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        for mode in MODES:
+            r = run_case(mode, size)
+            print(
+                f"{r['mode']:<10}{r['size']:>8}{r['ttfb_ms']:>12}"
+                f"{r['total_ms']:>12}{r['body_mb']:>10}{r['peak_rss_mb']:>14}"
+            )
+
+
+if __name__ == "__main__":
+    main()
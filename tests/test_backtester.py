@@ -0,0 +1,54 @@
+import numpy as np
+
+from app.services.predictions.backtester import BacktestData, Backtester
+from app.services.predictions.logistic_model import LogisticModel
+
+FEATURES = ("win_by_ko_tko", "loss_by_ko_tko", "win_percentage", "weight")
+
+
+def bout_history(seed: int = 0, fighters: int = 200, bouts: int = 3000) -> BacktestData:
+    """Bouts from 2000 to 2005 between fighters of random skill."""
+    rng = np.random.default_rng(seed)
+    skill = rng.normal(size=fighters)
+    first_day = np.datetime64("2000-01-01").astype(np.int64)
+    day = np.sort(rng.integers(first_day, first_day + 6 * 365, bouts))
+    first = rng.integers(0, fighters, bouts)
+    second = (first + rng.integers(1, fighters, bouts)) % fighters
+    won = rng.random(bouts) < 1 / (1 + np.exp(skill[second] - skill[first]))
+    return BacktestData(
+        day,
+        first,
+        second,
+        np.where(won, 0, 1),
+        rng.integers(0, 4, bouts),
+        np.c_[
+            rng.normal(170, 10, fighters) + 5 * skill, np.full((fighters, 3), np.nan)
+        ],
+        np.full(fighters, day[-1]),
+        np.arange(fighters),
+    )
+
+
+def backtest(data: BacktestData, workers: int = 1) -> dict:
+    model = LogisticModel(FEATURES, np.zeros(4), np.ones(4), np.zeros(4), "test")
+    with Backtester(data, workers) as backtester:
+        return backtester.run(model, epochs=200, min_training_bouts=100)
+
+
+def test_later_results_do_not_change_earlier_predictions():
+    data = bout_history()
+    years = data.day.astype("datetime64[D]").astype("datetime64[Y]")
+    later = years >= np.datetime64("2003", "Y")
+    changed = data._replace(outcome=np.where(later, 1 - data.outcome, data.outcome))
+
+    report, changed_report = backtest(data), backtest(changed)
+
+    for year in ("2001", "2002"):
+        assert report["by_year"][year] == changed_report["by_year"][year]
+    assert report["by_year"]["2004"] != changed_report["by_year"]["2004"]
+
+
+def test_results_do_not_depend_on_the_worker_count():
+    data = bout_history()
+
+    assert backtest(data, workers=1)["overall"] == backtest(data, workers=3)["overall"]
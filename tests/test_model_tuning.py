@@ -0,0 +1,54 @@
+import numpy as np
+
+from app.services.predictions.model_training import TRAINING_FEATURES, TrainingSet
+from app.services.predictions.model_tuning import (
+    Candidate,
+    CandidateResult,
+    ModelTuner,
+)
+from app.services.predictions.tuning_trials import CandidateState
+
+
+def training_data(fighters: int = 300) -> TrainingSet:
+    """Fighters whose win rate depends on their first feature."""
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(fighters, len(TRAINING_FEATURES)))
+    fights = rng.integers(1, 20, fighters).astype(float)
+    wins = rng.binomial(fights.astype(int), 1 / (1 + np.exp(-features[:, 0])))
+    return TrainingSet(features, wins.astype(float), fights)
+
+
+def candidate_result(tuner: ModelTuner, feature_set: str, loss: float):
+    weights = np.zeros(len(tuner._columns(feature_set)))
+    state = CandidateState(
+        weights, 0.0, 100, weights, 0.0, 100, loss, 0, "converged", 0.1
+    )
+    return CandidateResult(Candidate(0.5, 1e-3, feature_set), state, "converged")
+
+
+def test_best_candidate_is_the_first_on_the_leaderboard(monkeypatch):
+    with ModelTuner(training_data(), workers=1) as tuner:
+        tied = [
+            candidate_result(tuner, "all", 0.6),
+            candidate_result(tuner, "physical", 0.6),
+            candidate_result(tuner, "performance", 0.7),
+        ]
+        monkeypatch.setattr(tuner, "search", lambda *args: tied)
+
+        report, best = tuner.run("random")
+
+    first = report["leaderboard"][0]
+    assert best is tied[first["candidate_index"]]
+    assert best.candidate.feature_set == first["feature_set"]
+    assert first["selection_log_loss"] == 0.6
+
+
+def test_search_reports_held_out_test_loss():
+    with ModelTuner(training_data(), workers=2) as tuner:
+        report, best = tuner.run("random", candidates=3, epochs=200)
+
+    assert len(tuner.test) and not set(tuner.test) & set(tuner.validation)
+    assert not set(tuner.test) & set(tuner.train)
+    for entry in report["leaderboard"]:
+        assert entry["test_log_loss"] is not None
+    assert best is not None
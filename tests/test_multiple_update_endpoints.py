@@ -0,0 +1,56 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.constants import PREFIX
+from app.db.database import get_db
+from app.routers.base_fighter_router import base_fighter_router
+from app.routers.extended_fighter_router import extended_fighter_router
+from app.services.fighters.fighter_updater import FighterUpdater
+from app.tools.exception_handlers import register_exception_handlers
+from app.tools.exceptions.custom_api_exceptions import BadRequestException
+
+ROUTES = ("base_fighter", "extended_fighter")
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """App with the fighter routers and a database session that is never used."""
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.include_router(base_fighter_router, prefix=PREFIX)
+    app.include_router(extended_fighter_router, prefix=PREFIX)
+
+    async def no_db():
+        yield None
+
+    app.dependency_overrides[get_db] = no_db
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("route", ROUTES)
+def test_rejected_batch_update_returns_400(client, monkeypatch, route):
+    async def reject(self, updates):
+        raise BadRequestException("Update would duplicate an existing fighter")
+
+    monkeypatch.setattr(FighterUpdater, "update_multiple_fighters", reject)
+
+    response = client.put(f"{PREFIX}/{route}/multiple", json=[{"fighter_id": 1}])
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Update would duplicate an existing fighter"
+
+
+@pytest.mark.parametrize("route", ROUTES)
+def test_batch_update_returns_updated_ids(client, monkeypatch, route):
+    async def update(self, updates):
+        return [update.fighter_id for update in updates]
+
+    monkeypatch.setattr(FighterUpdater, "update_multiple_fighters", update)
+
+    response = client.put(
+        f"{PREFIX}/{route}/multiple", json=[{"fighter_id": 1}, {"fighter_id": 2}]
+    )
+
+    assert response.status_code == 202
+    assert response.json() == [1, 2]